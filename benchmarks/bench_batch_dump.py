@@ -0,0 +1,32 @@
+import json
+import timeit
+
+from jsonrpc_protocol import JsonBackend
+from jsonrpc_protocol.enum import ProtocolVersion
+from jsonrpc_protocol.protocol import Batch
+from jsonrpc_protocol.protocol import Response
+
+
+def _legacy_dump(batch: Batch) -> str:
+    # Former Batch.dump: one string per element, then encoded again as a
+    # list of escaped strings.
+    return json.dumps([entity.dump("json") for entity in batch.elements])
+
+
+def main():
+    batch = Batch()
+    batch.elements = [Response(ProtocolVersion.v2, {"value": index, "tags": ["a", "b"]}, index)
+                      for index in range(10000)]
+    number = 20
+
+    legacy = min(timeit.repeat(lambda: _legacy_dump(batch), number=number, repeat=5)) / number
+    print(f"{'legacy (json)':>18}: {legacy * 1e3:7.2f} ms per 10k-element batch")
+
+    for name in JsonBackend.available(binary=False):
+        elapsed = min(timeit.repeat(lambda: batch.dump(name), number=number, repeat=5)) / number
+        print(f"{'one pass (' + name + ')':>18}: {elapsed * 1e3:7.2f} ms per 10k-element batch  "
+              f"speedup {legacy / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import json
+import timeit
+
+from jsonrpc_protocol import Serializer
+from jsonrpc_protocol.protocol import Batch
+
+
+def _legacy_parse_batch(payload: str) -> Batch:
+    # Element-wise re-serialization as done before parse_object existed.
+    batch = Batch()
+
+    for element in json.loads(payload):
+        batch.elements.append(Serializer.parse(json.dumps(element)))
+
+    return batch
+
+
+def _make_batch(size: int) -> str:
+    return json.dumps([
+        {"jsonrpc": "2.0", "method": "subtract", "params": [i, 23], "id": i}
+        for i in range(size)
+    ])
+
+
+def main():
+    for size in (10, 100, 1000):
+        payload = _make_batch(size)
+        number = max(1, 10000 // size)
+
+        legacy = min(timeit.repeat(lambda: _legacy_parse_batch(payload), number=number, repeat=5)) / number
+        current = min(timeit.repeat(lambda: Serializer.parse(payload), number=number, repeat=5)) / number
+
+        print(f"batch size {size:>5}: legacy {size / legacy:>12,.0f} msg/s  "
+              f"parse_object {size / current:>12,.0f} msg/s  speedup {legacy / current:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import timeit
+
+from jsonrpc_protocol.classifier import Classifier
+from jsonrpc_protocol.enum import ProtocolVersion
+from jsonrpc_protocol.validator import Validator
+
+MESSAGES = {
+    "request": {"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1},
+    "response": {"jsonrpc": "2.0", "result": 19, "id": 1},
+    "notification": {"jsonrpc": "2.0", "method": "update", "params": [1, 2, 3]},
+    "error": {"jsonrpc": "2.0", "error": {"code": -32601, "message": "Method not found"}, "id": 1},
+    "invalid": {"jsonrpc": "2.0", "foo": "boo"},
+}
+
+
+def _validator_chain(data: dict, protocol: ProtocolVersion) -> str:
+    # The chain Serializer walked before the classifier existed.
+    if Validator.validate_jsonrpc_from_json(data, protocol) \
+            and Validator.validate_method_from_json(data) \
+            and Validator.validate_params_from_json(data) \
+            and Validator.validate_id_from_json(data):
+        return "request"
+
+    if Validator.validate_jsonrpc_from_json(data, protocol) \
+            and Validator.validate_result_from_json(data) \
+            and Validator.validate_id_from_json(data):
+        return "response"
+
+    if (Validator.validate_jsonrpc_from_json(data, protocol)
+            and Validator.validate_method_from_json(data)) \
+            or (Validator.validate_jsonrpc_from_json(data, protocol)
+                and Validator.validate_method_from_json(data)
+                and Validator.validate_params_from_json(data)):
+        return "notification"
+
+    if Validator.validate_jsonrpc_from_json(data, protocol) \
+            and Validator.validate_error_from_json(data) \
+            and Validator.validate_id_from_json(data) \
+            and protocol == ProtocolVersion.v2:
+        return "error"
+
+    return "invalid"
+
+
+def main():
+    number = 200000
+    protocol = ProtocolVersion.v2
+
+    for name, message in MESSAGES.items():
+        chain = min(timeit.repeat(lambda: _validator_chain(message, protocol), number=number, repeat=5))
+        table = min(timeit.repeat(lambda: Classifier.classify(message, protocol), number=number, repeat=5))
+
+        print(f"{name:>12}: validator chain {chain / number * 1e9:>7.0f} ns  "
+              f"classifier {table / number * 1e9:>7.0f} ns  speedup {chain / table:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
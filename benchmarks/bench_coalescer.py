@@ -0,0 +1,77 @@
+import queue
+import threading
+import time
+
+from jsonrpc_protocol import BatchCoalescer
+from jsonrpc_protocol import Dispatcher
+from jsonrpc_protocol import Serializer
+from jsonrpc_protocol.protocol import Params
+
+ROUND_TRIP = 0.0005
+
+
+class LoopbackServer:
+    # Stand-in for a remote peer: every message costs one simulated round
+    # trip and is answered from a single thread, like one connection.
+
+    def __init__(self):
+        self.dispatcher = Dispatcher()
+        self.dispatcher.register(lambda value: value, name="echo")
+        self.inbox = queue.Queue()
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def connect(self, coalescer: BatchCoalescer):
+        def send(entity):
+            self.inbox.put((coalescer, entity.dump_bytes()))
+
+        coalescer.send = send
+
+    def stop(self):
+        self.inbox.put(None)
+        self.thread.join()
+
+    def _serve(self):
+        while True:
+            item = self.inbox.get()
+
+            if item is None:
+                return
+
+            coalescer, payload = item
+            time.sleep(ROUND_TRIP)
+            response = self.dispatcher.dispatch(Serializer.parse(payload))
+
+            if response is not None:
+                coalescer.receive(Serializer.parse(response.dump_bytes()))
+
+
+def _run(server: LoopbackServer, calls: int, max_size: int, max_latency: float) -> float:
+    coalescer = BatchCoalescer(None, max_size=max_size, max_latency=max_latency)
+    server.connect(coalescer)
+
+    started = time.perf_counter()
+    futures = [coalescer.call("echo", Params([index])) for index in range(calls)]
+    coalescer.flush()
+
+    for future in futures:
+        future.result(60)
+
+    return calls / (time.perf_counter() - started)
+
+
+def main():
+    server = LoopbackServer()
+
+    try:
+        for max_latency in (0.001, 0.005):
+            for max_size in (1, 10, 100, 1000):
+                throughput = _run(server, 5000, max_size, max_latency)
+                print(f"latency budget {max_latency * 1e3:4.1f} ms  batch size {max_size:>5}: "
+                      f"{throughput:>10,.0f} calls/s")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import random
+import timeit
+
+from jsonrpc_protocol import Serializer
+from jsonrpc_protocol.backend import JsonBackend
+from jsonrpc_protocol.enum import ProtocolVersion
+from jsonrpc_protocol.protocol.response import Response
+
+CODECS = ("json", "orjson", "ujson", "msgpack", "cbor")
+
+
+def _payloads(seed: int = 0) -> dict:
+    rnd = random.Random(seed)
+    return {
+        "floats x10k": [rnd.uniform(-1e6, 1e6) for _ in range(10000)],
+        "ints x10k": [rnd.randint(-2 ** 31, 2 ** 31) for _ in range(10000)],
+        "matrix 100x100": [[rnd.random() for _ in range(100)] for _ in range(100)],
+        "series": {"timestamps": list(range(1700000000, 1700005000)),
+                   "values": [round(rnd.gauss(0, 1), 4) for _ in range(5000)]},
+    }
+
+
+def main():
+    number = 50
+    codecs = [name for name in CODECS if JsonBackend.is_available(name)]
+    print("skipped: " + ", ".join(name for name in CODECS if name not in codecs))
+
+    for name, result in _payloads().items():
+        response = Response(ProtocolVersion.v2, result, 1)
+        print(name)
+
+        for codec in codecs:
+            serializer = Serializer(codec)
+            payload = serializer.dump_bytes(response)
+            encode = min(timeit.repeat(lambda: serializer.dump_bytes(response), number=number, repeat=5)) / number
+            decode = min(timeit.repeat(lambda: serializer.parse(payload), number=number, repeat=5)) / number
+
+            print(f"  {codec:>8}: {len(payload):>9,} bytes  encode {encode * 1e6:>8.0f} us  "
+                  f"decode {decode * 1e6:>8.0f} us")
+
+
+if __name__ == "__main__":
+    main()
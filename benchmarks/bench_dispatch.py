@@ -0,0 +1,30 @@
+import timeit
+
+from jsonrpc_protocol import Dispatcher
+from jsonrpc_protocol import Serializer
+
+
+def subtract(minuend, subtrahend):
+    return minuend - subtrahend
+
+
+def main():
+    number = 200000
+    dispatcher = Dispatcher()
+    dispatcher.register(subtract)
+
+    positional = Serializer.parse('{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}')
+    named = Serializer.parse(
+        '{"jsonrpc": "2.0", "method": "subtract", "params": {"subtrahend": 23, "minuend": 42}, "id": 1}')
+
+    plain = min(timeit.repeat(lambda: subtract(42, 23), number=number, repeat=5))
+    print(f"{'plain call':>20}: {number / plain:>12,.0f} calls/s")
+
+    for name, entity in (("positional params", positional), ("named params", named)):
+        elapsed = min(timeit.repeat(lambda: dispatcher.dispatch(entity), number=number, repeat=5))
+        print(f"{name:>20}: {number / elapsed:>12,.0f} calls/s  "
+              f"overhead {(elapsed - plain) / number * 1e9:>6.0f} ns per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import timeit
+
+from jsonrpc_protocol import JsonBackend
+from jsonrpc_protocol import Serializer
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.enum import ProtocolVersion
+from jsonrpc_protocol.protocol import Error
+
+# Typical misbehaving client traffic: broken JSON and invalid requests.
+STORM = [
+    '{"jsonrpc": "2.0", "method": "foobar, "params": "bar", "baz]',
+    '{"jsonrpc": "2.0", "method": 1, "params": "bar"}',
+    '{"jsonrpc": "2.0", "method": "subtract", "params": "hello", "id": 1}',
+    '[1, 2, 3]',
+    '',
+]
+
+
+def main():
+    number = 100000
+
+    for name in JsonBackend.available(binary=False):
+        backend = JsonBackend.get(name)
+        serializer = Serializer(backend=name)
+
+        for code, id in ((ErrorCode.ParseError, None), (ErrorCode.InvalidRequest, 17), (-32042, "abc"), (42, 7)):
+            entity = Error(ProtocolVersion.v2, code, id)
+            generic = min(timeit.repeat(lambda: backend.dumps_bytes(entity.to_object()), number=number, repeat=5))
+            template = min(timeit.repeat(lambda: entity.dump_bytes(backend), number=number, repeat=5))
+            print(f"{name:>7} dump {int(code):>6}: generic {generic / number * 1e9:>6.0f} ns  "
+                  f"template {template / number * 1e9:>6.0f} ns  speedup {generic / template:.2f}x")
+
+        def storm():
+            for payload in STORM:
+                serializer.dump_bytes(serializer.parse(payload))
+
+        elapsed = min(timeit.repeat(storm, number=number // 10, repeat=5))
+        print(f"{name:>7} error storm: {number // 10 * len(STORM) / elapsed:>12,.0f} messages/s parsed and answered")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import timeit
+
+from jsonrpc_protocol import Dispatcher
+from jsonrpc_protocol import Instrumentation
+from jsonrpc_protocol import Serializer
+
+PAYLOAD = '{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}'
+
+
+def subtract(minuend, subtrahend):
+    return minuend - subtrahend
+
+
+def _round_trip(serializer: Serializer, dispatcher: Dispatcher):
+    return lambda: serializer.dump_bytes(dispatcher.dispatch(serializer.parse(PAYLOAD)))
+
+
+def main():
+    number = 100000
+    results = {}
+
+    for name, instrumentation in (("disabled", None), ("enabled", Instrumentation())):
+        serializer = Serializer(instrumentation=instrumentation)
+        dispatcher = Dispatcher(instrumentation=instrumentation)
+        dispatcher.register(subtract)
+
+        elapsed = min(timeit.repeat(_round_trip(serializer, dispatcher), number=number, repeat=5))
+        results[name] = elapsed / number
+        print(f"{name:>9}: {results[name] * 1e9:>7.0f} ns per parse, dispatch and dump")
+
+    print(f"{'overhead':>9}: {(results['enabled'] - results['disabled']) * 1e9:>7.0f} ns when enabled")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import timeit
+import tracemalloc
+
+from jsonrpc_protocol import Limits
+from jsonrpc_protocol import Serializer
+
+REQUEST = b'{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}'
+
+LIMITS = Limits(max_bytes=1 << 24, max_batch_length=1000, max_depth=32, max_string_length=1 << 16)
+
+ADVERSARIAL = {
+    "batch x200k": b"[" + b", ".join([REQUEST] * 200000) + b"]",
+    "nested 1M": b"[" * 1000000 + b"]" * 1000000,
+    "string 8MB": b'{"jsonrpc": "2.0", "method": "' + b"a" * 8000000 + b'", "params": [], "id": 1}',
+}
+
+NORMAL = {
+    "request": REQUEST,
+    "batch x100": b"[" + b", ".join([REQUEST] * 100) + b"]",
+}
+
+
+def _peak(serializer: Serializer, payload: bytes) -> int:
+    tracemalloc.start()
+
+    try:
+        serializer.parse(payload)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    for backend in ("json", "orjson"):
+        plain = Serializer(backend)
+        limited = Serializer(backend, limits=LIMITS)
+
+        for name, payload in ADVERSARIAL.items():
+            with_limits = min(timeit.repeat(lambda: limited.parse(payload), number=1, repeat=3))
+            limited_text = f"limits {with_limits * 1e3:7.1f} ms {_peak(limited, payload) / 1e6:6.1f} MB peak"
+
+            without = min(timeit.repeat(lambda: plain.parse(payload), number=1, repeat=3))
+            print(f"{backend:>7} {name:>12}: {len(payload) / 1e6:5.1f} MB  "
+                  f"no limits {without * 1e3:8.1f} ms {_peak(plain, payload) / 1e6:7.1f} MB peak  {limited_text}")
+
+        for name, payload in NORMAL.items():
+            number = 20000 if name == "request" else 500
+            without = min(timeit.repeat(lambda: plain.parse(payload), number=number, repeat=5)) / number
+            with_limits = min(timeit.repeat(lambda: limited.parse(payload), number=number, repeat=5)) / number
+            print(f"{backend:>7} {name:>12}: no limits {without * 1e6:8.2f} us  limits {with_limits * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
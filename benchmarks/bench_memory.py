@@ -0,0 +1,36 @@
+import json
+import tracemalloc
+
+from jsonrpc_protocol import Serializer
+
+MESSAGES = {
+    "request": {"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1},
+    "response": {"jsonrpc": "2.0", "result": 19, "id": 1},
+    "notification": {"jsonrpc": "2.0", "method": "update", "params": [1, 2, 3]},
+    "error": {"jsonrpc": "2.0", "error": {"code": -32601, "message": "Method not found"}, "id": 1},
+}
+
+
+def _bytes_per_entity(message: dict, count: int) -> float:
+    # Decode up front so only the entity objects are measured.
+    decoded = [json.loads(json.dumps(message)) for _ in range(count)]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [Serializer.parse_object(data) for data in decoded]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del entities
+    return (after - before) / count
+
+
+def main():
+    count = 10000
+
+    for name, message in MESSAGES.items():
+        print(f"{name:>12}: {_bytes_per_entity(message, count):>7.1f} bytes per parsed message")
+
+
+if __name__ == "__main__":
+    main()
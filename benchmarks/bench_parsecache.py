@@ -0,0 +1,46 @@
+import random
+import timeit
+
+from jsonrpc_protocol import ParseCache
+from jsonrpc_protocol import Serializer
+
+
+def _traffic(count: int, seed: int = 1) -> list:
+    # Mostly heartbeats and polling with a fresh id, plus some unique calls.
+    rnd = random.Random(seed)
+    payloads = []
+
+    for index in range(count):
+        roll = rnd.random()
+
+        if roll < 0.5:
+            payloads.append(b'{"jsonrpc": "2.0", "method": "heartbeat", "params": {"node": "worker-1"}}')
+        elif roll < 0.9:
+            payloads.append(b'{"jsonrpc": "2.0", "method": "jobs.poll", "params": {"queue": "default", '
+                            b'"limit": 10}, "id": %d}' % index)
+        else:
+            payloads.append(b'{"jsonrpc": "2.0", "method": "jobs.push", "params": [%d, "%f"], "id": %d}'
+                            % (index, rnd.random(), index))
+
+    return payloads
+
+
+def main():
+    payloads = _traffic(10000)
+    number = 5
+
+    def run(parse):
+        return lambda: [parse(payload) for payload in payloads]
+
+    baseline = min(timeit.repeat(run(Serializer().parse), number=number, repeat=5)) / number
+    print(f"{'no cache':>18}: {len(payloads) / baseline:>12,.0f} msg/s")
+
+    for name, templates in (("exact cache", False), ("template cache", True)):
+        cache = ParseCache(max_size=256, templates=templates)
+        elapsed = min(timeit.repeat(run(cache.parse), number=number, repeat=5)) / number
+        print(f"{name:>18}: {len(payloads) / elapsed:>12,.0f} msg/s  speedup {baseline / elapsed:.2f}x  "
+              f"{cache.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import concurrent.futures
+import json
+import os
+import time
+
+from jsonrpc_protocol import Dispatcher
+from jsonrpc_protocol import PoolDispatcher
+from jsonrpc_protocol import Serializer
+
+
+def collatz(limit):
+    # CPU bound, holds the GIL for the whole call.
+    longest = 0
+
+    for start in range(1, limit):
+        steps = 0
+        value = start
+
+        while value != 1:
+            value = value // 2 if value % 2 == 0 else 3 * value + 1
+            steps += 1
+
+        longest = max(longest, steps)
+
+    return longest
+
+
+def _batch(size: int, limit: int) -> str:
+    return json.dumps([
+        {"jsonrpc": "2.0", "method": "collatz", "params": [limit], "id": index}
+        for index in range(size)
+    ])
+
+
+def _measure(dispatcher: Dispatcher, payload: str) -> float:
+    started = time.perf_counter()
+    dispatcher.dispatch(Serializer.parse(payload))
+    return time.perf_counter() - started
+
+
+def main():
+    payload = _batch(64, 5000)
+    cores = os.cpu_count() or 1
+
+    sequential = Dispatcher()
+    sequential.register(collatz)
+    baseline = _measure(sequential, payload)
+    print(f"{'sequential':>18}: {baseline:6.2f} s")
+
+    for name, pool in (("thread pool", concurrent.futures.ThreadPoolExecutor),
+                       ("process pool", concurrent.futures.ProcessPoolExecutor)):
+        workers = 1
+
+        while workers <= cores:
+            with pool(max_workers=workers) as executor:
+                dispatcher = PoolDispatcher(executor, chunk_size=4)
+                dispatcher.register(collatz)
+                elapsed = _measure(dispatcher, payload)
+
+            print(f"{name:>13} x{workers:<3}: {elapsed:6.2f} s  speedup {baseline / elapsed:.2f}x")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import argparse
+import os
+import tempfile
+import time
+
+from corpus import Corpus
+
+from jsonrpc_protocol import LogReplay
+from jsonrpc_protocol import Serializer
+from jsonrpc_protocol.backend import JsonBackend
+
+
+def _write(path: str, count: int):
+    corpus = Corpus(seed=0)
+
+    with open(path, "wb") as file:
+        for line in corpus.mixed(count):
+            file.write(line + b"\n")
+
+
+def _readlines(path: str, serializer: Serializer) -> float:
+    # Baseline, a plain buffered read with one bytes copy per line.
+    started = time.perf_counter()
+
+    with open(path, "rb") as file:
+        for line in file:
+            if line.strip():
+                serializer.parse(line)
+
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a JSONL traffic log through LogReplay.")
+    parser.add_argument("path", nargs="?", help="log to replay, a seeded corpus is generated when omitted")
+    parser.add_argument("--count", type=int, default=200000)
+    args = parser.parse_args()
+
+    path = args.path
+
+    if path is None:
+        handle, path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(handle)
+        _write(path, args.count)
+
+    try:
+        megabytes = os.path.getsize(path) / 1e6
+        cores = os.cpu_count() or 1
+        print(f"{megabytes:.1f} MB, {cores} cores")
+
+        for backend in JsonBackend.available(binary=False):
+            serializer = Serializer(backend)
+            elapsed = _readlines(path, serializer)
+            print(f"{backend:>7} {'readlines':<10}: {megabytes / elapsed:8.1f} MB/s")
+
+            processes = 1
+
+            while processes <= cores:
+                result = LogReplay(path, serializer).replay(processes)
+                print(f"{backend:>7} {'mmap x' + str(processes):<10}: {result.mb_per_second:8.1f} MB/s  {result.counts}")
+                processes *= 2
+    finally:
+        if args.path is None:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
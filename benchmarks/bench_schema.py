@@ -0,0 +1,86 @@
+import timeit
+
+from jsonrpc_protocol import SchemaRegistry
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 1, "maxLength": 64},
+        "age": {"type": "integer", "minimum": 0, "maximum": 150},
+        "scores": {"type": "array", "items": {"type": "number"}, "maxItems": 16},
+        "role": {"enum": ["admin", "user", "guest"]},
+    },
+    "required": ["name", "age"],
+    "additionalProperties": False,
+}
+
+PARAMS = {"name": "myself", "age": 42, "scores": [1.5, 2, 3.25, 4, 5], "role": "user"}
+
+_TYPES = {
+    "null": lambda value: value is None,
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "string": lambda value: isinstance(value, str),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+}
+
+
+def interpret(schema: dict, value: object) -> bool:
+    # Generic validator walking the schema dict on every call.
+    for keyword, argument in schema.items():
+        if keyword == "type":
+            if not _TYPES[argument](value):
+                return False
+        elif keyword == "enum":
+            if value not in argument:
+                return False
+        elif keyword == "properties" and isinstance(value, dict):
+            for name, subschema in argument.items():
+                if name in value and not interpret(subschema, value[name]):
+                    return False
+        elif keyword == "required" and isinstance(value, dict):
+            if any(name not in value for name in argument):
+                return False
+        elif keyword == "additionalProperties" and isinstance(value, dict) and argument is False:
+            if any(name not in schema.get("properties", {}) for name in value):
+                return False
+        elif keyword == "items" and isinstance(value, list):
+            if not all(interpret(argument, item) for item in value):
+                return False
+        elif keyword in ("minLength", "maxLength") and isinstance(value, str):
+            if (len(value) < argument) if keyword == "minLength" else (len(value) > argument):
+                return False
+        elif keyword == "maxItems" and isinstance(value, list):
+            if len(value) > argument:
+                return False
+        elif keyword in ("minimum", "maximum") and _TYPES["number"](value):
+            if (value < argument) if keyword == "minimum" else (value > argument):
+                return False
+
+    return True
+
+
+def main():
+    number = 100000
+    compiled = SchemaRegistry.compile(SCHEMA)
+    assert compiled(PARAMS) and interpret(SCHEMA, PARAMS)
+
+    candidates = [("interpreted", lambda: interpret(SCHEMA, PARAMS)), ("compiled", lambda: compiled(PARAMS))]
+
+    try:
+        import jsonschema
+    except ImportError:
+        pass
+    else:
+        validator = jsonschema.Draft7Validator(SCHEMA)
+        candidates.insert(1, ("jsonschema", lambda: validator.is_valid(PARAMS)))
+
+    for name, check in candidates:
+        elapsed = min(timeit.repeat(check, number=number, repeat=5))
+        print(f"{name:>12}: {elapsed / number * 1e9:>7.0f} ns per validation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import json
+
+import pyperf
+
+from corpus import Corpus
+from jsonrpc_protocol import JsonBackend
+from jsonrpc_protocol import Serializer
+
+SEED = 20231018
+
+
+def _parse_all(serializer: Serializer, payloads: list):
+    for payload in payloads:
+        serializer.parse(payload)
+
+
+def _dump_all(serializer: Serializer, entities: list):
+    for entity in entities:
+        serializer.dump_bytes(entity)
+
+
+def _cases(serializer: Serializer) -> list:
+    corpus = Corpus(SEED)
+    payloads = {
+        "request": [json.dumps(corpus.request()).encode("utf-8") for _ in range(100)],
+        "notification": [json.dumps(corpus.notification()).encode("utf-8") for _ in range(100)],
+        "response": [json.dumps(corpus.response()).encode("utf-8") for _ in range(100)],
+        "error": [json.dumps(corpus.error()).encode("utf-8") for _ in range(100)],
+        "batch-10": [json.dumps(corpus.batch(10)).encode("utf-8") for _ in range(10)],
+        "batch-10000": [json.dumps(corpus.batch(10000)).encode("utf-8")],
+        "malformed-storm": [corpus.malformed() for _ in range(100)],
+        "large-result": [json.dumps(corpus.response(100000)).encode("utf-8")],
+        "mixed": corpus.mixed(1000),
+    }
+
+    cases = []
+
+    for name, data in payloads.items():
+        cases.append(("parse/" + name, _parse_all, serializer, data))
+        cases.append(("dump/" + name, _dump_all, serializer, [serializer.parse(payload) for payload in data]))
+
+    return cases
+
+
+def _add_cmdline_args(cmd: list, args):
+    cmd.extend(("--backend", args.backend))
+
+
+def main():
+    runner = pyperf.Runner(add_cmdline_args=_add_cmdline_args)
+    runner.argparser.add_argument("--backend", default=JsonBackend.get_default().name,
+                                  choices=JsonBackend.available(binary=False))
+    args = runner.parse_args()
+
+    runner.metadata["jsonrpc_backend"] = args.backend
+    runner.metadata["corpus_seed"] = SEED
+    serializer = Serializer(backend=args.backend)
+
+    for name, function, serializer, data in _cases(serializer):
+        runner.bench_func(name, function, serializer, data)
+
+
+if __name__ == "__main__":
+    main()
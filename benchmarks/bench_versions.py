@@ -0,0 +1,47 @@
+import random
+import timeit
+
+from jsonrpc_protocol import Serializer
+
+V2 = (
+    b'{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}',
+    b'{"jsonrpc": "2.0", "method": "update", "params": [1, 2, 3, 4, 5]}',
+    b'{"jsonrpc": "2.0", "result": 19, "id": 1}',
+    b'{"jsonrpc": "2.0", "error": {"code": -32601, "message": "Method not found"}, "id": 1}',
+)
+
+V1 = (
+    b'{"method": "subtract", "params": [42, 23], "id": 1}',
+    b'{"method": "update", "params": [1, 2, 3, 4, 5], "id": null}',
+    b'{"result": 19, "error": null, "id": 1}',
+    b'{"result": null, "error": {"code": -32601, "message": "Method not found"}, "id": 1}',
+)
+
+
+def _traffic(count: int, v1_share: float, seed: int = 0) -> list:
+    rnd = random.Random(seed)
+    return [rnd.choice(V1 if rnd.random() < v1_share else V2) for _ in range(count)]
+
+
+def _round_trip(serializer: Serializer, payloads: list):
+    parse = serializer.parse
+    dump_bytes = serializer.dump_bytes
+
+    for payload in payloads:
+        dump_bytes(parse(payload))
+
+
+def main():
+    count = 20000
+
+    for backend in ("json", "orjson"):
+        serializer = Serializer(backend)
+
+        for name, share in (("2.0 only", 0.0), ("10% 1.0", 0.1), ("50% 1.0", 0.5), ("1.0 only", 1.0)):
+            payloads = _traffic(count, share)
+            elapsed = min(timeit.repeat(lambda: _round_trip(serializer, payloads), number=1, repeat=7))
+            print(f"{backend:>7} {name:>9}: {count / elapsed:>12,.0f} msg/s  {elapsed / count * 1e9:>6.0f} ns/msg")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import argparse
+import json
+import random
+import string
+import sys
+import typing
+
+METHODS = ("subtract", "sum", "get_data", "update", "foo.get", "notify_hello", "user.find", "metrics.push")
+
+# Share of each message kind in generated mixed traffic.
+MIX = (
+    ("request", 40),
+    ("notification", 20),
+    ("response", 20),
+    ("error", 5),
+    ("batch", 10),
+    ("malformed", 5),
+)
+
+
+class Corpus:
+
+    def __init__(self, seed: int = 0):
+        self.random = random.Random(seed)
+        self._ids = 0
+
+    def _id(self) -> typing.Union[int, str]:
+        self._ids += 1
+        return self._ids if self.random.random() < 0.7 else str(self._ids)
+
+    def _text(self, length: int) -> str:
+        return "".join(self.random.choice(string.ascii_letters) for _ in range(length))
+
+    def _params(self) -> typing.Union[list, dict]:
+        if self.random.random() < 0.5:
+            return [self.random.randint(-1000, 1000) for _ in range(self.random.randint(0, 5))]
+
+        return {self._text(6): self.random.choice([self.random.random(), self._text(10), None, True])
+                for _ in range(self.random.randint(1, 5))}
+
+    def request(self) -> dict:
+        return {"jsonrpc": "2.0", "method": self.random.choice(METHODS), "params": self._params(), "id": self._id()}
+
+    def notification(self) -> dict:
+        return {"jsonrpc": "2.0", "method": self.random.choice(METHODS), "params": self._params()}
+
+    def response(self, result_size: typing.Optional[int] = None) -> dict:
+        if result_size is None:
+            result_size = self.random.choice((0, 1, 5, 20))
+
+        result = {"values": [self.random.random() for _ in range(result_size)], "name": self._text(8)}
+        return {"jsonrpc": "2.0", "result": result, "id": self._id()}
+
+    def error(self) -> dict:
+        code = self.random.choice((-32700, -32600, -32601, -32602, -32603, -32000))
+        return {"jsonrpc": "2.0", "error": {"code": code, "message": "error"}, "id": self._id()}
+
+    def batch(self, size: typing.Optional[int] = None) -> list:
+        size = size if size is not None else self.random.randint(2, 20)
+        return [self.random.choice((self.request, self.notification))() for _ in range(size)]
+
+    def malformed(self) -> bytes:
+        valid = json.dumps(self.request()).encode("utf-8")
+        kind = self.random.randrange(4)
+
+        if kind == 0:
+            return valid[:self.random.randrange(1, len(valid))]
+
+        if kind == 1:
+            return b'{"jsonrpc": "2.0", "method": 1, "params": "bar"}'
+
+        if kind == 2:
+            return b'[1, 2, 3]'
+
+        return b'{"jsonrpc": "2.0", "method": "foobar, "params": "bar", "baz]'
+
+    def encode(self, kind: str) -> bytes:
+        if kind == "malformed":
+            return self.malformed()
+
+        return json.dumps(getattr(self, kind)()).encode("utf-8")
+
+    def mixed(self, count: int) -> typing.List[bytes]:
+        kinds = [kind for kind, _ in MIX]
+        weights = [weight for _, weight in MIX]
+        return [self.encode(kind) for kind in self.random.choices(kinds, weights, k=count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write seeded JSON-RPC traffic as JSON lines.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+
+    for payload in Corpus(args.seed).mixed(args.count):
+        sys.stdout.buffer.write(payload + b"\n")
+
+
+if __name__ == "__main__":
+    main()
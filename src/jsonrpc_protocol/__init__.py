@@ -1,2 +1,14 @@
+from .backend import JsonBackend
+from .asyncdispatcher import AsyncDispatcher
+from .coalescer import BatchCoalescer
+from .dispatcher import Dispatcher
+from .instrumentation import Instrumentation
+from .limits import Limits
+from .parsecache import ParseCache
+from .pendingcalls import PendingCalls
+from .pooldispatcher import PoolDispatcher
+from .replay import LogReplay
+from .schema import SchemaRegistry
 from .serializer import Serializer
+from .stream import StreamParser
 from .validator import Validator
@@ -0,0 +1,85 @@
+import asyncio
+import typing
+
+from jsonrpc_protocol.dispatcher import Dispatcher
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.instrumentation import Instrumentation
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.entity import Entity
+from jsonrpc_protocol.protocol.notification import Notification
+from jsonrpc_protocol.protocol.request import Request
+
+
+class AsyncDispatcher(Dispatcher):
+    accepts_coroutines = True
+
+    def __init__(self,
+                 max_concurrency: typing.Optional[int] = None,
+                 instrumentation: typing.Optional[Instrumentation] = None):
+        # Without a worker a batch would silently get no responses.
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        super().__init__(instrumentation)
+        self.max_concurrency = max_concurrency
+
+    async def dispatch(self, entity: Entity) -> typing.Optional[Entity]:
+        if entity.is_batch:
+            return await self._dispatch_batch(entity)
+
+        return await self._dispatch_single(entity)
+
+    async def _dispatch_batch(self, batch: Batch) -> typing.Optional[Batch]:
+        # A fixed number of workers pull from one iterator, which bounds
+        # concurrency and keeps lazy batches parsing on demand.
+        elements = enumerate(batch)
+        responses = []
+
+        async def worker():
+            for index, element in elements:
+                response = await self._dispatch_single(element)
+
+                if response is not None:
+                    responses.append((index, response))
+
+        workers = len(batch)
+
+        if self.max_concurrency is not None:
+            workers = min(workers, self.max_concurrency)
+
+        await asyncio.gather(*[worker() for _ in range(workers)])
+
+        if not responses:
+            return None
+
+        responses.sort(key=lambda item: item[0])
+        result = Batch()
+        result.elements = [response for _, response in responses]
+        return result
+
+    async def _dispatch_single(self, entity: Entity) -> typing.Optional[Entity]:
+        if entity.is_request or entity.is_notification:
+            return await self._call(entity)
+
+        if entity.is_error and entity.is_answered:
+            return entity
+
+        return None
+
+    async def _call(self, entity: typing.Union[Request, Notification]) -> typing.Optional[Entity]:
+        bound = self._bind(entity)
+
+        if not isinstance(bound, tuple):
+            return bound
+
+        handler, args, kwargs = bound
+
+        try:
+            result = handler.function(*args, **kwargs)
+
+            if handler.is_coroutine:
+                result = await result
+        except Exception:
+            return self._reply_error(entity, ErrorCode.InternalError)
+
+        return self._reply(entity, result)
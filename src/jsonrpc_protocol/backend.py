@@ -0,0 +1,168 @@
+import json
+import typing
+
+from jsonrpc_protocol.limits import Limits
+
+
+class JsonBackend:
+    __slots__ = ("name", "loads", "dumps", "dumps_bytes", "item_separator", "key_separator", "binary", "max_depth",
+                 "_depth_guard")
+
+    _registry: typing.Dict[str, "JsonBackend"] = {}
+    _default: typing.Optional["JsonBackend"] = None
+
+    def __init__(self,
+                 name: str,
+                 loads: typing.Callable[[typing.Union[str, bytes, bytearray]], object],
+                 dumps: typing.Callable[[object], str],
+                 dumps_bytes: typing.Callable[[object], bytes],
+                 separators: typing.Tuple[bytes, bytes] = (b",", b":"),
+                 binary: bool = False,
+                 max_depth: typing.Optional[int] = None):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+        self.dumps_bytes = dumps_bytes
+        # Needed to splice pre-encoded fragments into the same layout.
+        self.item_separator, self.key_separator = separators
+        # Binary codecs have no text form and no separators, entities fall
+        # back to encoding the whole object.
+        self.binary = binary
+        # Set for decoders without a recursion limit of their own, which
+        # overflow the native stack on deep input instead of raising.
+        self.max_depth = max_depth
+        self._depth_guard = None if max_depth is None else Limits(max_depth=max_depth)
+
+    def too_deep(self, data: typing.Union[str, bytes, bytearray, memoryview]) -> bool:
+        # Every level takes at least one byte, short payloads never qualify.
+        return self._depth_guard is not None and len(data) > self.max_depth \
+            and self._depth_guard.violation(data) is not None
+
+    @staticmethod
+    def binary_codec(name: str,
+                     loads: typing.Callable[[typing.Union[bytes, bytearray]], object],
+                     dumps_bytes: typing.Callable[[object], bytes]) -> "JsonBackend":
+        return JsonBackend(name, _binary_loads(name, loads), _binary_dumps(name), dumps_bytes, binary=True)
+
+    @staticmethod
+    def register(backend: "JsonBackend"):
+        JsonBackend._registry[backend.name] = backend
+
+    @staticmethod
+    def available(binary: typing.Optional[bool] = None) -> typing.List[str]:
+        # binary=False lists the JSON text backends, True the binary codecs.
+        return [name for name, backend in JsonBackend._registry.items() if binary is None or backend.binary == binary]
+
+    @staticmethod
+    def is_available(name: str) -> bool:
+        return name in JsonBackend._registry
+
+    @staticmethod
+    def get(backend: typing.Union[str, "JsonBackend", None] = None) -> "JsonBackend":
+        if backend is None:
+            return JsonBackend._default
+
+        if isinstance(backend, JsonBackend):
+            return backend
+
+        try:
+            return JsonBackend._registry[backend]
+        except KeyError:
+            raise ValueError("Unknown JSON backend " + repr(backend)) from None
+
+    @staticmethod
+    def get_default() -> "JsonBackend":
+        return JsonBackend._default
+
+    @staticmethod
+    def set_default(backend: typing.Union[str, "JsonBackend"]):
+        JsonBackend._default = JsonBackend.get(backend)
+
+
+def _binary_dumps(name: str) -> typing.Callable[[object], str]:
+    def dumps(obj: object) -> str:
+        raise TypeError(name + " is a binary codec, use dump_bytes")
+
+    return dumps
+
+
+def _binary_loads(name: str, loads: typing.Callable[[bytes], object]) -> typing.Callable[[bytes], object]:
+    # Decoders raise their own exception types, parse() expects ValueError.
+    def wrapper(data: typing.Union[str, bytes, bytearray]) -> object:
+        if isinstance(data, str):
+            raise ValueError(name + " payloads are bytes")
+
+        try:
+            return loads(data)
+        except ValueError:
+            raise
+        except Exception as error:
+            raise ValueError(str(error)) from error
+
+    return wrapper
+
+
+def _stdlib_dumps_bytes(obj: object) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+JsonBackend.register(JsonBackend("json", json.loads, json.dumps, _stdlib_dumps_bytes, (b", ", b": ")))
+
+try:
+    import ujson
+except ImportError:
+    pass
+else:
+    def _ujson_loads(data: typing.Union[str, bytes, bytearray]) -> object:
+        if isinstance(data, bytearray):
+            data = bytes(data)
+
+        return ujson.loads(data)
+
+    def _ujson_dumps(obj: object) -> str:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+
+    def _ujson_dumps_bytes(obj: object) -> bytes:
+        return _ujson_dumps(obj).encode("utf-8")
+
+    JsonBackend.register(JsonBackend("ujson", _ujson_loads, _ujson_dumps, _ujson_dumps_bytes))
+
+try:
+    import orjson
+except ImportError:
+    pass
+else:
+    def _orjson_dumps_bytes(obj: object) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def _orjson_dumps(obj: object) -> str:
+        return _orjson_dumps_bytes(obj).decode("utf-8")
+
+    # orjson 3.8 recurses without a limit and segfaults on deep arrays, 1024
+    # matches the nesting the stdlib decoder accepts.
+    JsonBackend.register(JsonBackend("orjson", orjson.loads, _orjson_dumps, _orjson_dumps_bytes, max_depth=1024))
+
+try:
+    import msgpack
+except ImportError:
+    pass
+else:
+    def _msgpack_loads(data: typing.Union[bytes, bytearray]) -> object:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+    def _msgpack_dumps_bytes(obj: object) -> bytes:
+        return msgpack.packb(obj, use_bin_type=True)
+
+    JsonBackend.register(JsonBackend.binary_codec("msgpack", _msgpack_loads, _msgpack_dumps_bytes))
+
+try:
+    import cbor2
+except ImportError:
+    pass
+else:
+    JsonBackend.register(JsonBackend.binary_codec("cbor", cbor2.loads, cbor2.dumps))
+
+for _name in ("orjson", "ujson", "json"):
+    if JsonBackend.is_available(_name):
+        JsonBackend.set_default(_name)
+        break
@@ -0,0 +1,97 @@
+from jsonrpc_protocol.enum import MessageType
+from jsonrpc_protocol.enum import ProtocolVersion
+
+_METHOD = 1
+_PARAMS = 2
+_ID = 4
+_RESULT = 8
+_ERROR = 16
+
+_KEYS = {
+    "method": _METHOD,
+    "params": _PARAMS,
+    "id": _ID,
+    "result": _RESULT,
+    "error": _ERROR,
+}
+
+
+class Classifier:
+
+    @staticmethod
+    def classify(json_data: dict, protocol_version: ProtocolVersion) -> MessageType:
+        if protocol_version is _V1:
+            return Classifier.classify_v1(json_data)
+
+        jsonrpc = json_data.get("jsonrpc")
+
+        # Only an equal str passes, _value_ skips the Enum.value descriptor.
+        if jsonrpc != protocol_version._value_:
+            return MessageType.Invalid
+
+        # One bit per known member, the method and error members only count
+        # with the right type.
+        mask = 0
+        keys = _KEYS
+
+        for key in json_data:
+            mask |= keys.get(key, 0)
+
+        if mask & _METHOD and not isinstance(json_data["method"], str):
+            mask ^= _METHOD
+
+        if mask & _ERROR and not isinstance(json_data["error"], dict):
+            mask ^= _ERROR
+
+        return _TABLES[jsonrpc][mask]
+
+    @staticmethod
+    def classify_v1(json_data: dict) -> MessageType:
+        # 1.0 has no optional members: a null id marks a notification and
+        # whichever of result and error is unused must be null.
+        if json_data.get("jsonrpc", _V1_VALUE) != _V1_VALUE or "id" not in json_data:
+            return MessageType.Invalid
+
+        if "method" in json_data:
+            if isinstance(json_data["method"], str) and isinstance(json_data.get("params"), list):
+                return MessageType.Notification if json_data["id"] is None else MessageType.Request
+
+            return MessageType.Invalid
+
+        if "result" in json_data and "error" in json_data:
+            error = json_data["error"]
+
+            if error is None:
+                return MessageType.Response
+
+            if isinstance(error, dict) and json_data["result"] is None:
+                return MessageType.Error
+
+        return MessageType.Invalid
+
+    @staticmethod
+    def _compile(mask: int, protocol_version: ProtocolVersion) -> MessageType:
+        # Same precedence as the former chain of Validator checks.
+        has_method = bool(mask & _METHOD)
+        has_id = bool(mask & _ID)
+
+        if has_method and mask & _PARAMS and has_id:
+            return MessageType.Request
+
+        if mask & _RESULT and has_id:
+            return MessageType.Response
+
+        if has_method:
+            return MessageType.Notification
+
+        if mask & _ERROR and has_id and protocol_version == ProtocolVersion.v2:
+            return MessageType.Error
+
+        return MessageType.Invalid
+
+
+_V1 = ProtocolVersion.v1
+_V1_VALUE = ProtocolVersion.v1.value
+
+# Only 2.0 is classified from key presence alone, see classify_v1.
+_TABLES = {ProtocolVersion.v2.value: tuple(Classifier._compile(mask, ProtocolVersion.v2) for mask in range(32))}
@@ -0,0 +1,92 @@
+import concurrent.futures
+import threading
+import typing
+
+from jsonrpc_protocol.enum import ProtocolVersion
+from jsonrpc_protocol.pendingcalls import PendingCalls
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.entity import Entity
+from jsonrpc_protocol.protocol.notification import Notification
+from jsonrpc_protocol.protocol.params import Params
+
+
+class BatchCoalescer:
+    # Collects outgoing calls and hands them to send() as one Batch once
+    # max_size entities are queued or the oldest has waited max_latency
+    # seconds, whichever comes first. Replies are fed back via receive().
+
+    def __init__(self,
+                 send: typing.Callable[[Entity], None],
+                 max_size: int = 100,
+                 max_latency: float = 0.005,
+                 pending: typing.Optional[PendingCalls] = None):
+        self.send = send
+        self.max_size = max_size
+        self.max_latency = max_latency
+        self.pending = pending if pending is not None else PendingCalls()
+        self._queue: typing.List[Entity] = []
+        self._timer: typing.Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def call(self,
+             method: str,
+             params: typing.Optional[Params] = None,
+             timeout: typing.Optional[float] = None,
+             jsonrpc: ProtocolVersion = ProtocolVersion.v2) -> concurrent.futures.Future:
+        request, future = self.pending.call(method, params, timeout, jsonrpc)
+        self._enqueue(request)
+        return future
+
+    def notify(self, method: str, params: typing.Optional[Params] = None,
+               jsonrpc: ProtocolVersion = ProtocolVersion.v2):
+        self._enqueue(Notification(jsonrpc, method, params))
+
+    def receive(self, entity: Entity) -> typing.List[Entity]:
+        return self.pending.resolve(entity)
+
+    def flush(self):
+        with self._lock:
+            queue = self._take()
+
+        self._send(queue)
+
+    def close(self):
+        self.flush()
+
+    def _enqueue(self, entity: Entity):
+        queue = None
+
+        with self._lock:
+            self._queue.append(entity)
+
+            if len(self._queue) >= self.max_size:
+                queue = self._take()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_latency, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if queue is not None:
+            self._send(queue)
+
+    def _take(self) -> typing.List[Entity]:
+        queue = self._queue
+        self._queue = []
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        return queue
+
+    def _send(self, queue: typing.List[Entity]):
+        if not queue:
+            return
+
+        if len(queue) == 1:
+            self.send(queue[0])
+            return
+
+        batch = Batch()
+        batch.elements = queue
+        self.send(batch)
@@ -0,0 +1,180 @@
+import inspect
+import typing
+
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.instrumentation import Instrumentation
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.entity import Entity
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.notification import Notification
+from jsonrpc_protocol.protocol.params import Params
+from jsonrpc_protocol.protocol.request import Request
+from jsonrpc_protocol.protocol.response import Response
+
+
+class InvalidParamsError(Exception):
+    pass
+
+
+class Handler:
+    __slots__ = ("function", "is_coroutine", "min_positional", "max_positional", "names", "required", "accepts_any_name")
+
+    def __init__(self, function: typing.Callable):
+        self.function = function
+        self.is_coroutine = inspect.iscoroutinefunction(function)
+
+        positional = []
+        names = []
+        required = []
+        self.max_positional: typing.Optional[int] = 0
+        self.accepts_any_name = False
+
+        for parameter in inspect.signature(function).parameters.values():
+            kind = parameter.kind
+            has_default = parameter.default is not inspect.Parameter.empty
+
+            if kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
+                positional.append(has_default)
+
+            if kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY):
+                names.append(parameter.name)
+
+                if not has_default:
+                    required.append(parameter.name)
+
+            elif kind == inspect.Parameter.POSITIONAL_ONLY and not has_default:
+                # Can never be bound from named params.
+                required.append(parameter.name)
+
+            if kind == inspect.Parameter.VAR_POSITIONAL:
+                self.max_positional = None
+
+            if kind == inspect.Parameter.VAR_KEYWORD:
+                self.accepts_any_name = True
+
+        self.min_positional = positional.count(False)
+
+        if self.max_positional is not None:
+            self.max_positional = len(positional)
+
+        self.names = frozenset(names)
+        self.required = frozenset(required)
+
+    def bind(self, params: typing.Optional[Params]) -> typing.Tuple[tuple, dict]:
+        if params is None:
+            data = ()
+        else:
+            data = params.data
+
+        if isinstance(data, dict):
+            if not self.required.issubset(data):
+                raise InvalidParamsError("Missing params " + ", ".join(sorted(self.required.difference(data))))
+
+            if not self.accepts_any_name and not self.names.issuperset(data):
+                raise InvalidParamsError("Unexpected params " + ", ".join(sorted(set(data).difference(self.names))))
+
+            return (), data
+
+        count = len(data)
+
+        if count < self.min_positional or (self.max_positional is not None and count > self.max_positional):
+            raise InvalidParamsError("Wrong number of params")
+
+        return tuple(data), {}
+
+
+class Dispatcher:
+    # Coroutine handlers need an event loop to run on, see AsyncDispatcher.
+    accepts_coroutines = False
+
+    def __init__(self, instrumentation: typing.Optional[Instrumentation] = None):
+        self._handlers: typing.Dict[str, Handler] = {}
+        self.instrumentation = None
+        self.instrument(instrumentation)
+
+    def instrument(self, instrumentation: typing.Optional[Instrumentation]):
+        self.__dict__.pop("_call", None)
+        self.instrumentation = instrumentation
+
+        if instrumentation is not None:
+            self._call = instrumentation.wrap_call(self._call, self.__contains__)
+
+    def register(self, function: typing.Optional[typing.Callable] = None, name: typing.Optional[str] = None):
+        if function is None:
+            return lambda decorated: self.register(decorated, name)
+
+        handler = Handler(function)
+
+        if handler.is_coroutine and not self.accepts_coroutines:
+            raise TypeError(type(self).__name__ + " cannot await coroutine handlers, use AsyncDispatcher")
+
+        self._handlers[name if name is not None else function.__name__] = handler
+        return function
+
+    def unregister(self, name: str):
+        del self._handlers[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._handlers
+
+    def dispatch(self, entity: Entity) -> typing.Optional[Entity]:
+        if entity.is_batch:
+            responses = Batch()
+
+            for element in entity:
+                response = self.dispatch(element)
+
+                if response is not None:
+                    responses.elements.append(response)
+
+            return responses if responses.elements else None
+
+        return self._dispatch_single(entity)
+
+    def _dispatch_single(self, entity: Entity) -> typing.Optional[Entity]:
+        if entity.is_request or entity.is_notification:
+            return self._call(entity)
+
+        if entity.is_error and entity.is_answered:
+            # Unparseable or invalid input is answered with its error, error
+            # responses from the peer and rejected notifications are not.
+            return entity
+
+        return None
+
+    def _call(self, entity: typing.Union[Request, Notification]) -> typing.Optional[Entity]:
+        bound = self._bind(entity)
+
+        if not isinstance(bound, tuple):
+            return bound
+
+        handler, args, kwargs = bound
+
+        try:
+            result = handler.function(*args, **kwargs)
+        except Exception:
+            return self._reply_error(entity, ErrorCode.InternalError)
+
+        return self._reply(entity, result)
+
+    def _bind(self, entity: typing.Union[Request, Notification]) \
+            -> typing.Union[typing.Tuple[Handler, tuple, dict], Entity, None]:
+        handler = self._handlers.get(entity.method)
+
+        if handler is None:
+            return self._reply_error(entity, ErrorCode.MethodNotFound)
+
+        try:
+            args, kwargs = handler.bind(entity.params)
+        except InvalidParamsError:
+            return self._reply_error(entity, ErrorCode.InvalidParams)
+
+        return handler, args, kwargs
+
+    @staticmethod
+    def _reply(entity: typing.Union[Request, Notification], result: object) -> typing.Optional[Response]:
+        return Response(entity.jsonrpc, result, entity.id) if entity.is_request else None
+
+    @staticmethod
+    def _reply_error(entity: typing.Union[Request, Notification], error_code: ErrorCode) -> typing.Optional[Error]:
+        return Error(entity.jsonrpc, error_code, entity.id) if entity.is_request else None
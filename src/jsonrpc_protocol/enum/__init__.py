@@ -1,2 +1,3 @@
 from .protocolversion import ProtocolVersion
 from .errorcode import ErrorCode
+from .messagetype import MessageType
@@ -0,0 +1,9 @@
+from enum import IntEnum
+
+
+class MessageType(IntEnum):
+    Invalid = 0
+    Request = 1
+    Response = 2
+    Notification = 3
+    Error = 4
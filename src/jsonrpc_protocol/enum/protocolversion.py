@@ -7,9 +7,11 @@ class ProtocolVersion(Enum):
 
     @staticmethod
     def from_str(version):
-        if version in "1.0":
-            return ProtocolVersion.v1
-        elif version in "2.0":
-            return ProtocolVersion.v2
-        else:
-            raise NotImplementedError
+        # Exact match only, "" or "1" are not versions.
+        try:
+            return _VERSIONS[version]
+        except (KeyError, TypeError):
+            raise NotImplementedError from None
+
+
+_VERSIONS = {protocol_version.value: protocol_version for protocol_version in ProtocolVersion}
@@ -0,0 +1,194 @@
+import bisect
+import functools
+import inspect
+import threading
+import time
+import typing
+
+from jsonrpc_protocol.protocol.batch import LazyBatch
+from jsonrpc_protocol.protocol.entity import Entity
+
+_LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+# Label shared by calls to methods without a registered handler.
+_UNKNOWN_METHOD = "<unknown>"
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: typing.Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict:
+        buckets = {}
+        cumulative = 0
+
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+
+        return {"buckets": buckets, "count": self.count, "sum": self.sum}
+
+
+def _label(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class Instrumentation:
+    # Installed through Serializer.instrument() and Dispatcher.instrument(),
+    # which wrap the instrumented methods only while enabled.
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.parse_latency = Histogram(_LATENCY_BUCKETS)
+        self.dump_latency = Histogram(_LATENCY_BUCKETS)
+        self.call_latency: typing.Dict[str, Histogram] = {}
+        self.batch_sizes = Histogram(_BATCH_SIZE_BUCKETS)
+        self.messages: typing.Dict[typing.Tuple[str, str], int] = {}
+        self.errors: typing.Dict[typing.Tuple[str, int], int] = {}
+
+    def observe_parse(self, seconds: float, entity: Entity):
+        with self._lock:
+            self.parse_latency.observe(seconds)
+            self._count("in", entity)
+
+    def observe_dump(self, seconds: float, entity: Entity):
+        with self._lock:
+            self.dump_latency.observe(seconds)
+            self._count("out", entity)
+
+    def observe_call(self, method: str, seconds: float):
+        with self._lock:
+            histogram = self.call_latency.get(method)
+
+            if histogram is None:
+                histogram = self.call_latency[method] = Histogram(_LATENCY_BUCKETS)
+
+            histogram.observe(seconds)
+
+    def wrap_parse(self, function: typing.Callable) -> typing.Callable:
+        @functools.wraps(function)
+        def parse(*args, **kwargs):
+            started = time.perf_counter()
+            entity = function(*args, **kwargs)
+            self.observe_parse(time.perf_counter() - started, entity)
+            return entity
+
+        return parse
+
+    def wrap_dump(self, function: typing.Callable) -> typing.Callable:
+        @functools.wraps(function)
+        def dump(entity, *args, **kwargs):
+            started = time.perf_counter()
+            data = function(entity, *args, **kwargs)
+            self.observe_dump(time.perf_counter() - started, entity)
+            return data
+
+        return dump
+
+    def wrap_call(self, function: typing.Callable,
+                  known: typing.Optional[typing.Callable[[str], bool]] = None) -> typing.Callable:
+        # Methods known() rejects share one label, so names a peer makes up
+        # cannot add histograms or series without bound.
+        def label(method: str) -> str:
+            return method if known is None or known(method) else _UNKNOWN_METHOD
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def call_async(entity, *args, **kwargs):
+                method = label(entity.method)
+                started = time.perf_counter()
+
+                try:
+                    return await function(entity, *args, **kwargs)
+                finally:
+                    self.observe_call(method, time.perf_counter() - started)
+
+            return call_async
+
+        @functools.wraps(function)
+        def call(entity, *args, **kwargs):
+            method = label(entity.method)
+            started = time.perf_counter()
+
+            try:
+                return function(entity, *args, **kwargs)
+            finally:
+                self.observe_call(method, time.perf_counter() - started)
+
+        return call
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "parse_seconds": self.parse_latency.snapshot(),
+                "dump_seconds": self.dump_latency.snapshot(),
+                "call_seconds": {method: histogram.snapshot() for method, histogram in self.call_latency.items()},
+                "batch_size": self.batch_sizes.snapshot(),
+                "messages": {direction + "/" + kind: count for (direction, kind), count in self.messages.items()},
+                "errors": {direction + "/" + str(code): count for (direction, code), count in self.errors.items()},
+            }
+
+    def prometheus(self) -> str:
+        snapshot = self.snapshot()
+        lines = []
+
+        for name, histogram in (("jsonrpc_parse_seconds", snapshot["parse_seconds"]),
+                                ("jsonrpc_dump_seconds", snapshot["dump_seconds"]),
+                                ("jsonrpc_batch_size", snapshot["batch_size"])):
+            lines.append("# TYPE " + name + " histogram")
+            Instrumentation._histogram_lines(lines, name, "", histogram)
+
+        lines.append("# TYPE jsonrpc_call_seconds histogram")
+        for method, histogram in snapshot["call_seconds"].items():
+            Instrumentation._histogram_lines(lines, "jsonrpc_call_seconds", 'method="' + _label(method) + '",', histogram)
+
+        lines.append("# TYPE jsonrpc_messages_total counter")
+        for key, count in snapshot["messages"].items():
+            direction, kind = key.split("/")
+            lines.append('jsonrpc_messages_total{direction="%s",type="%s"} %d' % (direction, kind, count))
+
+        lines.append("# TYPE jsonrpc_errors_total counter")
+        for key, count in snapshot["errors"].items():
+            direction, code = key.split("/")
+            lines.append('jsonrpc_errors_total{direction="%s",code="%s"} %d' % (direction, _label(code), count))
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _histogram_lines(lines: typing.List[str], name: str, labels: str, histogram: dict):
+        for bound, count in histogram["buckets"].items():
+            lines.append('%s_bucket{%sle="%s"} %d' % (name, labels, "+Inf" if bound == float("inf") else repr(bound),
+                                                    count))
+
+        suffix = "{" + labels.rstrip(",") + "}" if labels else ""
+        lines.append("%s_sum%s %r" % (name, suffix, histogram["sum"]))
+        lines.append("%s_count%s %d" % (name, suffix, histogram["count"]))
+
+    def _count(self, direction: str, entity: Entity):
+        kind = entity.kind
+        key = (direction, kind)
+        self.messages[key] = self.messages.get(key, 0) + 1
+
+        if kind == "error":
+            key = (direction, int(entity.code))
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+        elif kind == "batch":
+            self.batch_sizes.observe(len(entity))
+
+            # Iterating a lazy batch here would consume it.
+            if not isinstance(entity, LazyBatch):
+                for element in entity:
+                    self._count(direction, element)
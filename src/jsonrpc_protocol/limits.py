@@ -0,0 +1,134 @@
+import array
+import itertools
+import operator
+import re
+import typing
+
+_ESCAPE = re.compile(rb'\\.', re.S)
+_STRING = re.compile(rb'"[^"]*"')
+_LONG_STRING = rb'"[^"]{%d}'
+_ARRAY = re.compile(rb'[ \t\r\n]*\[')
+
+# Reduces a payload to its strings, containers and commas, with objects
+# written as arrays.
+_STRUCTURE = bytes.maketrans(b"{}", b"[]")
+_NOT_STRUCTURE = bytes(byte for byte in range(256) if byte not in b'"[]{},')
+_NOT_CONTAINER = _NOT_STRUCTURE + b","
+_WEIGHTS = bytes.maketrans(b"[],", b"\x01\xff\x00")
+_COMMAS = bytes.maketrans(b"[],", b"\x00\x00\x01")
+
+
+class Limits:
+    # Checked on the raw payload before it is decoded, with linear C level
+    # passes (regex, bytes.translate, itertools) that never build the
+    # values. Strings are measured as written, escapes included. None
+    # disables a limit.
+    __slots__ = ("max_bytes", "max_batch_length", "max_depth", "max_string_length", "_long_string")
+
+    def __init__(self,
+                 max_bytes: typing.Optional[int] = None,
+                 max_batch_length: typing.Optional[int] = None,
+                 max_depth: typing.Optional[int] = None,
+                 max_string_length: typing.Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.max_batch_length = max_batch_length
+        self.max_depth = max_depth
+        self.max_string_length = max_string_length
+        self._long_string = None if max_string_length is None else re.compile(_LONG_STRING % (max_string_length + 1))
+
+    def violation(self,
+                  json_data: typing.Union[str, bytes, bytearray, memoryview],
+                  binary: bool = False) -> typing.Optional[str]:
+        # A str has at most as many characters as bytes, so an oversized
+        # one is rejected before it is encoded.
+        if self.max_bytes is not None and len(json_data) > self.max_bytes:
+            return "max_bytes"
+
+        # Only the size applies to binary codecs, the batch length is
+        # checked again once decoded.
+        if binary:
+            return None
+
+        if isinstance(json_data, (str, memoryview)):
+            json_data = json_data.encode("utf-8") if isinstance(json_data, str) else json_data.tobytes()
+
+            if self.max_bytes is not None and len(json_data) > self.max_bytes:
+                return "max_bytes"
+
+        # Counts are upper bounds, the passes below only run when one of
+        # them says a limit could be exceeded.
+        check_strings = self.max_string_length is not None and len(json_data) - 2 > self.max_string_length
+        check_depth = self.max_depth is not None and json_data.count(b"[") + json_data.count(b"{") > self.max_depth
+        check_batch = self.max_batch_length is not None and json_data.count(b",") >= self.max_batch_length
+
+        if not (check_strings or check_depth or check_batch):
+            return None
+
+        # Escapes only occur inside strings, replacing them with two plain
+        # bytes keeps string widths and leaves quotes as string delimiters.
+        if b"\\" in json_data:
+            json_data = _ESCAPE.sub(b"__", json_data)
+
+        if check_strings and self._has_long_string(json_data):
+            return "max_string_length"
+
+        if check_depth or check_batch:
+            return self._check_structure(json_data, check_depth, check_batch)
+
+        return None
+
+    def _has_long_string(self, json_data: bytes) -> bool:
+        # A match starts at a quote followed by too many other bytes. After
+        # an even number of quotes that quote opens a string, otherwise it
+        # closes one and the gap up to the next string is skipped.
+        quotes = 0
+        counted = 0
+        match = self._long_string.search(json_data)
+
+        while match is not None:
+            quotes += json_data.count(b'"', counted, match.start())
+            counted = match.start()
+
+            if not quotes % 2:
+                return True
+
+            following = json_data.find(b'"', match.end())
+
+            if following < 0:
+                return False
+
+            match = self._long_string.search(json_data, following)
+
+        return False
+
+    def _check_structure(self, json_data: bytes, check_depth: bool, check_batch: bool) -> typing.Optional[str]:
+        check_batch = check_batch and _ARRAY.match(json_data) is not None
+        structure = json_data.translate(_STRUCTURE, _NOT_STRUCTURE if check_batch else _NOT_CONTAINER)
+
+        # Dropping two adjacent quotes keeps every other byte on the same
+        # side of a string boundary, which empties most strings cheaply.
+        structure = structure.replace(b'""', b"")
+
+        if b'"' in structure:
+            structure = _STRING.sub(b"", structure)
+
+        # Enough consecutive openers settle the common deep input at once.
+        if check_depth and b"[" * (self.max_depth + 1) in structure:
+            return "max_depth"
+
+        # One signed byte per container byte, the running sum is the depth
+        # after each byte and top-level commas are the ones at depth one.
+        # accumulate, compress and countOf run in C, so each check is a
+        # single linear pass whatever the nesting.
+        weights = array.array("b", structure.translate(_WEIGHTS))
+
+        if check_depth and max(itertools.accumulate(weights), default=0) > self.max_depth:
+            return "max_depth"
+
+        if check_batch:
+            commas = itertools.compress(itertools.accumulate(weights), structure.translate(_COMMAS))
+
+            if operator.countOf(commas, 1) >= self.max_batch_length:
+                return "max_batch_length"
+
+        return None
@@ -0,0 +1,215 @@
+import collections
+import re
+import typing
+
+from jsonrpc_protocol.protocol import Params
+from jsonrpc_protocol.protocol.entity import Entity
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.notification import Notification
+from jsonrpc_protocol.protocol.request import Request
+from jsonrpc_protocol.protocol.response import Response
+from jsonrpc_protocol.serializer import Serializer
+
+# The value of an id that is the last member of the top-level object.
+# Only literals that are valid JSON as written are matched, so a template
+# hit never accepts an id the full parser would reject.
+_ID_VALUE = re.compile(rb'\s*:\s*(-?(?:0|[1-9][0-9]*)|"[^"\\\x00-\x1f]*")\s*}\s*\Z')
+_ID_KEY = b'"id"'
+_WHITESPACE = b" \t\r\n"
+
+
+def _read_only(*args, **kwargs):
+    raise TypeError("cached params and results are read-only")
+
+
+class _FrozenList(list):
+    __slots__ = ()
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+class _FrozenDict(dict):
+    __slots__ = ()
+
+    pop = popitem = clear = update = setdefault = _read_only
+    __setitem__ = __delitem__ = __ior__ = _read_only
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class _FrozenParams(Params):
+    __slots__ = ()
+
+    def __init__(self, params: object):
+        object.__setattr__(self, "data", _freeze(params))
+
+    __setattr__ = __delattr__ = _read_only
+
+    def __reduce__(self):
+        return Params, (self.data,)
+
+
+def _freeze(value: object) -> object:
+    kind = type(value)
+
+    if kind is list:
+        return _FrozenList([_freeze(item) if type(item) in _CONTAINERS else item for item in value])
+
+    if kind is dict:
+        return _FrozenDict({key: _freeze(item) if type(item) in _CONTAINERS else item
+                            for key, item in value.items()})
+
+    return value
+
+
+_CONTAINERS = (list, dict)
+
+
+class ParseCache:
+    # Cached params and results are frozen, they stay lists and dicts for
+    # handlers and encoders but refuse in-place changes. Every hit gets its
+    # own entity, so reassigning an attribute never reaches the cache.
+
+    def __init__(self, serializer: typing.Optional[Serializer] = None, max_size: int = 1024,
+                 templates: bool = False):
+        self.serializer = serializer if serializer is not None else Serializer()
+        self.max_size = max_size
+        self.templates = templates
+        self.hits = 0
+        self.misses = 0
+        self.template_hits = 0
+        self._entities: "collections.OrderedDict[bytes, Entity]" = collections.OrderedDict()
+        self._templates: "collections.OrderedDict[bytes, Entity]" = collections.OrderedDict()
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "template_hits": self.template_hits,
+            "misses": self.misses,
+            "size": len(self._entities),
+            "template_size": len(self._templates),
+        }
+
+    def clear(self):
+        self._entities.clear()
+        self._templates.clear()
+
+    def parse(self, json_data: typing.Union[str, bytes, bytearray]) -> Entity:
+        key = json_data.encode("utf-8") if isinstance(json_data, str) else bytes(json_data)
+        entity = self._entities.get(key)
+
+        if entity is not None:
+            self._entities.move_to_end(key)
+            self.hits += 1
+            return _copy(entity)
+
+        match = ParseCache._match_id(key) if self.templates else None
+
+        if match is not None:
+            template_key = key[:match.start(1)] + b"\0" + key[match.end(1):]
+            entity = self._from_template(template_key, match.group(1))
+
+            if entity is not None:
+                self.template_hits += 1
+                return entity
+
+        self.misses += 1
+        entity = self.serializer.parse(key)
+
+        # Batches are never cached, eager ones hold a mutable element list
+        # and lazy ones are consumed by iteration.
+        if entity.is_batch:
+            return entity
+
+        # The cache keeps a frozen copy, the caller owns what was parsed.
+        cached = _COPY[type(entity)](entity, getattr(entity, "id", None), True)
+        ParseCache._store(self._entities, key, cached, self.max_size)
+
+        if match is not None and type(entity) in _TEMPLATES:
+            id = ParseCache._decode_id(match.group(1))
+
+            # Only a confirmed match becomes a template, the id must be the
+            # one the parser found.
+            if id is not None and entity.id == id and type(entity.id) is type(id):
+                ParseCache._store(self._templates, template_key, cached, self.max_size)
+
+        return entity
+
+    def _from_template(self, key: bytes, literal: bytes) -> typing.Optional[Entity]:
+        template = self._templates.get(key)
+
+        if template is None:
+            return None
+
+        id = ParseCache._decode_id(literal)
+
+        if id is None:
+            return None
+
+        self._templates.move_to_end(key)
+        return _COPY[type(template)](template, id)
+
+    @staticmethod
+    def _match_id(key: bytes) -> typing.Optional[typing.Match]:
+        position = key.rfind(_ID_KEY)
+
+        if position <= 0:
+            return None
+
+        before = position - 1
+
+        while before > 0 and key[before] in _WHITESPACE:
+            before -= 1
+
+        if key[before] not in b",{":
+            return None
+
+        return _ID_VALUE.match(key, position + len(_ID_KEY))
+
+    @staticmethod
+    def _decode_id(literal: bytes) -> typing.Union[int, str, None]:
+        if literal.startswith(b'"'):
+            try:
+                return literal[1:-1].decode("utf-8")
+            except UnicodeDecodeError:
+                return None
+
+        return int(literal)
+
+    @staticmethod
+    def _store(cache: collections.OrderedDict, key: bytes, entity: Entity, max_size: int):
+        cache[key] = entity
+
+        if len(cache) > max_size:
+            cache.popitem(last=False)
+
+
+def _params(params: typing.Optional[Params], freeze: bool) -> typing.Optional[Params]:
+    return _FrozenParams(params.data) if freeze and params is not None else params
+
+
+def _copy(entity: Entity) -> Entity:
+    return _COPY[type(entity)](entity, getattr(entity, "id", None))
+
+
+# Builds a fresh entity from a cached one with the given id. Frozen params
+# are shared between copies, freeze is only set when an entity is stored.
+_COPY = {
+    Request: lambda entity, id, freeze=False: Request(
+        entity.jsonrpc, entity.method, _params(entity.params, freeze), id),
+    Response: lambda entity, id, freeze=False: Response(
+        entity.jsonrpc, _freeze(entity.result) if freeze else entity.result, id),
+    Error: lambda entity, id, freeze=False: Error(
+        entity.jsonrpc, entity.code, id, entity.received, entity.notification),
+    Notification: lambda entity, id, freeze=False: Notification(
+        entity.jsonrpc, entity.method, _params(entity.params, freeze)),
+}
+
+# Only entities with an id can serve as templates.
+_TEMPLATES = (Request, Response, Error)
@@ -0,0 +1,132 @@
+import concurrent.futures
+import heapq
+import itertools
+import threading
+import time
+import typing
+
+from jsonrpc_protocol.enum import ProtocolVersion
+from jsonrpc_protocol.protocol.entity import Entity
+from jsonrpc_protocol.protocol.params import Params
+from jsonrpc_protocol.protocol.request import Request
+
+
+class PendingCalls:
+
+    def __init__(self, timeout: typing.Optional[float] = None, clock: typing.Callable[[], float] = time.monotonic):
+        self.timeout = timeout
+        self.clock = clock
+        self._ids = itertools.count(1)
+        self._futures: typing.Dict[object, concurrent.futures.Future] = {}
+        self._deadlines: typing.List[typing.Tuple[float, int, object, concurrent.futures.Future]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._futures
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def call(self,
+             method: str,
+             params: typing.Optional[Params] = None,
+             timeout: typing.Optional[float] = None,
+             jsonrpc: ProtocolVersion = ProtocolVersion.v2) -> typing.Tuple[Request, concurrent.futures.Future]:
+        request = Request(jsonrpc, method, params if params is not None else Params([]), self.next_id())
+        return request, self.register(request.id, timeout)
+
+    def register(self, id: object, timeout: typing.Optional[float] = None) -> concurrent.futures.Future:
+        future = concurrent.futures.Future()
+        timeout = timeout if timeout is not None else self.timeout
+
+        with self._lock:
+            if id in self._futures:
+                raise ValueError("Id " + repr(id) + " is already pending")
+
+            self._futures[id] = future
+
+            if timeout is not None:
+                # The sequence number keeps ties from comparing ids or futures.
+                heapq.heappush(self._deadlines, (self.clock() + timeout, next(self._sequence), id, future))
+
+        return future
+
+    def resolve(self, entity: Entity) -> typing.List[Entity]:
+        # Futures complete with the Response or Error entity itself.
+        # Entities without a pending id are handed back to the caller.
+        unmatched = []
+        resolved = []
+        elements = entity if entity.is_batch else (entity,)
+
+        with self._lock:
+            for element in elements:
+                future = self._pop(element)
+
+                if future is None:
+                    unmatched.append(element)
+                else:
+                    resolved.append((future, element))
+
+            self._compact()
+
+        # Completed outside the lock, done callbacks may issue the next call.
+        for future, element in resolved:
+            if not future.done():
+                future.set_result(element)
+
+        return unmatched
+
+    def cancel(self, id: object) -> bool:
+        with self._lock:
+            future = self._futures.pop(id, None)
+
+        return future is not None and future.cancel()
+
+    def expire(self, now: typing.Optional[float] = None) -> int:
+        now = self.clock() if now is None else now
+        expired = []
+
+        with self._lock:
+            deadlines = self._deadlines
+
+            while deadlines and deadlines[0][0] <= now:
+                _, _, id, future = heapq.heappop(deadlines)
+
+                if self._futures.get(id) is future:
+                    del self._futures[id]
+                    expired.append(future)
+
+        for future in expired:
+            if not future.done():
+                future.set_exception(TimeoutError("JSON-RPC call timed out"))
+
+        return len(expired)
+
+    def next_deadline(self) -> typing.Optional[float]:
+        with self._lock:
+            while self._deadlines and self._futures.get(self._deadlines[0][2]) is not self._deadlines[0][3]:
+                heapq.heappop(self._deadlines)
+
+            return self._deadlines[0][0] if self._deadlines else None
+
+    def _pop(self, element: Entity) -> typing.Optional[concurrent.futures.Future]:
+        # Only responses answer a call, an incoming request may reuse an id.
+        if not (element.is_response or element.is_error):
+            return None
+
+        try:
+            return self._futures.pop(element.id, None)
+        except TypeError:
+            # Arrays and objects are not valid ids and are never pending.
+            return None
+
+    def _compact(self):
+        # Resolved calls leave their deadline behind; rebuild once those
+        # stale entries dominate the heap.
+        if len(self._deadlines) > 2 * len(self._futures) + 64:
+            self._deadlines = [entry for entry in self._deadlines if self._futures.get(entry[2]) is entry[3]]
+            heapq.heapify(self._deadlines)
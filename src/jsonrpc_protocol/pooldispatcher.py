@@ -0,0 +1,140 @@
+import concurrent.futures
+import pickle
+import typing
+
+from jsonrpc_protocol.dispatcher import Dispatcher
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.instrumentation import Instrumentation
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.entity import Entity
+from jsonrpc_protocol.protocol.notification import Notification
+from jsonrpc_protocol.protocol.request import Request
+
+_FAILED = (False, None)
+_FAILED_PICKLE = pickle.dumps(_FAILED)
+
+
+def _run(calls: typing.List[typing.Tuple[typing.Callable, tuple, dict]], isolate: bool) -> typing.List[object]:
+    # Executed in the worker, exceptions are reported instead of raised so
+    # one failing element does not abort the whole chunk. For process pools
+    # each outcome is pickled on its own, an unpicklable result then only
+    # fails its element instead of the pickling of the whole chunk.
+    outcomes = []
+
+    for function, args, kwargs in calls:
+        try:
+            outcome = True, function(*args, **kwargs)
+        except Exception:
+            outcome = _FAILED
+
+        if isolate:
+            try:
+                outcome = pickle.dumps(outcome)
+            except Exception:
+                outcome = _FAILED_PICKLE
+
+        outcomes.append(outcome)
+
+    return outcomes
+
+
+class PoolDispatcher(Dispatcher):
+    # Handlers must be picklable (module level functions) when a process
+    # pool is used.
+
+    def __init__(self,
+                 executor: concurrent.futures.Executor,
+                 chunk_size: int = 1,
+                 instrumentation: typing.Optional[Instrumentation] = None):
+        super().__init__(instrumentation)
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self._isolate = isinstance(executor, concurrent.futures.ProcessPoolExecutor)
+
+    def dispatch(self, entity: Entity) -> typing.Optional[Entity]:
+        if entity.is_batch:
+            return self._dispatch_batch(entity)
+
+        return self._dispatch_single(entity)
+
+    def _call(self, entity: typing.Union[Request, Notification]) -> typing.Optional[Entity]:
+        bound = self._bind(entity)
+
+        if not isinstance(bound, tuple):
+            return bound
+
+        handler, args, kwargs = bound
+        future = self.executor.submit(_run, [(handler.function, args, kwargs)], self._isolate)
+        return self._merge(entity, self._outcomes(future, 1)[0])
+
+    def _dispatch_batch(self, batch: Batch) -> typing.Optional[Batch]:
+        # Binding happens here so that only (function, args, kwargs) tuples
+        # travel to the workers, replies are built from the ordered results.
+        replies = []
+        calls = []
+        entities = []
+
+        for element in batch:
+            if element.is_request or element.is_notification:
+                bound = self._bind(element)
+
+                if isinstance(bound, tuple):
+                    handler, args, kwargs = bound
+                    replies.append(len(calls))
+                    calls.append((handler.function, args, kwargs))
+                    entities.append(element)
+                    continue
+
+                replies.append(bound)
+            else:
+                replies.append(self._dispatch_single(element))
+
+        # Chunks are submitted one by one rather than through map(), whose
+        # iterator stops at the first chunk the pool fails to deliver.
+        size = max(self.chunk_size, 1)
+        chunks = [calls[start:start + size] for start in range(0, len(calls), size)]
+        futures = [self.executor.submit(_run, chunk, self._isolate) for chunk in chunks]
+        results = []
+
+        for chunk, future in zip(chunks, futures):
+            results.extend(self._outcomes(future, len(chunk)))
+
+        responses = Batch()
+
+        for reply in replies:
+            if isinstance(reply, int):
+                reply = self._merge(entities[reply], results[reply])
+
+            if reply is not None:
+                responses.elements.append(reply)
+
+        return responses if responses.elements else None
+
+    def _outcomes(self, future: concurrent.futures.Future, count: int) -> typing.List[typing.Tuple[bool, object]]:
+        # A chunk the pool could not run or return fails all its elements,
+        # a result the parent cannot unpickle fails only its own.
+        try:
+            outcomes = future.result()
+        except Exception:
+            return [_FAILED] * count
+
+        if not self._isolate:
+            return outcomes
+
+        return [PoolDispatcher._unpickle(outcome) for outcome in outcomes]
+
+    @staticmethod
+    def _unpickle(outcome: bytes) -> typing.Tuple[bool, object]:
+        try:
+            return pickle.loads(outcome)
+        except Exception:
+            return _FAILED
+
+    def _merge(self, entity: typing.Union[Request, Notification],
+               outcome: typing.Tuple[bool, object]) -> typing.Optional[Entity]:
+        succeeded, result = outcome
+
+        if not succeeded:
+            return self._reply_error(entity, ErrorCode.InternalError)
+
+        return self._reply(entity, result)
@@ -4,4 +4,5 @@ from .notification import Notification
 from .request import Request
 from .response import Response
 from .batch import Batch
+from .batch import LazyBatch
 from .error import Error
@@ -1,18 +1,81 @@
-import json
+import typing
 
+from jsonrpc_protocol.backend import JsonBackend
 from jsonrpc_protocol.protocol.entity import Entity
 
 
 class Batch(Entity):
+    __slots__ = ("elements",)
+    kind = "batch"
+    is_batch = True
 
     def __init__(self):
-        super().__init__(is_batch=True)
-        self.elements: list = []
+        self.elements: typing.Iterable[Entity] = []
 
-    def dump(self) -> str:
-        data = []
+    def __iter__(self) -> typing.Iterator[Entity]:
+        return iter(self.elements)
 
-        for entity in self.elements:
-            data.append(entity.dump())
+    def __len__(self) -> int:
+        return len(self.elements)
 
-        return json.dumps(data)
+    def to_object(self) -> list:
+        return [entity.to_object() for entity in self.elements]
+
+    def dump_fragments(self,
+                       backend: typing.Union[str, JsonBackend, None] = None,
+                       min_fragment_size: int = 4096) -> typing.List[bytes]:
+        # Small pieces are joined so the list stays well below IOV_MAX,
+        # large pieces (big results) are passed through untouched.
+        backend = JsonBackend.get(backend)
+
+        if backend.binary:
+            return [backend.dumps_bytes(self.to_object())]
+
+        fragments = []
+        pending = [b"["]
+        pending_size = 1
+
+        for index, entity in enumerate(self.elements):
+            if index:
+                pending.append(backend.item_separator)
+                pending_size += len(backend.item_separator)
+
+            for fragment in entity.dump_fragments(backend):
+                if len(fragment) < min_fragment_size:
+                    pending.append(fragment)
+                    pending_size += len(fragment)
+                    continue
+
+                if pending_size:
+                    fragments.append(b"".join(pending))
+                    pending = []
+                    pending_size = 0
+
+                fragments.append(fragment)
+
+        pending.append(b"]")
+        fragments.append(b"".join(pending))
+        return fragments
+
+
+class LazyBatch(Batch):
+    # Entities are built one by one while iterating, so they can only be
+    # consumed once. Only entity construction is deferred: the decoder has
+    # already turned the whole array into Python objects, so peak memory
+    # is the decoded batch, not one element. Each decoded element is
+    # released once its entity has been handed out.
+    __slots__ = ("_size",)
+
+    def __init__(self, raw: list, parse: typing.Callable[[object], Entity]):
+        self._size = len(raw)
+        self.elements = LazyBatch._consume(raw, parse)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _consume(raw: list, parse: typing.Callable[[object], Entity]) -> typing.Iterator[Entity]:
+        for index in range(len(raw)):
+            element = raw[index]
+            raw[index] = None
+            yield parse(element)
@@ -1,16 +1,48 @@
+import typing
+
+from jsonrpc_protocol.backend import JsonBackend
+
+
 class Entity:
+    __slots__ = ()
+
+    # Message type name used by counters and logs.
+    kind = "entity"
 
-    def __init__(self,
-                 is_batch: bool = False,
-                 is_error: bool = False,
-                 is_notification: bool = False,
-                 is_request: bool = False,
-                 is_response: bool = False):
-        self.is_batch = is_batch
-        self.is_error = is_error
-        self.is_notification = is_notification
-        self.is_request = is_request
-        self.is_response = is_response
-
-    def dump(self) -> str:
+    is_batch = False
+    is_error = False
+    is_notification = False
+    is_request = False
+    is_response = False
+
+    def to_object(self) -> object:
         raise NotImplementedError("Implement me")
+
+    def dump(self, backend: typing.Union[str, JsonBackend, None] = None) -> str:
+        return JsonBackend.get(backend).dumps(self.to_object())
+
+    def dump_bytes(self, backend: typing.Union[str, JsonBackend, None] = None) -> bytes:
+        return JsonBackend.get(backend).dumps_bytes(self.to_object())
+
+    def dump_into(self,
+                  buffer: typing.Union[bytearray, memoryview],
+                  offset: int = 0,
+                  backend: typing.Union[str, JsonBackend, None] = None) -> int:
+        if offset > len(buffer):
+            raise ValueError("Offset beyond the end of the buffer")
+
+        written = 0
+
+        for fragment in self.dump_fragments(backend):
+            size = len(fragment)
+
+            if isinstance(buffer, memoryview) and offset + written + size > len(buffer):
+                raise ValueError("Buffer too small")
+
+            buffer[offset + written:offset + written + size] = fragment
+            written += size
+
+        return written
+
+    def dump_fragments(self, backend: typing.Union[str, JsonBackend, None] = None) -> typing.List[bytes]:
+        return [self.dump_bytes(backend)]
@@ -1,44 +1,126 @@
 import typing
-import json
 
+from jsonrpc_protocol.backend import JsonBackend
 from jsonrpc_protocol.enum.protocolversion import ProtocolVersion
 from jsonrpc_protocol.enum.errorcode import ErrorCode
 from jsonrpc_protocol.protocol.entity import Entity
 
+_MESSAGES = {
+    ErrorCode.ParseError: "Parse error",
+    ErrorCode.InvalidRequest: "Invalid Request",
+    ErrorCode.MethodNotFound: "Method not found",
+    ErrorCode.InvalidParams: "Invalid params",
+    ErrorCode.InternalError: "Internal error",
+}
+
+_SERVER_ERROR_MESSAGE = "Server error"
+_UNKNOWN_ERROR_MESSAGE = "Unknown error message from error code"
+_NULL_ID = b"null}"
+
 
 class Error(Entity):
+    __slots__ = ("jsonrpc", "code", "id", "received", "notification")
+    kind = "error"
+    is_error = True
 
-    def __init__(self, jsonrpc: ProtocolVersion, error_code: int, id: typing.Optional[str] = None):
-        super().__init__(is_error=True)
+    def __init__(self,
+                 jsonrpc: ProtocolVersion,
+                 error_code: int,
+                 id: typing.Optional[str] = None,
+                 received: bool = False,
+                 notification: bool = False):
         self.jsonrpc = jsonrpc
-        self.error = {
-            "code": error_code,
-            "message": self._error_code_to_message(error_code),
-        }
+        self.code = error_code
         self.id = id
+        # True for error responses read from a peer, False for errors the
+        # local side raised about the input, which are answered.
+        self.received = received
+        # Raised about a notification, which is never answered either.
+        self.notification = notification
+
+    @property
+    def is_answered(self) -> bool:
+        return not (self.received or self.notification)
+
+    @property
+    def error(self) -> dict:
+        # Plain int, codecs without IntEnum support see the same object.
+        return {
+            "code": int(self.code),
+            "message": self._error_code_to_message(self.code),
+        }
 
-    def dump(self) -> str:
-        return json.dumps({
+    def to_object(self) -> dict:
+        if self.jsonrpc is ProtocolVersion.v1:
+            return {
+                "result": None,
+                "error": self.error,
+                "id": self.id
+            }
+
+        return {
             "jsonrpc": self.jsonrpc.value,
             "error": self.error,
             "id": self.id
-        })
+        }
+
+    def dump(self, backend: typing.Union[str, JsonBackend, None] = None) -> str:
+        backend = JsonBackend.get(backend)
+
+        if backend.binary:
+            return backend.dumps(self.to_object())
+
+        return self.dump_bytes(backend).decode("utf-8")
+
+    def dump_bytes(self, backend: typing.Union[str, JsonBackend, None] = None) -> bytes:
+        # Everything up to the id is a constant per backend, version and code.
+        backend = JsonBackend.get(backend)
+        template = _TEMPLATES.get((backend.name, self.jsonrpc, self.code))
+
+        if template is None:
+            # Codes outside the predefined and server error ranges have no
+            # template, they are rare and encoded whole.
+            if backend.binary or not (self.code in _MESSAGES or Error._is_server_error(self.code)):
+                return backend.dumps_bytes(self.to_object())
+
+            template = Error._template(backend, self.jsonrpc, self.code)
+
+        if self.id is None:
+            return template + _NULL_ID
+
+        if type(self.id) is int:
+            return template + str(self.id).encode("ascii") + b"}"
+
+        return template + backend.dumps_bytes(self.id) + b"}"
+
+    @staticmethod
+    def _template(backend: JsonBackend, jsonrpc: ProtocolVersion, error_code: int) -> bytes:
+        # Only predefined and server error codes get here, at most 105 per
+        # backend and version, so the template table stays bounded.
+        encoded = backend.dumps_bytes(Error(jsonrpc, error_code).to_object())
+        template = _TEMPLATES[(backend.name, jsonrpc, error_code)] = encoded[:-len(_NULL_ID)]
+        return template
+
+    @staticmethod
+    def _is_server_error(error_code: int) -> bool:
+        return -32099 <= error_code <= -32000
 
     @staticmethod
     def _error_code_to_message(error_code: int):
-        if error_code == ErrorCode.InvalidRequest:
-            return "Invalid Request"
+        message = _MESSAGES.get(error_code)
+
+        if message is not None:
+            return message
 
-        if error_code == ErrorCode.ParseError:
-            return "Parse error"
+        if Error._is_server_error(error_code):
+            return _SERVER_ERROR_MESSAGE
 
-        if error_code == ErrorCode.InternalError:
-            return "Internal error"
+        return _UNKNOWN_ERROR_MESSAGE
 
-        if error_code == ErrorCode.MethodNotFound:
-            return "Method not found"
 
-        if -32000 >= error_code <= -32099:
-            return "Server error"
+_TEMPLATES: typing.Dict[typing.Tuple[str, ProtocolVersion, int], bytes] = {}
 
-        return "Unknown error message from error code"
+for _backend in JsonBackend.available(binary=False):
+    for _jsonrpc in ProtocolVersion:
+        for _error_code in ErrorCode:
+            Error._template(JsonBackend.get(_backend), _jsonrpc, _error_code)
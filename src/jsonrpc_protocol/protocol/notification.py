@@ -1,27 +1,35 @@
-import json
-
 from jsonrpc_protocol.protocol.params import Params
 from jsonrpc_protocol.enum.protocolversion import ProtocolVersion
 from jsonrpc_protocol.protocol.entity import Entity
 
 
 class Notification(Entity):
+    __slots__ = ("jsonrpc", "method", "params")
+    kind = "notification"
+    is_notification = True
 
     def __init__(self, jsonrpc: ProtocolVersion, method: str, params: Params = None):
-        super().__init__(is_notification=True)
         self.jsonrpc = jsonrpc
         self.method = method
         self.params = params  # Optional Parameter
 
-    def dump(self) -> str:
+    def to_object(self) -> dict:
+        if self.jsonrpc is ProtocolVersion.v1:
+            # 1.0 notifications are requests with a null id, params is required.
+            return {
+                "method": self.method,
+                "params": self.params.data if self.params else [],
+                "id": None
+            }
+
         if self.params:
-            return json.dumps({
+            return {
                 "jsonrpc": self.jsonrpc.value,
                 "method": self.method,
                 "params": self.params.data
-            })
+            }
 
-        return json.dumps({
+        return {
             "jsonrpc": self.jsonrpc.value,
             "method": self.method
-        })
+        }
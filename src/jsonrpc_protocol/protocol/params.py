@@ -1,17 +1,18 @@
 
 
 class Params:
+    __slots__ = ("data",)
 
     def __init__(self, params: object):
-        self.data = params
-        self.is_array = False
-        self.is_dict = False
+        if not isinstance(params, (list, dict)):
+            raise ValueError("Invalid params")
 
-        if isinstance(params, dict):
-            self.is_dict = True
+        self.data = params
 
-        if isinstance(params, list):
-            self.is_array = True
+    @property
+    def is_array(self) -> bool:
+        return isinstance(self.data, list)
 
-        if not self.is_array and not self.is_dict:
-            raise ValueError("Invalid params")
+    @property
+    def is_dict(self) -> bool:
+        return isinstance(self.data, dict)
@@ -1,23 +1,30 @@
-import json
-
 from jsonrpc_protocol.protocol.params import Params
 from jsonrpc_protocol.enum.protocolversion import ProtocolVersion
 from jsonrpc_protocol.protocol.entity import Entity
 
 
 class Request(Entity):
+    __slots__ = ("jsonrpc", "method", "params", "id")
+    kind = "request"
+    is_request = True
 
     def __init__(self, jsonrpc: ProtocolVersion, method: str, params: Params, id: str):
-        super().__init__(is_request=True)
         self.jsonrpc = jsonrpc
         self.method = method
         self.params = params
         self.id = id
 
-    def dump(self) -> str:
-        return json.dumps({
+    def to_object(self) -> dict:
+        if self.jsonrpc is ProtocolVersion.v1:
+            return {
+                "method": self.method,
+                "params": self.params.data,
+                "id": self.id
+            }
+
+        return {
             "jsonrpc": self.jsonrpc.value,
             "method": self.method,
             "params": self.params.data,
             "id": self.id
-        })
\ No newline at end of file
+        }
\ No newline at end of file
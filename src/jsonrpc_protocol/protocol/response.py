@@ -1,20 +1,78 @@
-import json
+import typing
 
+from jsonrpc_protocol.backend import JsonBackend
 from jsonrpc_protocol.enum.protocolversion import ProtocolVersion
 from jsonrpc_protocol.protocol.entity import Entity
 
 
 class Response(Entity):
+    __slots__ = ("jsonrpc", "result", "id")
+    kind = "response"
+    is_response = True
 
     def __init__(self, jsonrpc: ProtocolVersion, result: object, id: str):
-        super().__init__(is_response=True)
         self.jsonrpc = jsonrpc
         self.result = result
         self.id = id
 
-    def dump(self) -> str:
-        return json.dumps({
+    def to_object(self) -> dict:
+        if self.jsonrpc is ProtocolVersion.v1:
+            return {
+                "result": self.result,
+                "error": None,
+                "id": self.id
+            }
+
+        return {
             "jsonrpc": self.jsonrpc.value,
             "result": self.result,
             "id": self.id
-        })
\ No newline at end of file
+        }
+
+    def dump_fragments(self, backend: typing.Union[str, JsonBackend, None] = None) -> typing.List[bytes]:
+        # The result is encoded on its own and never concatenated with the
+        # envelope, which is small and cached per backend.
+        backend = JsonBackend.get(backend)
+        key = (backend.name, self.jsonrpc)
+        head = _HEADS.get(key)
+
+        if head is None:
+            if backend.binary:
+                return [backend.dumps_bytes(self.to_object())]
+
+            head = _HEADS[key] = Response._head(backend, self.jsonrpc)
+
+        error = _ERROR_MEMBERS.get(key)
+
+        if error is None:
+            error = _ERROR_MEMBERS[key] = Response._error_member(backend, self.jsonrpc)
+
+        tail = b"".join([
+            error,
+            backend.item_separator, backend.dumps_bytes("id"), backend.key_separator, backend.dumps_bytes(self.id), b"}",
+        ])
+
+        return [head, backend.dumps_bytes(self.result), tail]
+
+    @staticmethod
+    def _head(backend: JsonBackend, jsonrpc: ProtocolVersion) -> bytes:
+        if jsonrpc is ProtocolVersion.v1:
+            return b"".join([b"{", backend.dumps_bytes("result"), backend.key_separator])
+
+        return b"".join([
+            b"{", backend.dumps_bytes("jsonrpc"), backend.key_separator, backend.dumps_bytes(jsonrpc.value),
+            backend.item_separator, backend.dumps_bytes("result"), backend.key_separator,
+        ])
+
+    @staticmethod
+    def _error_member(backend: JsonBackend, jsonrpc: ProtocolVersion) -> bytes:
+        # 1.0 responses always carry a null error, 2.0 ones omit it.
+        if jsonrpc is ProtocolVersion.v1:
+            return b"".join([backend.item_separator, backend.dumps_bytes("error"), backend.key_separator,
+                             backend.dumps_bytes(None)])
+
+        return b""
+
+
+_HEADS: typing.Dict[typing.Tuple[str, ProtocolVersion], bytes] = {}
+_ERROR_MEMBERS: typing.Dict[typing.Tuple[str, ProtocolVersion], bytes] = {}
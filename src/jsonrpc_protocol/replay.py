@@ -0,0 +1,165 @@
+import concurrent.futures
+import mmap
+import os
+import time
+import typing
+
+from jsonrpc_protocol.backend import JsonBackend
+from jsonrpc_protocol.protocol.entity import Entity
+from jsonrpc_protocol.serializer import Serializer
+
+_NEWLINE = b"\n"
+_WHITESPACE = b" \t\r\n"
+
+# Backends whose loads() reads a memoryview directly, probed once per name.
+_ACCEPTS_VIEW: typing.Dict[str, bool] = {}
+
+
+def _accepts_view(backend: JsonBackend) -> bool:
+    accepts = _ACCEPTS_VIEW.get(backend.name)
+
+    if accepts is None:
+        try:
+            accepts = backend.loads(memoryview(b"0")) == 0
+        except (TypeError, ValueError):
+            accepts = False
+
+        _ACCEPTS_VIEW[backend.name] = accepts
+
+    return accepts
+
+
+def _count_range(task: tuple) -> typing.Tuple[typing.Dict[str, int], int]:
+    # Executed in the worker, only counts travel back to the parent.
+    path, start, end, backend, lazy_batch, schemas, limits = task
+    serializer = Serializer(backend, lazy_batch, schemas=schemas, limits=limits)
+    counts: typing.Dict[str, int] = {}
+    records = LogReplay._tally(LogReplay(path, serializer).entities(start, end), counts)
+    return counts, records
+
+
+class ReplayResult:
+    __slots__ = ("counts", "records", "bytes", "seconds")
+
+    def __init__(self, counts: typing.Dict[str, int], records: int, bytes: int, seconds: float):
+        self.counts = counts
+        self.records = records
+        self.bytes = bytes
+        self.seconds = seconds
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes / 1e6 / self.seconds if self.seconds > 0 else 0.0
+
+
+class LogReplay:
+    # Replays JSONL traffic archives, one message per line. The file is
+    # memory mapped and records are handed to the parser as slices of the
+    # mapping, which are zero copy views for backends that accept them.
+
+    def __init__(self, path: typing.Union[str, os.PathLike], serializer: typing.Optional[Serializer] = None):
+        self.path = os.fspath(path)
+        self.serializer = serializer if serializer is not None else Serializer()
+
+        if JsonBackend.get(self.serializer.backend).binary:
+            raise ValueError("LogReplay reads JSON lines, binary codecs need their own framing")
+
+    def __iter__(self) -> typing.Iterator[Entity]:
+        return self.entities()
+
+    @property
+    def size(self) -> int:
+        return os.path.getsize(self.path)
+
+    def entities(self, start: int = 0, end: typing.Optional[int] = None) -> typing.Iterator[Entity]:
+        # Yields the records starting inside [start, end), so adjacent
+        # ranges split the file without losing or repeating a line.
+        with open(self.path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                parse = self.serializer.parse
+                size = len(mapping)
+                end = size if end is None else min(end, size)
+                position = LogReplay._align(mapping, start)
+                view = memoryview(mapping) if _accepts_view(JsonBackend.get(self.serializer.backend)) else mapping
+
+                try:
+                    while position < end:
+                        newline = mapping.find(_NEWLINE, position)
+                        stop = size if newline < 0 else newline
+
+                        if LogReplay._is_blank(mapping, position, stop):
+                            position = stop + 1
+                            continue
+
+                        entity = parse(view[position:stop])
+                        position = stop + 1
+                        yield entity
+                finally:
+                    if view is not mapping:
+                        view.release()
+
+    def replay(self, processes: int = 1) -> ReplayResult:
+        started = time.perf_counter()
+        counts: typing.Dict[str, int] = {}
+
+        if processes <= 1:
+            records = LogReplay._tally(self.entities(), counts)
+        else:
+            records = self._replay_parallel(processes, counts)
+
+        return ReplayResult(counts, records, self.size, time.perf_counter() - started)
+
+    def _replay_parallel(self, processes: int, counts: typing.Dict[str, int]) -> int:
+        # Workers get byte ranges and build their own serializer with the
+        # backend name, schemas and limits, instrumentation stays in the parent.
+        serializer = self.serializer
+        size = self.size
+        step = -(-size // processes) if size else 0
+        backend = JsonBackend.get(serializer.backend).name
+        tasks = [(self.path, start, min(start + step, size), backend, serializer.lazy_batch, serializer.schemas,
+                  serializer.limits) for start in range(0, size, step or 1)]
+        records = 0
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+            for partial, count in executor.map(_count_range, tasks):
+                records += count
+
+                for kind, value in partial.items():
+                    counts[kind] = counts.get(kind, 0) + value
+
+        return records
+
+    @staticmethod
+    def _tally(entities: typing.Iterable[Entity], counts: typing.Dict[str, int]) -> int:
+        records = 0
+
+        for entity in entities:
+            counts[entity.kind] = counts.get(entity.kind, 0) + 1
+            records += 1
+
+        return records
+
+    @staticmethod
+    def _align(mapping: mmap.mmap, start: int) -> int:
+        # A range owns the lines that start inside it, so skip forward to
+        # the first line start at or after the offset.
+        if start <= 0:
+            return 0
+
+        newline = mapping.find(_NEWLINE, start - 1)
+        return len(mapping) if newline < 0 else newline + 1
+
+    @staticmethod
+    def _is_blank(mapping: mmap.mmap, start: int, stop: int) -> bool:
+        # Only the first byte is checked in the common case, records start
+        # with '{' or '['.
+        while start < stop:
+            if mapping[start] not in _WHITESPACE:
+                return False
+
+            start += 1
+
+        return True
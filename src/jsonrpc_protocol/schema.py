@@ -0,0 +1,367 @@
+import inspect
+import types
+import typing
+
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.protocol.entity import Entity
+from jsonrpc_protocol.protocol.error import Error
+
+ParamsValidator = typing.Callable[[object], bool]
+
+
+def _is_integer(value: object) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: object) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+_TYPES: typing.Dict[str, ParamsValidator] = {
+    "null": lambda value: value is None,
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": _is_integer,
+    "number": _is_number,
+    "string": lambda value: isinstance(value, str),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+}
+
+_HINTS = {
+    type(None): "null",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+    list: "array",
+    dict: "object",
+}
+
+_UNION_TYPE = getattr(types, "UnionType", None)
+
+
+def _accept(value: object) -> bool:
+    return True
+
+
+class SchemaRegistry:
+
+    def __init__(self):
+        self._validators: typing.Dict[str, ParamsValidator] = {}
+        # What each validator was compiled from, pickling sends these and
+        # compiles again, compiled validators are closures.
+        self._sources: typing.Dict[str, typing.Tuple[str, object]] = {}
+
+    def __reduce__(self):
+        return SchemaRegistry._restore, (self._sources,)
+
+    @staticmethod
+    def _restore(sources: typing.Dict[str, typing.Tuple[str, object]]) -> "SchemaRegistry":
+        registry = SchemaRegistry()
+
+        for method, (register, source) in sources.items():
+            getattr(registry, register)(method, source)
+
+        return registry
+
+    def __contains__(self, method: str) -> bool:
+        return method in self._validators
+
+    def get(self, method: str) -> typing.Optional[ParamsValidator]:
+        return self._validators.get(method)
+
+    def register(self, method: str, schema: dict):
+        # The schema describes the params value, omitted params are not checked.
+        validator = SchemaRegistry.compile(schema)
+        self._validators[method] = lambda params: params is None or validator(params)
+        self._sources[method] = ("register", schema)
+
+    def register_hints(self, method: str, function: typing.Callable):
+        self._validators[method] = SchemaRegistry.compile_hints(function)
+        self._sources[method] = ("register_hints", function)
+
+    def check(self, entity: Entity) -> Entity:
+        validator = self._validators.get(entity.method)
+
+        if validator is None or validator(entity.params.data if entity.params is not None else None):
+            return entity
+
+        if entity.is_notification:
+            return Error(entity.jsonrpc, ErrorCode.InvalidParams, notification=True)
+
+        return Error(entity.jsonrpc, ErrorCode.InvalidParams, entity.id)
+
+    @staticmethod
+    def compile(schema: dict) -> ParamsValidator:
+        checks = []
+
+        for keyword, argument in schema.items():
+            compiler = _KEYWORDS.get(keyword)
+
+            if compiler is None:
+                if keyword in _ANNOTATIONS:
+                    continue
+
+                raise ValueError("Unsupported schema keyword " + repr(keyword))
+
+            check = compiler(argument, schema)
+
+            if check is not None:
+                checks.append(check)
+
+        if not checks:
+            return _accept
+
+        if len(checks) == 1:
+            return checks[0]
+
+        checks = tuple(checks)
+
+        def validate(value: object) -> bool:
+            for check in checks:
+                if not check(value):
+                    return False
+
+            return True
+
+        return validate
+
+    @staticmethod
+    def compile_hints(function: typing.Callable) -> ParamsValidator:
+        hints = typing.get_type_hints(function)
+        positional = []
+        named = {}
+        required = set()
+        rest = None
+        extra = None
+
+        for parameter in inspect.signature(function).parameters.values():
+            validator = SchemaRegistry.compile(SchemaRegistry.hint_to_schema(hints.get(parameter.name, object)))
+            has_default = parameter.default is not inspect.Parameter.empty
+
+            if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
+                positional.append((validator, has_default))
+
+            if parameter.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY):
+                named[parameter.name] = validator
+
+                if not has_default:
+                    required.add(parameter.name)
+
+            if parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+                rest = validator
+
+            if parameter.kind == inspect.Parameter.VAR_KEYWORD:
+                extra = validator
+
+        minimum = sum(1 for _, has_default in positional if not has_default)
+        item_validators = tuple(validator for validator, _ in positional)
+        maximum = None if rest is not None else len(item_validators)
+
+        def validate(params: object) -> bool:
+            if params is None:
+                return minimum == 0 and not required
+
+            if isinstance(params, list):
+                if len(params) < minimum or (maximum is not None and len(params) > maximum):
+                    return False
+
+                for validator, value in zip(item_validators, params):
+                    if not validator(value):
+                        return False
+
+                if rest is not None:
+                    for value in params[len(item_validators):]:
+                        if not rest(value):
+                            return False
+
+                return True
+
+            if not required.issubset(params):
+                return False
+
+            for name, value in params.items():
+                validator = named.get(name, extra)
+
+                if validator is None or not validator(value):
+                    return False
+
+            return True
+
+        return validate
+
+    @staticmethod
+    def hint_to_schema(hint: object) -> dict:
+        if hint in _HINTS:
+            return {"type": _HINTS[hint]}
+
+        origin = typing.get_origin(hint)
+        arguments = typing.get_args(hint)
+
+        if origin is typing.Union or (_UNION_TYPE is not None and origin is _UNION_TYPE):
+            schemas = [SchemaRegistry.hint_to_schema(argument) for argument in arguments]
+
+            if all(set(schema) == {"type"} for schema in schemas):
+                return {"type": [schema["type"] for schema in schemas]}
+
+            return {}
+
+        if origin is list:
+            if arguments:
+                return {"type": "array", "items": SchemaRegistry.hint_to_schema(arguments[0])}
+
+            return {"type": "array"}
+
+        if origin is dict:
+            return {"type": "object"}
+
+        return {}
+
+
+def _compile_type(argument: typing.Union[str, typing.List[str]], schema: dict) -> ParamsValidator:
+    if isinstance(argument, str):
+        return _TYPES[argument]
+
+    checks = tuple(_TYPES[name] for name in argument)
+    return lambda value: any(check(value) for check in checks)
+
+
+def _json_equal(value: object, other: object) -> bool:
+    # Python's == lets True equal 1, JSON keeps booleans and numbers apart,
+    # also inside arrays and objects.
+    if isinstance(value, bool) or isinstance(other, bool):
+        return type(value) is type(other) and value == other
+
+    if isinstance(value, list):
+        return isinstance(other, list) and len(value) == len(other) and all(map(_json_equal, value, other))
+
+    if isinstance(value, dict):
+        return isinstance(other, dict) and value.keys() == other.keys() \
+            and all(_json_equal(item, other[name]) for name, item in value.items())
+
+    return value == other
+
+
+def _compile_enum(argument: list, schema: dict) -> ParamsValidator:
+    allowed = tuple(argument)
+    return lambda value: any(_json_equal(value, item) for item in allowed)
+
+
+def _compile_const(argument: object, schema: dict) -> ParamsValidator:
+    return lambda value: _json_equal(value, argument)
+
+
+def _compile_properties(argument: dict, schema: dict) -> ParamsValidator:
+    properties = tuple((name, SchemaRegistry.compile(subschema)) for name, subschema in argument.items())
+
+    def validate(value: object) -> bool:
+        if not isinstance(value, dict):
+            return True
+
+        for name, validator in properties:
+            if name in value and not validator(value[name]):
+                return False
+
+        return True
+
+    return validate
+
+
+def _compile_required(argument: list, schema: dict) -> ParamsValidator:
+    required = frozenset(argument)
+    return lambda value: not isinstance(value, dict) or required.issubset(value)
+
+
+def _compile_additional_properties(argument: typing.Union[bool, dict], schema: dict) -> ParamsValidator:
+    known = frozenset(schema.get("properties", ()))
+
+    if argument is True:
+        return None
+
+    if argument is False:
+        return lambda value: not isinstance(value, dict) or known.issuperset(value)
+
+    validator = SchemaRegistry.compile(argument)
+
+    def validate(value: object) -> bool:
+        if not isinstance(value, dict):
+            return True
+
+        for name, item in value.items():
+            if name not in known and not validator(item):
+                return False
+
+        return True
+
+    return validate
+
+
+def _compile_items(argument: typing.Union[dict, list], schema: dict) -> ParamsValidator:
+    if isinstance(argument, list):
+        return _compile_prefix_items(argument, schema)
+
+    validator = SchemaRegistry.compile(argument)
+
+    def validate(value: object) -> bool:
+        if not isinstance(value, list):
+            return True
+
+        for item in value:
+            if not validator(item):
+                return False
+
+        return True
+
+    return validate
+
+
+def _compile_prefix_items(argument: list, schema: dict) -> ParamsValidator:
+    validators = tuple(SchemaRegistry.compile(subschema) for subschema in argument)
+
+    def validate(value: object) -> bool:
+        if not isinstance(value, list):
+            return True
+
+        for validator, item in zip(validators, value):
+            if not validator(item):
+                return False
+
+        return True
+
+    return validate
+
+
+def _compile_bound(size: typing.Callable[[object], bool], compare: typing.Callable[[object, object], bool]):
+    def compiler(argument: object, schema: dict) -> ParamsValidator:
+        return lambda value: not size(value) or compare(value, argument)
+
+    return compiler
+
+
+def _compile_length_bound(kind: type, compare: typing.Callable[[int, int], bool]):
+    def compiler(argument: int, schema: dict) -> ParamsValidator:
+        return lambda value: not isinstance(value, kind) or compare(len(value), argument)
+
+    return compiler
+
+
+_KEYWORDS = {
+    "type": _compile_type,
+    "enum": _compile_enum,
+    "const": _compile_const,
+    "properties": _compile_properties,
+    "required": _compile_required,
+    "additionalProperties": _compile_additional_properties,
+    "items": _compile_items,
+    "prefixItems": _compile_prefix_items,
+    "minItems": _compile_length_bound(list, lambda length, bound: length >= bound),
+    "maxItems": _compile_length_bound(list, lambda length, bound: length <= bound),
+    "minLength": _compile_length_bound(str, lambda length, bound: length >= bound),
+    "maxLength": _compile_length_bound(str, lambda length, bound: length <= bound),
+    "minimum": _compile_bound(_is_number, lambda value, bound: value >= bound),
+    "maximum": _compile_bound(_is_number, lambda value, bound: value <= bound),
+    "exclusiveMinimum": _compile_bound(_is_number, lambda value, bound: value > bound),
+    "exclusiveMaximum": _compile_bound(_is_number, lambda value, bound: value < bound),
+}
+
+_ANNOTATIONS = frozenset(("$schema", "$id", "title", "description", "default", "examples"))
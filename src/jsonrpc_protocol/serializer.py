@@ -1,99 +1,210 @@
-import json
-from json import JSONDecodeError
+import typing
 
 from jsonrpc_protocol.enum import ProtocolVersion
 from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.enum import MessageType
 from jsonrpc_protocol.protocol import Params
 from jsonrpc_protocol.protocol.entity import Entity
 from jsonrpc_protocol.protocol.notification import Notification
 from jsonrpc_protocol.protocol.response import Response
 from jsonrpc_protocol.protocol.request import Request
 from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.batch import LazyBatch
 from jsonrpc_protocol.protocol.error import Error
-from jsonrpc_protocol.validator import Validator
+from jsonrpc_protocol.backend import JsonBackend
+from jsonrpc_protocol.classifier import Classifier
+from jsonrpc_protocol.instrumentation import Instrumentation
+from jsonrpc_protocol.limits import Limits
+from jsonrpc_protocol.schema import SchemaRegistry
 
+_V1_VALUE = ProtocolVersion.v1.value
+_V2_VALUE = ProtocolVersion.v2.value
 
-class Serializer:
 
-    @staticmethod
-    def parse(json_data: str, protocol_version: ProtocolVersion = ProtocolVersion.v2) -> Entity:
+class _SharedMethod:
+    # Lets Serializer.parse(...) keep working on the class itself by
+    # binding to a shared default instance which follows the global backend.
+
+    def __init__(self, function: typing.Callable):
+        self.function = function
+
+    def __get__(self, instance: typing.Optional["Serializer"], owner: type):
+        if instance is None:
+            instance = owner._shared
+
+        return self.function.__get__(instance, owner)
+
+
+class Serializer:
+    _shared: "Serializer"
+
+    def __init__(self,
+                 backend: typing.Union[str, JsonBackend, None] = None,
+                 lazy_batch: bool = False,
+                 schemas: typing.Optional[SchemaRegistry] = None,
+                 instrumentation: typing.Optional[Instrumentation] = None,
+                 limits: typing.Optional[Limits] = None):
+        self.backend = backend
+        self.lazy_batch = lazy_batch
+        self.schemas = schemas
+        self.limits = limits
+        self.instrumentation = None
+        self.instrument(instrumentation)
+
+    def instrument(self, instrumentation: typing.Optional[Instrumentation]):
+        # Wrappers live on the instance, the uninstrumented path stays as is.
+        for name in Serializer._INSTRUMENTED:
+            self.__dict__.pop(name, None)
+
+        self.instrumentation = instrumentation
+
+        if instrumentation is not None:
+            self.parse = instrumentation.wrap_parse(self.parse)
+
+            for name in Serializer._INSTRUMENTED[1:]:
+                setattr(self, name, instrumentation.wrap_dump(getattr(self, name)))
+
+    @_SharedMethod
+    def parse(self,
+              json_data: typing.Union[str, bytes, bytearray],
+              protocol_version: ProtocolVersion = ProtocolVersion.v2) -> Entity:
+
+        backend = JsonBackend.get(self.backend)
+        limits = self.limits
+
+        # Limits are checked on the raw payload, an oversized message is
+        # rejected before anything is decoded.
+        if limits is not None and limits.violation(json_data, backend.binary) is not None:
+            return Error(protocol_version, ErrorCode.InvalidRequest)
+
+        # Input too deep for the decoder is a parse error, as the stdlib
+        # decoder reports it. A tighter max_depth has already been checked.
+        if backend.max_depth is not None \
+                and (limits is None or limits.max_depth is None or limits.max_depth > backend.max_depth) \
+                and backend.too_deep(json_data):
+            return Error(protocol_version, ErrorCode.ParseError)
 
         try:
-            json_data = json.loads(json_data)
-        except JSONDecodeError:
+            json_data = backend.loads(json_data)
+        except (ValueError, RecursionError):
             return Error(protocol_version, ErrorCode.ParseError)
 
-        if isinstance(json_data, dict):
-            try:
-                protocol_version = ProtocolVersion.from_str(json_data["jsonrpc"])
+        return self.parse_object(json_data, protocol_version)
 
-                if Serializer._is_request(json_data, protocol_version):
-                    return Request(protocol_version, json_data["method"], Params(json_data["params"]), json_data["id"])
+    @_SharedMethod
+    def dump(self, entity: Entity) -> str:
+        return entity.dump(JsonBackend.get(self.backend))
 
-                if Serializer._is_response(json_data, protocol_version):
-                    return Response(protocol_version, json_data["result"], json_data["id"])
+    @_SharedMethod
+    def dump_bytes(self, entity: Entity) -> bytes:
+        return entity.dump_bytes(JsonBackend.get(self.backend))
 
-                if Serializer._is_notification(json_data, protocol_version):
-                    if "params" in json_data:
-                        return Notification(protocol_version, json_data["method"], Params(json_data["params"]))
+    @_SharedMethod
+    def dump_into(self, entity: Entity, buffer: typing.Union[bytearray, memoryview], offset: int = 0) -> int:
+        return entity.dump_into(buffer, offset, JsonBackend.get(self.backend))
 
-                    return Notification(protocol_version, json_data["method"])
+    @_SharedMethod
+    def dump_fragments(self, entity: Entity) -> typing.List[bytes]:
+        return entity.dump_fragments(JsonBackend.get(self.backend))
 
-                if Serializer._is_error(json_data, protocol_version):
-                    error_content = json_data["error"]
-                    return Error(protocol_version, error_content["code"], json_data["id"])
+    @_SharedMethod
+    def parse_object(self, json_data: object, protocol_version: ProtocolVersion = ProtocolVersion.v2) -> Entity:
 
-            except NotImplementedError:
-                pass
-            except KeyError:
-                pass
-            except ValueError:
+        if isinstance(json_data, dict):
+            try:
+                # 1.0 messages carry no version member.
+                protocol_version = ProtocolVersion.from_str(json_data.get("jsonrpc", _V1_VALUE))
+                message_type = Classifier.classify(json_data, protocol_version)
+                builder = Serializer._BUILDERS[message_type]
+
+                if builder is not None:
+                    entity = builder(json_data, protocol_version)
+
+                    if self.schemas is not None and message_type in Serializer._CALLS:
+                        return self.schemas.check(entity)
+
+                    return entity
+
+            except (NotImplementedError, KeyError, TypeError, ValueError):
                 pass
 
         elif Serializer._is_batch(json_data, protocol_version):
-            if not json_data:
+            if not json_data or self.limits is not None and self.limits.max_batch_length is not None \
+                    and len(json_data) > self.limits.max_batch_length:
                 return Error(protocol_version, ErrorCode.InvalidRequest)
 
+            if self.lazy_batch:
+                return LazyBatch(json_data, self._parse_element)
+
             batch = Batch()
 
             for element in json_data:
-                batch.elements.append(Serializer.parse(json.dumps(element)))
+                batch.elements.append(self._parse_element(element))
 
             return batch
 
-        if isinstance(json_data, dict) and "id" in json_data:
-            return Error(protocol_version, ErrorCode.InvalidRequest, json_data["id"])
+        if isinstance(json_data, dict):
+            # Without a version member only a valid 1.0 shape is read as
+            # 1.0, anything else is answered as an invalid 2.0 request.
+            if "jsonrpc" not in json_data:
+                protocol_version = ProtocolVersion.v2
+
+            if "id" in json_data:
+                return Error(protocol_version, ErrorCode.InvalidRequest, json_data["id"])
 
         return Error(protocol_version, ErrorCode.InvalidRequest)
 
+    def _parse_element(self, json_data: object) -> Entity:
+        # Every element must be an object, a nested array is not a batch.
+        if not isinstance(json_data, dict):
+            return Error(ProtocolVersion.v2, ErrorCode.InvalidRequest)
+
+        # Batches only exist in 2.0, elements are never read as 1.0.
+        if json_data.get("jsonrpc") != _V2_VALUE:
+            return Error(ProtocolVersion.v2, ErrorCode.InvalidRequest, json_data.get("id"))
+
+        return self.parse_object(json_data)
+
     @staticmethod
     def _is_batch(json_data: object, protocol: ProtocolVersion) -> bool:
         return isinstance(json_data, list) and protocol == ProtocolVersion.v2
 
     @staticmethod
-    def _is_error(json_data: dict, protocol: ProtocolVersion) -> bool:
-        return Validator.validate_jsonrpc_from_json(json_data, protocol) \
-            and Validator.validate_error_from_json(json_data) \
-            and Validator.validate_id_from_json(json_data) \
-            and protocol == ProtocolVersion.v2
+    def _build_request(json_data: dict, protocol_version: ProtocolVersion) -> Request:
+        return Request(protocol_version, json_data["method"], Params(json_data["params"]), json_data["id"])
 
     @staticmethod
-    def _is_notification(json_data: dict, protocol: ProtocolVersion) -> bool:
-        return (Validator.validate_jsonrpc_from_json(json_data, protocol)
-                and Validator.validate_method_from_json(json_data)) \
-            or (Validator.validate_jsonrpc_from_json(json_data, protocol)
-                and Validator.validate_method_from_json(json_data)
-                and Validator.validate_params_from_json(json_data))
+    def _build_response(json_data: dict, protocol_version: ProtocolVersion) -> Response:
+        return Response(protocol_version, json_data["result"], json_data["id"])
 
     @staticmethod
-    def _is_request(json_data: dict, protocol: ProtocolVersion) -> bool:
-        return Validator.validate_jsonrpc_from_json(json_data, protocol) \
-            and Validator.validate_method_from_json(json_data) \
-            and Validator.validate_params_from_json(json_data) \
-            and Validator.validate_id_from_json(json_data)
+    def _build_notification(json_data: dict, protocol_version: ProtocolVersion) -> Notification:
+        if "params" in json_data:
+            return Notification(protocol_version, json_data["method"], Params(json_data["params"]))
+
+        return Notification(protocol_version, json_data["method"])
 
     @staticmethod
-    def _is_response(data: dict, protocol: ProtocolVersion) -> bool:
-        return Validator.validate_jsonrpc_from_json(data, protocol) \
-            and Validator.validate_result_from_json(data) \
-            and Validator.validate_id_from_json(data)
+    def _build_error(json_data: dict, protocol_version: ProtocolVersion) -> Error:
+        error_code = json_data["error"]["code"]
+
+        # JSON-RPC requires an integer code, true and false are not one.
+        if not isinstance(error_code, int) or isinstance(error_code, bool):
+            raise ValueError("Invalid error code")
+
+        return Error(protocol_version, error_code, json_data["id"], received=True)
+
+    _CALLS = (MessageType.Request, MessageType.Notification)
+
+    _INSTRUMENTED = ("parse", "dump", "dump_bytes", "dump_into", "dump_fragments")
+
+    _BUILDERS = {
+        MessageType.Invalid: None,
+        MessageType.Request: _build_request.__func__,
+        MessageType.Response: _build_response.__func__,
+        MessageType.Notification: _build_notification.__func__,
+        MessageType.Error: _build_error.__func__,
+    }
+
+
+Serializer._shared = Serializer()
@@ -0,0 +1,229 @@
+import re
+import typing
+
+from jsonrpc_protocol.backend import JsonBackend
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.enum import ProtocolVersion
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.entity import Entity
+from jsonrpc_protocol.serializer import Serializer
+
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+_NON_WHITESPACE = re.compile(rb'[^ \t\r\n]')
+_TOKEN_END = re.compile(rb'[ \t\r\n"{\[]')
+
+_QUOTE = ord('"')
+_BACKSLASH = ord('\\')
+_OPEN = frozenset(b'{[')
+_NEWLINE = b'\n'
+
+
+class StreamParser:
+
+    def __init__(self, serializer: typing.Optional[Serializer] = None, newline_delimited: bool = False):
+        self.serializer = serializer if serializer is not None else Serializer()
+
+        if JsonBackend.get(self.serializer.backend).binary:
+            raise ValueError("StreamParser frames JSON text, binary codecs need their own framing")
+
+        self.newline_delimited = newline_delimited
+        self._buffer = bytearray()
+        self._position = 0       # first byte not scanned yet
+        self._value_start = -1   # start of the value being scanned, -1 between values
+        self._depth = 0
+        self._in_string = False
+        self._oversized = False  # the value in progress was rejected, its bytes are skipped
+
+    def feed(self, chunk: bytes) -> typing.List[Entity]:
+        self._buffer += chunk
+
+        if self.newline_delimited:
+            entities = self._split_lines()
+        else:
+            entities = self._scan_values()
+
+        limits = self.serializer.limits
+
+        if self._oversized or limits is not None and limits.max_bytes is not None \
+                and self.buffered > limits.max_bytes:
+            self._discard(entities)
+
+        self._compact()
+        return entities
+
+    def close(self) -> typing.List[Entity]:
+        # Whatever is left can never become a complete message.
+        remainder = self._buffer[self._pending_start():]
+        oversized = self._oversized
+        self.reset()
+
+        if remainder.strip() and not oversized:
+            return [self.serializer.parse(remainder)]
+
+        return []
+
+    def reset(self):
+        self._buffer = bytearray()
+        self._position = 0
+        self._value_start = -1
+        self._depth = 0
+        self._in_string = False
+        self._oversized = False
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer) - self._pending_start()
+
+    def _pending_start(self) -> int:
+        return self._value_start if self._value_start >= 0 else self._position
+
+    def _split_lines(self) -> typing.List[Entity]:
+        entities = []
+        buffer = self._buffer
+        start = self._position
+
+        while True:
+            end = buffer.find(_NEWLINE, start)
+
+            if end < 0:
+                break
+
+            if self._oversized:
+                self._oversized = False
+            elif _NON_WHITESPACE.search(buffer, start, end):
+                entities.append(self.serializer.parse(buffer[start:end]))
+
+            start = end + 1
+
+        self._position = start
+        return entities
+
+    def _scan_values(self) -> typing.List[Entity]:
+        entities = []
+        buffer = self._buffer
+        end = len(buffer)
+        position = self._position
+        value_start = self._value_start
+        depth = self._depth
+        in_string = self._in_string
+
+        while position < end:
+            if in_string:
+                match = _STRING_SPECIAL.search(buffer, position)
+
+                if match is None:
+                    position = end
+                    break
+
+                position = match.start()
+
+                if buffer[position] == _BACKSLASH:
+                    if position + 1 >= end:
+                        break
+
+                    position += 2
+                    continue
+
+                in_string = False
+                position += 1
+
+                if depth == 0:
+                    self._emit(entities, value_start, position)
+                    value_start = -1
+
+            elif depth == 0:
+                match = _NON_WHITESPACE.search(buffer, position)
+
+                if match is None:
+                    position = end
+                    break
+
+                position = match.start()
+                value_start = position
+                character = buffer[position]
+
+                if character in _OPEN:
+                    depth = 1
+                    position += 1
+                elif character == _QUOTE:
+                    in_string = True
+                    position += 1
+                else:
+                    # A bare scalar or garbage, delimited by whitespace or the next value.
+                    match = _TOKEN_END.search(buffer, position + 1)
+
+                    if match is None:
+                        break
+
+                    position = match.start()
+                    self._emit(entities, value_start, position)
+                    value_start = -1
+
+            else:
+                match = _STRUCTURAL.search(buffer, position)
+
+                if match is None:
+                    position = end
+                    break
+
+                position = match.start()
+                character = buffer[position]
+                position += 1
+
+                if character == _QUOTE:
+                    in_string = True
+                elif character in _OPEN:
+                    depth += 1
+                else:
+                    depth -= 1
+
+                    if depth == 0:
+                        self._emit(entities, value_start, position)
+                        value_start = -1
+
+        self._position = position
+        self._value_start = value_start
+        self._depth = depth
+        self._in_string = in_string
+        return entities
+
+    def _emit(self, entities: typing.List[Entity], start: int, end: int):
+        if self._oversized:
+            self._oversized = False
+            return
+
+        entities.append(self.serializer.parse(self._buffer[start:end]))
+
+    def _discard(self, entities: typing.List[Entity]):
+        # The message in progress exceeds the size limit. It is answered
+        # once, its bytes are dropped as they arrive until it ends.
+        if not self._oversized:
+            self._oversized = True
+            entities.append(Error(ProtocolVersion.v2, ErrorCode.InvalidRequest))
+
+        if self.newline_delimited or self._depth == 0 and not self._in_string:
+            self._position = len(self._buffer)
+
+        if not self.newline_delimited:
+            self._value_start = self._position
+
+    def _compact(self):
+        # Drop consumed bytes only once they dominate the buffer, so each
+        # byte is moved a bounded number of times.
+        consumed = self._pending_start()
+
+        if consumed == 0:
+            return
+
+        if consumed == len(self._buffer):
+            self._buffer.clear()
+        elif consumed * 2 >= len(self._buffer):
+            del self._buffer[:consumed]
+        else:
+            return
+
+        self._position -= consumed
+
+        if self._value_start >= 0:
+            self._value_start -= consumed
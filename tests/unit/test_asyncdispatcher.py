@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+from jsonrpc_protocol.asyncdispatcher import AsyncDispatcher
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.response import Response
+from jsonrpc_protocol.serializer import Serializer
+
+import unittest
+
+
+class TestAsyncDispatcher(unittest.TestCase):
+
+    @staticmethod
+    def _dispatcher(max_concurrency=None) -> AsyncDispatcher:
+        dispatcher = AsyncDispatcher(max_concurrency)
+
+        @dispatcher.register
+        async def sleep(seconds):
+            await asyncio.sleep(seconds)
+            return seconds
+
+        @dispatcher.register
+        def subtract(minuend, subtrahend):
+            return minuend - subtrahend
+
+        @dispatcher.register
+        async def fail():
+            raise RuntimeError("boom")
+
+        return dispatcher
+
+    @staticmethod
+    def _sleep_batch(durations, notify=()) -> str:
+        elements = ['{"jsonrpc": "2.0", "method": "sleep", "params": [%s], "id": %d}' % (duration, index)
+                    for index, duration in enumerate(durations)]
+        elements += ['{"jsonrpc": "2.0", "method": "sleep", "params": [%s]}' % duration for duration in notify]
+        return "[" + ",".join(elements) + "]"
+
+    def test_concurrency_must_be_positive(self):
+        for max_concurrency in (0, -1):
+            self.assertRaises(ValueError, AsyncDispatcher, max_concurrency)
+
+    def test_single_request(self):
+        entity = Serializer.parse('{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}')
+        response = asyncio.run(self._dispatcher().dispatch(entity))
+        self.assertTrue(type(response) is Response)
+        self.assertEqual(response.result, 19)
+
+    def test_received_error_is_not_answered(self):
+        entity = Serializer.parse('{"jsonrpc": "2.0", "error": {"code": -32601, "message": "Not found"}, "id": 7}')
+        self.assertIsNone(asyncio.run(self._dispatcher().dispatch(entity)))
+
+        entity = Serializer.parse('{"jsonrpc": "2.0", "method"')
+        self.assertEqual(asyncio.run(self._dispatcher().dispatch(entity)).code, ErrorCode.ParseError)
+
+    def test_coroutine_failure_is_internal_error(self):
+        entity = Serializer.parse('{"jsonrpc": "2.0", "method": "fail", "params": [], "id": 1}')
+        response = asyncio.run(self._dispatcher().dispatch(entity))
+        self.assertEqual(response.code, ErrorCode.InternalError)
+
+    def test_batch_runs_concurrently(self):
+        durations = [0.2, 0.05, 0.1, 0.15] * 5
+        entity = Serializer.parse(self._sleep_batch(durations, notify=[0.2, 0.2]))
+
+        started = time.perf_counter()
+        response = asyncio.run(self._dispatcher().dispatch(entity))
+        elapsed = time.perf_counter() - started
+
+        self.assertTrue(type(response) is Batch)
+        self.assertEqual([element.id for element in response], list(range(len(durations))))
+        self.assertEqual([element.result for element in response], durations)
+        self.assertLess(elapsed, sum(durations) / 4)
+        self.assertGreaterEqual(elapsed, max(durations))
+
+    def test_batch_respects_concurrency_cap(self):
+        entity = Serializer.parse(self._sleep_batch([0.05] * 6))
+
+        started = time.perf_counter()
+        response = asyncio.run(self._dispatcher(max_concurrency=2).dispatch(entity))
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(len(response), 6)
+        self.assertGreaterEqual(elapsed, 0.15)
+
+    def test_lazy_batch_keeps_order_and_errors(self):
+        entity = Serializer(lazy_batch=True).parse(
+            '[{"jsonrpc": "2.0", "method": "sleep", "params": [0.02], "id": 1},'
+            '{"foo": "boo"},'
+            '{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 2}]')
+        response = asyncio.run(self._dispatcher(max_concurrency=2).dispatch(entity))
+        self.assertEqual([type(element) for element in response], [Response, Error, Response])
+        self.assertEqual([element.id for element in response], [1, None, 2])
+
+    def test_batch_of_notifications_has_no_response(self):
+        entity = Serializer.parse(self._sleep_batch([], notify=[0.01, 0.01]))
+        self.assertIsNone(asyncio.run(self._dispatcher().dispatch(entity)))
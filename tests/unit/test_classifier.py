@@ -0,0 +1,97 @@
+import itertools
+
+from jsonrpc_protocol.classifier import Classifier
+from jsonrpc_protocol.enum import MessageType
+from jsonrpc_protocol.enum import ProtocolVersion
+from jsonrpc_protocol.validator import Validator
+
+import unittest
+
+
+def _validator_chain(json_data: dict, protocol: ProtocolVersion) -> MessageType:
+    if Validator.validate_jsonrpc_from_json(json_data, protocol) \
+            and Validator.validate_method_from_json(json_data) \
+            and Validator.validate_params_from_json(json_data) \
+            and Validator.validate_id_from_json(json_data):
+        return MessageType.Request
+
+    if Validator.validate_jsonrpc_from_json(json_data, protocol) \
+            and Validator.validate_result_from_json(json_data) \
+            and Validator.validate_id_from_json(json_data):
+        return MessageType.Response
+
+    if Validator.validate_jsonrpc_from_json(json_data, protocol) \
+            and Validator.validate_method_from_json(json_data):
+        return MessageType.Notification
+
+    if Validator.validate_jsonrpc_from_json(json_data, protocol) \
+            and Validator.validate_error_from_json(json_data) \
+            and Validator.validate_id_from_json(json_data) \
+            and protocol == ProtocolVersion.v2:
+        return MessageType.Error
+
+    return MessageType.Invalid
+
+
+class TestClassifier(unittest.TestCase):
+    members = [
+        ("jsonrpc", ["2.0", "1.0", 2]),
+        ("method", ["subtract", 1]),
+        ("params", [[1, 2], None]),
+        ("id", [1]),
+        ("result", [19]),
+        ("error", [{"code": -32601}, "error"]),
+        ("foo", ["bar"]),
+    ]
+
+    def _messages(self):
+        options = [[None] + values for _, values in self.members]
+
+        for combination in itertools.product(*options):
+            yield {key: value for (key, _), value in zip(self.members, combination) if value is not None}
+
+    def test_classify_matches_validator_chain(self):
+        for message in self._messages():
+            protocol = ProtocolVersion.v2
+            self.assertEqual(Classifier.classify(message, protocol), _validator_chain(message, protocol), message)
+
+    def test_classify_message_types(self):
+        self.assertEqual(Classifier.classify(
+            {"jsonrpc": "2.0", "method": "a", "params": [], "id": 1}, ProtocolVersion.v2), MessageType.Request)
+        self.assertEqual(Classifier.classify(
+            {"jsonrpc": "2.0", "result": 1, "id": 1}, ProtocolVersion.v2), MessageType.Response)
+        self.assertEqual(Classifier.classify(
+            {"jsonrpc": "2.0", "method": "a"}, ProtocolVersion.v2), MessageType.Notification)
+        self.assertEqual(Classifier.classify(
+            {"jsonrpc": "2.0", "error": {"code": -32600}, "id": None}, ProtocolVersion.v2), MessageType.Error)
+        self.assertEqual(Classifier.classify(
+            {"jsonrpc": "2.0", "foo": "boo"}, ProtocolVersion.v2), MessageType.Invalid)
+
+    def test_classify_v1_message_types(self):
+        self.assertEqual(Classifier.classify(
+            {"method": "a", "params": [], "id": 1}, ProtocolVersion.v1), MessageType.Request)
+        self.assertEqual(Classifier.classify(
+            {"method": "a", "params": [], "id": None}, ProtocolVersion.v1), MessageType.Notification)
+        self.assertEqual(Classifier.classify(
+            {"result": 1, "error": None, "id": 1}, ProtocolVersion.v1), MessageType.Response)
+        self.assertEqual(Classifier.classify(
+            {"result": None, "error": {"code": -32600}, "id": 1}, ProtocolVersion.v1), MessageType.Error)
+        self.assertEqual(Classifier.classify(
+            {"jsonrpc": "1.0", "method": "a", "params": [], "id": 1}, ProtocolVersion.v1), MessageType.Request)
+
+        for message in ({"method": "a", "params": []},
+                        {"method": "a", "params": {"x": 1}, "id": 1},
+                        {"method": 1, "params": [], "id": 1},
+                        {"result": 1, "id": 1},
+                        {"result": 1, "error": {"code": -32600}, "id": 1},
+                        {"result": None, "error": "error", "id": 1},
+                        {"jsonrpc": "2.0", "method": "a", "params": [], "id": 1}):
+            self.assertEqual(Classifier.classify(message, ProtocolVersion.v1), MessageType.Invalid, message)
+
+    def test_protocol_version_from_str(self):
+        self.assertIs(ProtocolVersion.from_str("1.0"), ProtocolVersion.v1)
+        self.assertIs(ProtocolVersion.from_str("2.0"), ProtocolVersion.v2)
+
+        for version in ("", "1", "2", ".", "0", "2.0 ", 2.0, None, [], {}):
+            with self.assertRaises(NotImplementedError):
+                ProtocolVersion.from_str(version)
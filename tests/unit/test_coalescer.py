@@ -0,0 +1,69 @@
+import threading
+
+from jsonrpc_protocol.coalescer import BatchCoalescer
+from jsonrpc_protocol.dispatcher import Dispatcher
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.params import Params
+from jsonrpc_protocol.protocol.request import Request
+from jsonrpc_protocol.serializer import Serializer
+
+import unittest
+
+
+class TestBatchCoalescer(unittest.TestCase):
+
+    def setUp(self):
+        self.sent = []
+        self.dispatcher = Dispatcher()
+        self.dispatcher.register(lambda value: value * 2, name="double")
+        self.dispatcher.register(lambda: None, name="tick")
+
+    def _loopback(self, coalescer: BatchCoalescer):
+        def send(entity):
+            self.sent.append(entity)
+            response = self.dispatcher.dispatch(Serializer.parse(entity.dump_bytes()))
+
+            if response is not None:
+                coalescer.receive(Serializer.parse(response.dump_bytes()))
+
+        return send
+
+    def test_flush_by_size(self):
+        coalescer = BatchCoalescer(None, max_size=3, max_latency=60)
+        coalescer.send = self._loopback(coalescer)
+
+        futures = [coalescer.call("double", Params([index])) for index in range(3)]
+        coalescer.notify("tick")
+
+        self.assertEqual(len(self.sent), 1)
+        self.assertTrue(type(self.sent[0]) is Batch)
+        self.assertEqual([future.result(0).result for future in futures], [0, 2, 4])
+
+        coalescer.close()
+        self.assertEqual(len(self.sent), 2)
+        self.assertEqual(self.sent[1].method, "tick")
+
+    def test_flush_by_latency(self):
+        flushed = threading.Event()
+        coalescer = BatchCoalescer(None, max_size=100, max_latency=0.01)
+        loopback = self._loopback(coalescer)
+
+        def send(entity):
+            loopback(entity)
+            flushed.set()
+
+        coalescer.send = send
+        futures = [coalescer.call("double", Params([index])) for index in range(5)]
+
+        self.assertTrue(flushed.wait(5))
+        self.assertEqual(len(self.sent), 1)
+        self.assertEqual(len(self.sent[0]), 5)
+        self.assertEqual([future.result(5).result for future in futures], [0, 2, 4, 6, 8])
+
+    def test_single_call_is_not_wrapped(self):
+        coalescer = BatchCoalescer(None, max_size=100, max_latency=60)
+        coalescer.send = self._loopback(coalescer)
+        future = coalescer.call("double", Params([21]))
+        coalescer.flush()
+        self.assertTrue(type(self.sent[0]) is Request)
+        self.assertEqual(future.result(0).result, 42)
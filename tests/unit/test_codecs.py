@@ -0,0 +1,109 @@
+import marshal
+
+from jsonrpc_protocol.backend import JsonBackend
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.enum import ProtocolVersion
+from jsonrpc_protocol.parsecache import ParseCache
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.notification import Notification
+from jsonrpc_protocol.protocol.params import Params
+from jsonrpc_protocol.protocol.request import Request
+from jsonrpc_protocol.protocol.response import Response
+from jsonrpc_protocol.serializer import Serializer
+from jsonrpc_protocol.stream import StreamParser
+
+import unittest
+
+
+class TestBinaryCodec(unittest.TestCase):
+    # marshal stands in for a binary codec so the fallbacks are covered
+    # without msgpack or cbor2 installed.
+    codec = JsonBackend.binary_codec("marshal", marshal.loads, marshal.dumps)
+
+    def setUp(self):
+        self.serializer = Serializer(self.codec)
+
+    def _entities(self):
+        batch = Batch()
+        batch.elements = [Request(ProtocolVersion.v2, "sum", Params([1, 2]), 1),
+                          Notification(ProtocolVersion.v2, "update", Params({"a": 1.5}))]
+
+        return [
+            Request(ProtocolVersion.v2, "subtract", Params([42, 23]), 1),
+            Notification(ProtocolVersion.v2, "update"),
+            Response(ProtocolVersion.v2, [0.5, 1, 2 ** 40, -3], "a"),
+            Response(ProtocolVersion.v1, {"rows": [[1, 2], [3, 4]]}, 2),
+            Error(ProtocolVersion.v2, ErrorCode.MethodNotFound, 3),
+            Error(ProtocolVersion.v1, -32001),
+            batch,
+        ]
+
+    def test_round_trip(self):
+        for entity in self._entities():
+            payload = self.serializer.dump_bytes(entity)
+            self.assertEqual(marshal.loads(payload), entity.to_object())
+            self.assertEqual(b"".join(self.serializer.dump_fragments(entity)), payload)
+
+            buffer = bytearray(b"prefix")
+            self.assertEqual(self.serializer.dump_into(entity, buffer, 6), len(payload))
+            self.assertEqual(bytes(buffer), b"prefix" + payload)
+
+            parsed = self.serializer.parse(payload)
+            self.assertTrue(type(parsed) is type(entity))
+            self.assertEqual(parsed.to_object(), entity.to_object())
+
+    def test_available_keeps_text_and_binary_apart(self):
+        text = JsonBackend.available(binary=False)
+        binary = JsonBackend.available(binary=True)
+        self.assertIn("json", text)
+        self.assertFalse(any(JsonBackend.get(name).binary for name in text))
+        self.assertTrue(all(JsonBackend.get(name).binary for name in binary))
+        self.assertEqual(sorted(JsonBackend.available()), sorted(text + binary))
+
+    def test_text_dump_is_rejected(self):
+        for entity in self._entities():
+            with self.assertRaises(TypeError):
+                self.serializer.dump(entity)
+
+    def test_error_semantics(self):
+        for payload in (b"", b"\xff\x00", '{"jsonrpc": "2.0"}'):
+            entity = self.serializer.parse(payload)
+            self.assertTrue(type(entity) is Error)
+            self.assertEqual(entity.code, ErrorCode.ParseError)
+
+        entity = self.serializer.parse(marshal.dumps({"jsonrpc": "2.0", "foo": "boo", "id": 7}))
+        self.assertEqual(entity.code, ErrorCode.InvalidRequest)
+        self.assertEqual(entity.id, 7)
+
+        entity = self.serializer.parse(marshal.dumps([]))
+        self.assertEqual(entity.code, ErrorCode.InvalidRequest)
+
+    def test_parse_cache(self):
+        cache = ParseCache(self.serializer, templates=True)
+        payload = marshal.dumps({"jsonrpc": "2.0", "method": "ping", "params": [], "id": 1})
+        self.assertEqual(cache.parse(payload).id, 1)
+        self.assertEqual(cache.parse(payload).id, 1)
+        self.assertEqual(cache.stats["hits"], 1)
+
+    def test_text_framing_is_rejected(self):
+        with self.assertRaises(ValueError):
+            StreamParser(self.serializer)
+
+
+@unittest.skipUnless(JsonBackend.is_available("msgpack"), "msgpack is not installed")
+class TestMsgpackCodec(TestBinaryCodec):
+    codec = "msgpack"
+
+    def test_listed_as_binary(self):
+        self.assertIn(self.codec, JsonBackend.available(binary=True))
+        self.assertNotIn(self.codec, JsonBackend.available(binary=False))
+
+    def test_round_trip(self):
+        for entity in self._entities():
+            self.assertEqual(self.serializer.parse(self.serializer.dump_bytes(entity)).to_object(), entity.to_object())
+
+
+@unittest.skipUnless(JsonBackend.is_available("cbor"), "cbor2 is not installed")
+class TestCborCodec(TestMsgpackCodec):
+    codec = "cbor"
@@ -0,0 +1,107 @@
+from jsonrpc_protocol.dispatcher import Dispatcher
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.response import Response
+from jsonrpc_protocol.serializer import Serializer
+
+import unittest
+
+
+class TestDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.dispatcher = Dispatcher()
+        self.updates = []
+
+        @self.dispatcher.register
+        def subtract(minuend, subtrahend):
+            return minuend - subtrahend
+
+        @self.dispatcher.register(name="sum")
+        def add(*values):
+            return sum(values)
+
+        @self.dispatcher.register
+        def update(*values):
+            self.updates.append(values)
+
+        @self.dispatcher.register
+        def fail():
+            raise RuntimeError("boom")
+
+    def _dispatch(self, data: str):
+        return self.dispatcher.dispatch(Serializer.parse(data))
+
+    def test_positional_params(self):
+        entity = self._dispatch('{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}')
+        self.assertTrue(type(entity) is Response)
+        self.assertEqual(entity.result, 19)
+        self.assertEqual(entity.id, 1)
+
+    def test_named_params(self):
+        entity = self._dispatch(
+            '{"jsonrpc": "2.0", "method": "subtract", "params": {"subtrahend": 23, "minuend": 42}, "id": 3}')
+        self.assertEqual(entity.result, 19)
+
+    def test_var_positional_params(self):
+        entity = self._dispatch('{"jsonrpc": "2.0", "method": "sum", "params": [1, 2, 4], "id": "1"}')
+        self.assertEqual(entity.result, 7)
+
+    def test_method_not_found(self):
+        entity = self._dispatch('{"jsonrpc": "2.0", "method": "foobar", "params": [], "id": "1"}')
+        self.assertTrue(type(entity) is Error)
+        self.assertEqual(entity.code, ErrorCode.MethodNotFound)
+        self.assertEqual(entity.id, "1")
+
+    def test_invalid_params(self):
+        for params in ('[1]', '[1, 2, 3]', '{"minuend": 1}', '{"minuend": 1, "subtrahend": 2, "foo": 3}'):
+            entity = self._dispatch('{"jsonrpc": "2.0", "method": "subtract", "params": ' + params + ', "id": 1}')
+            self.assertTrue(type(entity) is Error, params)
+            self.assertEqual(entity.error, {"code": -32602, "message": "Invalid params"})
+
+    def test_internal_error(self):
+        entity = self._dispatch('{"jsonrpc": "2.0", "method": "fail", "params": [], "id": 1}')
+        self.assertEqual(entity.code, ErrorCode.InternalError)
+
+    def test_notification_has_no_response(self):
+        entity = self._dispatch('{"jsonrpc": "2.0", "method": "update", "params": [1, 2]}')
+        self.assertIsNone(entity)
+        self.assertEqual(self.updates, [(1, 2)])
+
+    def test_parse_error_is_answered(self):
+        entity = self._dispatch('{"jsonrpc": "2.0", "method"')
+        self.assertEqual(entity.code, ErrorCode.ParseError)
+
+    def test_received_error_is_not_answered(self):
+        # Echoing a peer's error response back could ping-pong forever.
+        data = '{"jsonrpc": "2.0", "error": {"code": -32601, "message": "Method not found"}, "id": 7}'
+        self.assertIsNone(self._dispatch(data))
+        self.assertIsNone(self._dispatch("[" + data + "]"))
+
+        entity = self._dispatch('[' + data + ', {"jsonrpc": "2.0", "result": 1}]')
+        self.assertEqual([element.code for element in entity], [ErrorCode.InvalidRequest])
+
+    def test_coroutine_handler_is_rejected(self):
+        async def wait():
+            pass
+
+        self.assertRaises(TypeError, self.dispatcher.register, wait)
+        self.assertNotIn("wait", self.dispatcher)
+
+    def test_batch(self):
+        entity = self._dispatch('['
+                                '{"jsonrpc": "2.0", "method": "sum", "params": [1,2,4], "id": "1"},'
+                                '{"jsonrpc": "2.0", "method": "update", "params": [7]},'
+                                '{"jsonrpc": "2.0", "method": "subtract", "params": [42,23], "id": "2"},'
+                                '{"foo": "boo"},'
+                                '{"jsonrpc": "2.0", "method": "foo.get", "params": {"name": "myself"}, "id": "5"}'
+                                ']')
+        self.assertTrue(type(entity) is Batch)
+        self.assertEqual([type(element) for element in entity], [Response, Response, Error, Error])
+        self.assertEqual([element.id for element in entity], ["1", "2", None, "5"])
+
+    def test_batch_of_notifications_has_no_response(self):
+        entity = self._dispatch('[{"jsonrpc": "2.0", "method": "update", "params": [1]},'
+                                '{"jsonrpc": "2.0", "method": "update", "params": [2]}]')
+        self.assertIsNone(entity)
@@ -0,0 +1,75 @@
+import asyncio
+
+from jsonrpc_protocol.asyncdispatcher import AsyncDispatcher
+from jsonrpc_protocol.dispatcher import Dispatcher
+from jsonrpc_protocol.instrumentation import Instrumentation
+from jsonrpc_protocol.serializer import Serializer
+
+import unittest
+
+
+class TestInstrumentation(unittest.TestCase):
+    Batch = ('[{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1},'
+             '{"jsonrpc": "2.0", "method": "update", "params": [1]},'
+             '{"foo": "boo"}]')
+
+    def test_serializer_and_dispatcher_metrics(self):
+        instrumentation = Instrumentation()
+        serializer = Serializer(instrumentation=instrumentation)
+        dispatcher = Dispatcher(instrumentation=instrumentation)
+        dispatcher.register(lambda minuend, subtrahend: minuend - subtrahend, name="subtract")
+        dispatcher.register(lambda value: None, name="update")
+
+        serializer.dump_bytes(dispatcher.dispatch(serializer.parse(self.Batch)))
+        serializer.dump(serializer.parse('{"jsonrpc": "2.0", "method"'))
+
+        snapshot = instrumentation.snapshot()
+        self.assertEqual(snapshot["parse_seconds"]["count"], 2)
+        self.assertEqual(snapshot["dump_seconds"]["count"], 2)
+        self.assertEqual(snapshot["batch_size"]["count"], 2)
+        self.assertEqual(snapshot["batch_size"]["buckets"][2], 1)
+        self.assertEqual(snapshot["call_seconds"]["subtract"]["count"], 1)
+        self.assertEqual(snapshot["call_seconds"]["update"]["count"], 1)
+        self.assertEqual(snapshot["messages"], {
+            "in/batch": 1, "in/request": 1, "in/notification": 1, "in/error": 2,
+            "out/batch": 1, "out/response": 1, "out/error": 2,
+        })
+        self.assertEqual(snapshot["errors"], {"in/-32600": 1, "in/-32700": 1, "out/-32600": 1, "out/-32700": 1})
+
+        text = instrumentation.prometheus()
+        self.assertIn('jsonrpc_call_seconds_count{method="subtract"} 1', text)
+        self.assertIn('jsonrpc_messages_total{direction="in",type="request"} 1', text)
+        self.assertIn('jsonrpc_errors_total{direction="out",code="-32700"} 1', text)
+        self.assertIn('jsonrpc_batch_size_bucket{le="+Inf"} 2', text)
+
+    def test_unknown_methods_share_one_histogram(self):
+        instrumentation = Instrumentation()
+        dispatcher = Dispatcher(instrumentation=instrumentation)
+        dispatcher.register(lambda: None, name="known")
+
+        for index in range(100):
+            dispatcher.dispatch(Serializer.parse('{"jsonrpc": "2.0", "method": "m%d", "params": [], "id": 1}' % index))
+        dispatcher.dispatch(Serializer.parse('{"jsonrpc": "2.0", "method": "known", "params": [], "id": 1}'))
+
+        calls = instrumentation.snapshot()["call_seconds"]
+        self.assertEqual(sorted(calls), ["<unknown>", "known"])
+        self.assertEqual(calls["<unknown>"]["count"], 100)
+
+    def test_disabled_leaves_methods_untouched(self):
+        serializer = Serializer(instrumentation=Instrumentation())
+        serializer.instrument(None)
+        self.assertNotIn("parse", vars(serializer))
+        self.assertEqual(Serializer().parse.__func__, serializer.parse.__func__)
+
+    def test_async_dispatcher_metrics(self):
+        instrumentation = Instrumentation()
+        dispatcher = AsyncDispatcher(instrumentation=instrumentation)
+
+        @dispatcher.register
+        async def echo(value):
+            return value
+
+        response = asyncio.run(dispatcher.dispatch(
+            Serializer.parse('{"jsonrpc": "2.0", "method": "echo", "params": [1], "id": 1}')))
+        self.assertEqual(response.result, 1)
+        self.assertEqual(instrumentation.snapshot()["call_seconds"]["echo"]["count"], 1)
@@ -0,0 +1,150 @@
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from jsonrpc_protocol.backend import JsonBackend
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.limits import Limits
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.request import Request
+from jsonrpc_protocol.serializer import Serializer
+from jsonrpc_protocol.stream import StreamParser
+
+import unittest
+
+
+class TestLimits(unittest.TestCase):
+    Request = b'{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}'
+
+    def test_violations(self):
+        limits = Limits(max_bytes=100, max_batch_length=2, max_depth=2, max_string_length=3)
+        cases = [
+            (b"[" + b" " * 100 + b"]", "max_bytes"),
+            ("é" * 60, "max_bytes"),
+            (b"[1, 2, 3]", "max_batch_length"),
+            (b"[1, 2]", None),
+            (b'["a,b", 1]', None),
+            (b"[[[1]]]", "max_depth"),
+            (b"[[1], {}]", None),
+            (b'{"a": [1, {"b": 2}]}', "max_depth"),
+            (b'["[[[", "]]]"]', None),
+            (b'"abcd"', "max_string_length"),
+            (b'{"a": 123456, "b": 1}', None),
+            (b'"a\\""', None),
+            (b'"a\\"\\""', "max_string_length"),
+            (b"[[[[[[", "max_depth"),
+        ]
+
+        for payload, expected in cases:
+            self.assertEqual(limits.violation(payload), expected, payload)
+            self.assertEqual(limits.violation(memoryview(bytes(payload, "utf-8") if isinstance(payload, str) else payload)),
+                             expected, payload)
+
+            if isinstance(payload, bytes):
+                self.assertEqual(limits.violation(payload.decode("utf-8")), expected, payload)
+
+    def test_no_limits(self):
+        self.assertIsNone(Limits().violation(b"[" * 10000))
+
+    def test_structure_checks_are_linear(self):
+        # Each nesting level used to cost another pass over the payload.
+        depth = 200000
+
+        for limits in (Limits(max_batch_length=10),
+                       Limits(max_depth=depth + 1),
+                       Limits(max_batch_length=10, max_depth=depth + 1)):
+            for payload in (b"[1," * depth + b"]" * depth, b"[[]," * depth + b"]" * depth):
+                started = time.perf_counter()
+                self.assertIsNone(limits.violation(payload))
+                self.assertLess(time.perf_counter() - started, 1.0)
+
+        self.assertEqual(Limits(max_batch_length=3).violation(b"[[1,2,3,4]," * 1000 + b"1,2,3" + b"]" * 1000),
+                         None)
+        self.assertEqual(Limits(max_batch_length=3).violation(b"[1," + b"[" * 1000 + b"]" * 1000 + b",2,3]"),
+                         "max_batch_length")
+
+    def test_serializer(self):
+        serializer = Serializer(limits=Limits(max_bytes=1024, max_batch_length=2, max_depth=4, max_string_length=64))
+        self.assertTrue(type(serializer.parse(self.Request)) is Request)
+        self.assertTrue(type(serializer.parse(b"[" + b", ".join([self.Request] * 2) + b"]")) is Batch)
+
+        for payload in (b"[" + b", ".join([self.Request] * 3) + b"]",
+                        b'{"jsonrpc": "2.0", "method": "a", "params": [[[[1]]]], "id": 1}',
+                        b'{"jsonrpc": "2.0", "method": "' + b"a" * 65 + b'", "params": [], "id": 1}',
+                        self.Request + b" " * 1024):
+            entity = serializer.parse(payload)
+            self.assertTrue(type(entity) is Error, payload)
+            self.assertEqual(entity.code, ErrorCode.InvalidRequest)
+            self.assertIsNone(entity.id)
+
+        entity = serializer.parse_object([{}, {}, {}])
+        self.assertEqual(entity.code, ErrorCode.InvalidRequest)
+
+    def test_recursion_is_a_parse_error(self):
+        entity = Serializer("json").parse(b"[" * 100000 + b"]" * 100000)
+        self.assertTrue(type(entity) is Error)
+        self.assertEqual(entity.code, ErrorCode.ParseError)
+
+        # Nesting the decoder accepts is answered without recursing.
+        for backend in JsonBackend.available(binary=False):
+            entity = Serializer(backend).parse(b"[" * 600 + b"]" * 600)
+            self.assertTrue(type(entity) is Batch, backend)
+            self.assertEqual(entity.elements[0].code, ErrorCode.InvalidRequest)
+
+    def test_default_backend_survives_deep_nesting(self):
+        # Run apart, a decoder without a recursion limit takes the whole
+        # interpreter down with it.
+        script = ("from jsonrpc_protocol import Serializer\n"
+                  "for backend in (None, 'json', 'ujson', 'orjson'):\n"
+                  "    try:\n"
+                  "        serializer = Serializer(backend)\n"
+                  "        print(int(serializer.parse(b'[' * 300000 + b']' * 300000).code))\n"
+                  "    except ValueError:\n"
+                  "        pass\n")
+        source = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "src")
+        path = os.pathsep.join(filter(None, (source, os.environ.get("PYTHONPATH"))))
+        environment = dict(os.environ, PYTHONPATH=path)
+        process = subprocess.run([sys.executable, "-c", script], env=environment, capture_output=True, timeout=60)
+
+        self.assertEqual(process.returncode, 0, process.stderr)
+        codes = process.stdout.split()
+        self.assertGreaterEqual(len(codes), 2)
+        self.assertEqual(set(codes), {str(int(ErrorCode.ParseError)).encode("ascii")})
+
+    def test_bounded_memory(self):
+        serializer = Serializer("json", limits=Limits(max_bytes=1 << 22, max_batch_length=100, max_depth=16))
+
+        for payload in (b"[" + b", ".join([self.Request] * 20000) + b"]",
+                        b"[" * 500000 + b"]" * 500000,
+                        b'{"a": ' * 200000 + b"1" + b"}" * 200000):
+            tracemalloc.start()
+
+            try:
+                entity = serializer.parse(payload)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            self.assertTrue(type(entity) is Error)
+            self.assertEqual(entity.code, ErrorCode.InvalidRequest)
+            # Temporary copies of the raw payload only, nothing is decoded.
+            self.assertLess(peak, 4 * len(payload))
+
+    def test_stream_buffer_is_bounded(self):
+        for newline_delimited in (False, True):
+            parser = StreamParser(Serializer(limits=Limits(max_bytes=256)), newline_delimited)
+            entities = parser.feed(self.Request + b"\n")
+            entities += parser.feed(b'{"jsonrpc": "2.0", "method": "flood", "params": ["')
+
+            for _ in range(1000):
+                entities += parser.feed(b"x" * 100)
+                self.assertLessEqual(parser.buffered, 356)
+
+            entities += parser.feed(b'"], "id": 2}\n' + self.Request + b"\n")
+            entities += parser.close()
+
+            self.assertEqual([type(entity) for entity in entities], [Request, Error, Request], newline_delimited)
+            self.assertEqual(entities[1].code, ErrorCode.InvalidRequest)
@@ -0,0 +1,100 @@
+from jsonrpc_protocol.parsecache import ParseCache
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.notification import Notification
+from jsonrpc_protocol.protocol.request import Request
+from jsonrpc_protocol.serializer import Serializer
+
+import pickle
+import unittest
+
+
+class TestParseCache(unittest.TestCase):
+    Heartbeat = '{"jsonrpc": "2.0", "method": "heartbeat"}'
+
+    def test_identical_payloads_are_parsed_once(self):
+        cache = ParseCache()
+        first = cache.parse(self.Heartbeat)
+        second = cache.parse(self.Heartbeat.encode("utf-8"))
+        self.assertTrue(type(first) is Notification)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.dump(), second.dump())
+        self.assertEqual(cache.stats["hits"], 1)
+        self.assertEqual(cache.stats["misses"], 1)
+
+    def test_batches_are_not_cached(self):
+        cache = ParseCache()
+        data = "[" + self.Heartbeat + ", " + self.Heartbeat + "]"
+        self.assertIsNot(cache.parse(data), cache.parse(data))
+        self.assertEqual(cache.stats["size"], 0)
+        self.assertEqual(cache.stats["misses"], 2)
+
+    def test_bounded_size(self):
+        cache = ParseCache(max_size=2)
+        for index in range(5):
+            cache.parse('{"jsonrpc": "2.0", "method": "m%d"}' % index)
+        self.assertEqual(cache.stats["size"], 2)
+
+    def test_template_rebinds_id(self):
+        cache = ParseCache(templates=True)
+        first = cache.parse('{"jsonrpc": "2.0", "method": "poll", "params": {"id": 7}, "id": 1}')
+        second = cache.parse('{"jsonrpc": "2.0", "method": "poll", "params": {"id": 7}, "id": 2}')
+        third = cache.parse('{"jsonrpc": "2.0", "method": "poll", "params": {"id": 7}, "id": "abc"}')
+
+        self.assertTrue(type(second) is Request)
+        self.assertEqual((first.id, second.id, third.id), (1, 2, "abc"))
+        self.assertIs(second.params.data, third.params.data)
+        self.assertEqual(second.dump(), Serializer.parse(
+            '{"jsonrpc": "2.0", "method": "poll", "params": {"id": 7}, "id": 2}').dump())
+        self.assertEqual(cache.stats["template_hits"], 2)
+
+    def test_cached_params_and_results_are_read_only(self):
+        cache = ParseCache(templates=True)
+        data = '{"jsonrpc": "2.0", "method": "push", "params": [1, 2, {"tags": ["a"]}], "id": %d}'
+
+        # The first caller owns what was parsed, the cache keeps a copy.
+        first = cache.parse(data % 1)
+        first.params.data.append(99)
+        first.id = 5
+
+        for entity in (cache.parse(data % 1), cache.parse(data % 2)):
+            self.assertTrue(isinstance(entity.params.data, list) and entity.params.is_array)
+            self.assertRaises(TypeError, entity.params.data.append, 99)
+            self.assertRaises(TypeError, entity.params.data[2]["tags"].append, "b")
+            self.assertRaises(TypeError, entity.params.data[2].update, {"tags": []})
+            self.assertRaises(TypeError, setattr, entity.params, "data", [])
+            entity.id = 5
+
+        self.assertEqual(cache.parse(data % 1).params.data, [1, 2, {"tags": ["a"]}])
+        self.assertEqual(cache.parse(data % 1).id, 1)
+        self.assertEqual(cache.parse(data % 2).id, 2)
+
+        cache.parse('{"jsonrpc": "2.0", "result": {"rows": [1]}, "id": 1}')
+        response = cache.parse('{"jsonrpc": "2.0", "result": {"rows": [1]}, "id": 1}')
+        self.assertRaises(TypeError, response.result["rows"].append, 2)
+
+        # Pool dispatchers pickle params, workers get plain lists and dicts.
+        params = pickle.loads(pickle.dumps(cache.parse(data % 1).params.data))
+        params[2]["tags"].append("b")
+        self.assertEqual(params, [1, 2, {"tags": ["a", "b"]}])
+
+    def test_template_keeps_received_errors_received(self):
+        cache = ParseCache(templates=True)
+        data = '{"jsonrpc": "2.0", "error": {"code": -32601, "message": "Method not found"}, "id": %d}'
+        first = cache.parse(data % 1)
+        second = cache.parse(data % 2)
+        self.assertEqual(cache.stats["template_hits"], 1)
+        self.assertEqual((first.received, second.received, second.id), (True, True, 2))
+
+    def test_template_keeps_invalid_ids_invalid(self):
+        cache = ParseCache(templates=True)
+        cache.parse('{"jsonrpc": "2.0", "method": "poll", "params": [], "id": 1}')
+        entity = cache.parse('{"jsonrpc": "2.0", "method": "poll", "params": [], "id": 01}')
+        self.assertTrue(type(entity) is Error)
+        self.assertEqual(entity.code, -32700)
+
+    def test_nested_id_is_not_a_template(self):
+        cache = ParseCache(templates=True)
+        cache.parse('{"jsonrpc": "2.0", "method": "poll", "params": {"id": 1}}')
+        entity = cache.parse('{"jsonrpc": "2.0", "method": "poll", "params": {"id": 2}}')
+        self.assertEqual(entity.params.data, {"id": 2})
+        self.assertEqual(cache.stats["template_hits"], 0)
@@ -0,0 +1,122 @@
+import random
+import threading
+import time
+
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.enum import ProtocolVersion
+from jsonrpc_protocol.pendingcalls import PendingCalls
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.params import Params
+from jsonrpc_protocol.protocol.response import Response
+from jsonrpc_protocol.serializer import Serializer
+
+import unittest
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestPendingCalls(unittest.TestCase):
+
+    def test_resolve_response_and_error(self):
+        pending = PendingCalls()
+        request, future = pending.call("subtract", Params([42, 23]))
+        other, other_future = pending.call("foobar")
+
+        self.assertEqual(pending.resolve(Serializer.parse(
+            '{"jsonrpc": "2.0", "result": 19, "id": %d}' % request.id)), [])
+        self.assertEqual(future.result(0).result, 19)
+
+        pending.resolve(Error(ProtocolVersion.v2, ErrorCode.MethodNotFound, other.id))
+        self.assertEqual(other_future.result(0).code, ErrorCode.MethodNotFound)
+        self.assertEqual(len(pending), 0)
+
+    def test_unmatched_entities_are_returned(self):
+        pending = PendingCalls()
+        parse_error = Error(ProtocolVersion.v2, ErrorCode.ParseError)
+        unknown = Response(ProtocolVersion.v2, 1, "unknown")
+        self.assertEqual(pending.resolve(parse_error), [parse_error])
+        self.assertEqual(pending.resolve(unknown), [unknown])
+
+    def test_only_responses_resolve_calls(self):
+        pending = PendingCalls()
+        request, future = pending.call("subtract", Params([42, 23]))
+        incoming = Serializer.parse('{"jsonrpc": "2.0", "method": "ping", "params": [], "id": %d}' % request.id)
+        unhashable = Serializer.parse('{"jsonrpc": "2.0", "result": 1, "id": [%d]}' % request.id)
+
+        self.assertEqual(pending.resolve(incoming), [incoming])
+        self.assertEqual(pending.resolve(unhashable), [unhashable])
+        self.assertFalse(future.done())
+        self.assertIn(request.id, pending)
+
+    def test_callbacks_can_issue_the_next_call(self):
+        pending = PendingCalls()
+        request, future = pending.call("first")
+        chained = []
+        future.add_done_callback(lambda done: chained.append(pending.call("second")))
+
+        # A callback running under the lock would deadlock on call().
+        worker = threading.Thread(target=pending.resolve, args=(Response(ProtocolVersion.v2, 1, request.id),),
+                                  daemon=True)
+        worker.start()
+        worker.join(5)
+
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(len(chained), 1)
+        self.assertIn(chained[0][0].id, pending)
+
+    def test_duplicate_id_is_rejected(self):
+        pending = PendingCalls()
+        pending.register("a")
+        self.assertRaises(ValueError, pending.register, "a")
+
+    def test_expire_times_out_calls(self):
+        clock = FakeClock()
+        pending = PendingCalls(timeout=5, clock=clock)
+        _, slow = pending.call("slow")
+        _, fast = pending.call("fast", timeout=1)
+        request, resolved = pending.call("resolved", timeout=1)
+        pending.resolve(Response(ProtocolVersion.v2, None, request.id))
+
+        clock.now = 2
+        self.assertEqual(pending.next_deadline(), 1)
+        self.assertEqual(pending.expire(), 1)
+        self.assertRaises(TimeoutError, fast.result, 0)
+        self.assertFalse(slow.done())
+        self.assertEqual(pending.next_deadline(), 5)
+
+        clock.now = 5
+        self.assertEqual(pending.expire(), 1)
+        self.assertRaises(TimeoutError, slow.result, 0)
+        self.assertIsNone(pending.next_deadline())
+        self.assertIsNone(resolved.result(0).result)
+
+    def test_hundred_thousand_in_flight_calls(self):
+        count = 100000
+        pending = PendingCalls(timeout=60)
+        calls = [pending.call("echo", Params([index])) for index in range(count)]
+        self.assertEqual(len(pending), count)
+
+        responses = [Response(ProtocolVersion.v2, request.params.data[0], request.id) for request, _ in calls]
+        random.Random(3).shuffle(responses)
+
+        started = time.perf_counter()
+        for response in responses[:count // 2]:
+            pending.resolve(response)
+
+        batch = Batch()
+        batch.elements = responses[count // 2:]
+        self.assertEqual(pending.resolve(batch), [])
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(len(pending), 0)
+        self.assertTrue(all(future.result(0).result == request.params.data[0] for request, future in calls))
+        self.assertEqual(pending.expire(time.monotonic() + 120), 0)
+        self.assertLess(elapsed, 10)
@@ -0,0 +1,80 @@
+import concurrent.futures
+import math
+import operator
+import threading
+
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.pooldispatcher import PoolDispatcher
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.response import Response
+from jsonrpc_protocol.serializer import Serializer
+
+import unittest
+
+
+def lock() -> threading.Lock:
+    return threading.Lock()
+
+
+class TestPoolDispatcher(unittest.TestCase):
+    Batch = ('['
+             '{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1},'
+             '{"jsonrpc": "2.0", "method": "sqrt", "params": [-1], "id": 2},'
+             '{"jsonrpc": "2.0", "method": "sqrt", "params": [16]},'
+             '{"foo": "boo"},'
+             '{"jsonrpc": "2.0", "method": "subtract", "params": [1], "id": 3},'
+             '{"jsonrpc": "2.0", "method": "missing", "params": [], "id": 4},'
+             '{"jsonrpc": "2.0", "method": "factorial", "params": [20], "id": 5}'
+             ']')
+
+    def _check(self, executor: concurrent.futures.Executor):
+        dispatcher = PoolDispatcher(executor, chunk_size=2)
+        dispatcher.register(operator.sub, name="subtract")
+        dispatcher.register(math.sqrt)
+        dispatcher.register(math.factorial)
+
+        response = dispatcher.dispatch(Serializer.parse(self.Batch))
+        self.assertTrue(type(response) is Batch)
+        self.assertEqual([type(element) for element in response], [Response, Error, Error, Error, Error, Response])
+        self.assertEqual([element.id for element in response], [1, 2, None, 3, 4, 5])
+        self.assertEqual([element.code for element in response if type(element) is Error], [
+            ErrorCode.InternalError, ErrorCode.InvalidRequest, ErrorCode.InvalidParams, ErrorCode.MethodNotFound])
+        self.assertEqual(response.elements[-1].result, math.factorial(20))
+
+        single = dispatcher.dispatch(
+            Serializer.parse('{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}'))
+        self.assertEqual(single.result, 19)
+
+    def test_unpicklable_result_fails_only_its_element(self):
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            dispatcher = PoolDispatcher(executor, chunk_size=2)
+            dispatcher.register(operator.sub, name="subtract")
+            dispatcher.register(lock)
+
+            response = dispatcher.dispatch(Serializer.parse(
+                '[{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1},'
+                '{"jsonrpc": "2.0", "method": "lock", "params": [], "id": 2},'
+                '{"jsonrpc": "2.0", "method": "subtract", "params": [2, 1], "id": 3}]'))
+            self.assertEqual([type(element) for element in response], [Response, Error, Response])
+            self.assertEqual(response.elements[1].code, ErrorCode.InternalError)
+            self.assertEqual(response.elements[2].result, 1)
+
+            single = dispatcher.dispatch(
+                Serializer.parse('{"jsonrpc": "2.0", "method": "lock", "params": [], "id": 4}'))
+            self.assertEqual((single.code, single.id), (ErrorCode.InternalError, 4))
+
+    def test_coroutine_handler_is_rejected(self):
+        async def wait():
+            pass
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertRaises(TypeError, PoolDispatcher(executor).register, wait)
+
+    def test_thread_pool(self):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            self._check(executor)
+
+    def test_process_pool(self):
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            self._check(executor)
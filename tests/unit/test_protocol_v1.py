@@ -0,0 +1,132 @@
+import json
+
+from jsonrpc_protocol.backend import JsonBackend
+from jsonrpc_protocol.protocol.params import Params
+from jsonrpc_protocol.protocol.request import Request
+from jsonrpc_protocol.protocol.response import Response
+from jsonrpc_protocol.protocol.notification import Notification
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.enum import ProtocolVersion
+from jsonrpc_protocol.serializer import Serializer
+from typing import cast
+
+import unittest
+
+
+class TestParserProtocolV1(unittest.TestCase):
+    backend = "json"
+
+    def setUp(self):
+        self._previous_backend = JsonBackend.get_default()
+        JsonBackend.set_default(self.backend)
+
+    def tearDown(self):
+        JsonBackend.set_default(self._previous_backend)
+
+    def _assert_dump(self, entity, expected):
+        if self.backend == "json":
+            self.assertEqual(entity.dump(), expected)
+        else:
+            self.assertEqual(json.loads(entity.dump()), json.loads(expected))
+
+        self.assertEqual(entity.dump_bytes(), entity.dump().encode("utf-8"))
+        self.assertEqual(b"".join(entity.dump_fragments()), entity.dump_bytes())
+
+    def test_json_rpc_request(self):
+        data = '{"method": "echo", "params": ["Hello JSON-RPC"], "id": 1}'
+        entity = Serializer.parse(data)
+        self.assertTrue(type(entity) is Request)
+        entity = cast(Request, entity)
+        self.assertEqual(entity.jsonrpc, ProtocolVersion.v1)
+        self.assertEqual(entity.method, "echo")
+        self.assertEqual(entity.params.data, ["Hello JSON-RPC"])
+        self.assertEqual(entity.id, 1)
+        self._assert_dump(entity, data)
+
+    def test_json_rpc_notification(self):
+        data = '{"method": "postMessage", "params": ["Hello all!"], "id": null}'
+        entity = Serializer.parse(data)
+        self.assertTrue(type(entity) is Notification)
+        entity = cast(Notification, entity)
+        self.assertEqual(entity.jsonrpc, ProtocolVersion.v1)
+        self.assertEqual(entity.params.data, ["Hello all!"])
+        self._assert_dump(entity, data)
+        self._assert_dump(Notification(ProtocolVersion.v1, "ping"), '{"method": "ping", "params": [], "id": null}')
+
+    def test_json_rpc_response(self):
+        data = '{"result": "Hello JSON-RPC", "error": null, "id": 1}'
+        entity = Serializer.parse(data)
+        self.assertTrue(type(entity) is Response)
+        entity = cast(Response, entity)
+        self.assertEqual(entity.jsonrpc, ProtocolVersion.v1)
+        self.assertEqual(entity.result, "Hello JSON-RPC")
+        self.assertEqual(entity.id, 1)
+        self._assert_dump(entity, data)
+
+    def test_json_rpc_error(self):
+        data = '{"result": null, "error": {"code": -32601, "message": "Method not found"}, "id": 5}'
+        entity = Serializer.parse(data)
+        self.assertTrue(type(entity) is Error)
+        entity = cast(Error, entity)
+        self.assertEqual(entity.jsonrpc, ProtocolVersion.v1)
+        self.assertEqual(entity.code, ErrorCode.MethodNotFound)
+        self.assertEqual(entity.id, 5)
+        self._assert_dump(entity, data)
+        self._assert_dump(Error(ProtocolVersion.v1, -32001, "a"),
+                          '{"result": null, "error": {"code": -32001, "message": "Server error"}, "id": "a"}')
+
+    def test_explicit_version_member(self):
+        entity = Serializer.parse('{"jsonrpc": "1.0", "method": "echo", "params": [], "id": 1}')
+        self.assertTrue(type(entity) is Request)
+        self.assertEqual(entity.jsonrpc, ProtocolVersion.v1)
+
+    def test_invalid_shapes_are_invalid_v2_requests(self):
+        for data in ('{"method": "echo", "id": 1}',
+                     '{"method": "echo", "params": {"a": 1}, "id": 1}',
+                     '{"result": 1, "id": 1}',
+                     '{"result": 1, "error": {"code": 1}, "id": 1}'):
+            entity = Serializer.parse(data)
+            self.assertTrue(type(entity) is Error, data)
+            self.assertEqual(entity.jsonrpc, ProtocolVersion.v2)
+            self.assertEqual(entity.code, ErrorCode.InvalidRequest)
+            self.assertEqual(entity.id, 1)
+
+    def test_inexact_versions_are_rejected(self):
+        for version in ('""', '"1"', '"."', '"2"', '"0"', '2.0'):
+            entity = Serializer.parse('{"jsonrpc": %s, "method": "echo", "params": [], "id": 1}' % version)
+            self.assertTrue(type(entity) is Error, version)
+            self.assertEqual(entity.code, ErrorCode.InvalidRequest)
+
+    def test_batch_elements_are_strict_v2(self):
+        entity = Serializer.parse('[{"method": "echo", "params": [], "id": 1}, '
+                                  '{"jsonrpc": "1.0", "method": "echo", "params": [], "id": 2}, '
+                                  '{"jsonrpc": "2.0", "method": "echo", "params": [], "id": 3}]')
+        self.assertTrue(type(entity) is Batch)
+        self.assertEqual([type(element) for element in entity], [Error, Error, Request])
+        self.assertEqual([element.id for element in entity], [1, 2, 3])
+        self.assertEqual(entity.elements[0].jsonrpc, ProtocolVersion.v2)
+
+        lazy = Serializer(lazy_batch=True).parse('[{"method": "echo", "params": [], "id": 1}]')
+        self.assertEqual([type(element) for element in lazy], [Error])
+
+    def test_dump_round_trip(self):
+        for entity in (Request(ProtocolVersion.v1, "echo", Params([1]), 1),
+                       Notification(ProtocolVersion.v1, "echo", Params([1])),
+                       Response(ProtocolVersion.v1, {"a": [1]}, "x"),
+                       Error(ProtocolVersion.v1, ErrorCode.InternalError, 2)):
+            parsed = Serializer.parse(entity.dump())
+            self.assertTrue(type(parsed) is type(entity))
+            self.assertEqual(parsed.to_object(), entity.to_object())
+            self.assertNotIn("jsonrpc", entity.to_object())
+
+
+@unittest.skipUnless(JsonBackend.is_available("orjson"), "orjson is not installed")
+class TestParserProtocolV1Orjson(TestParserProtocolV1):
+    backend = "orjson"
+
+
+@unittest.skipUnless(JsonBackend.is_available("ujson"), "ujson is not installed")
+class TestParserProtocolV1Ujson(TestParserProtocolV1):
+    backend = "ujson"
@@ -1,10 +1,16 @@
 import json
+import tracemalloc
 
+from jsonrpc_protocol.backend import JsonBackend
 from jsonrpc_protocol.protocol.request import Request
 from jsonrpc_protocol.protocol.response import Response
 from jsonrpc_protocol.protocol.notification import Notification
+from jsonrpc_protocol.protocol import error as error_module
 from jsonrpc_protocol.protocol.error import Error
 from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.batch import LazyBatch
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.enum import ProtocolVersion
 from jsonrpc_protocol.serializer import Serializer
 from typing import cast
 
@@ -12,9 +18,34 @@ import unittest
 
 
 class TestParserProtocolV2(unittest.TestCase):
+    backend = "json"
     InvalidRequest = '{"jsonrpc": "2.0", "error": {"code": -32600, "message": "Invalid Request"}, "id": null}'
     ParseError = '{"jsonrpc": "2.0", "error": {"code": -32700, "message": "Parse error"}, "id": null}'
 
+    def setUp(self):
+        self._previous_backend = JsonBackend.get_default()
+        JsonBackend.set_default(self.backend)
+
+    def tearDown(self):
+        JsonBackend.set_default(self._previous_backend)
+
+    def _assert_dump(self, entity, expected):
+        # Only the stdlib backend matches the whitespace of the spec examples.
+        if self.backend == "json":
+            self.assertEqual(entity.dump(), expected)
+        else:
+            self.assertEqual(json.loads(entity.dump()), json.loads(expected))
+
+        self.assertEqual(entity.dump_bytes(), entity.dump().encode("utf-8"))
+        self.assertEqual(b"".join(entity.dump_fragments()), entity.dump_bytes())
+
+        buffer = bytearray(b"prefix")
+        self.assertEqual(entity.dump_into(buffer, len(buffer)), len(entity.dump_bytes()))
+        self.assertEqual(bytes(buffer), b"prefix" + entity.dump_bytes())
+
+    def _assert_batch_dump(self, entity, expected_elements):
+        self._assert_dump(entity, "[" + ", ".join(expected_elements) + "]")
+
     def _is_entity_type_of(self, entity,
                            is_batch=False, is_error=False, is_notification=False, is_request=False, is_response=False):
         self.assertEqual(entity.is_request, is_request)
@@ -33,7 +64,7 @@ class TestParserProtocolV2(unittest.TestCase):
             "message": "Invalid Request",
         })
         self.assertEqual(entity.id, None)
-        self.assertEqual(entity.dump(), self.InvalidRequest)
+        self._assert_dump(entity, self.InvalidRequest)
 
     def test_json_rpc_request_as_positional_arguments(self):
         data = '{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}'
@@ -47,7 +78,7 @@ class TestParserProtocolV2(unittest.TestCase):
         self.assertTrue(entity.params.is_array)
         self.assertEqual(entity.params.data, [42, 23])
         self.assertEqual(entity.id, 1)
-        self.assertEqual(entity.dump(), data)
+        self._assert_dump(entity, data)
 
     def test_json_rpc_request_as_named_arguments(self):
         data = '{"jsonrpc": "2.0", "method": "subtract", "params": {"subtrahend": 23, "minuend": 42}, "id": 3}'
@@ -61,7 +92,7 @@ class TestParserProtocolV2(unittest.TestCase):
         self.assertTrue(entity.params.is_dict)
         self.assertEqual(entity.params.data, {"subtrahend": 23, "minuend": 42})
         self.assertEqual(entity.id, 3)
-        self.assertEqual(entity.dump(), data)
+        self._assert_dump(entity, data)
 
     def test_json_rpc_response(self):
         data = '{"jsonrpc": "2.0", "result": 19, "id": 1}'
@@ -72,7 +103,7 @@ class TestParserProtocolV2(unittest.TestCase):
         self.assertEqual(entity.jsonrpc.value, "2.0")
         self.assertEqual(entity.result, 19)
         self.assertEqual(entity.id, 1)
-        self.assertEqual(entity.dump(), data)
+        self._assert_dump(entity, data)
 
     def test_json_rpc_notification_with_params(self):
         data = '{"jsonrpc": "2.0", "method": "update", "params": [1, 2, 3, 4, 5]}'
@@ -85,7 +116,7 @@ class TestParserProtocolV2(unittest.TestCase):
         self.assertTrue(entity.params.is_array)
         self.assertFalse(entity.params.is_dict)
         self.assertEqual(entity.params.data, [1, 2, 3, 4, 5])
-        self.assertEqual(entity.dump(), data)
+        self._assert_dump(entity, data)
 
     def test_json_rpc_notification_without_params(self):
         data = '{"jsonrpc": "2.0", "method": "foobar"}'
@@ -96,7 +127,7 @@ class TestParserProtocolV2(unittest.TestCase):
         self.assertEqual(entity.jsonrpc.value, "2.0")
         self.assertEqual(entity.method, "foobar")
         self.assertEqual(entity.params, None)
-        self.assertEqual(entity.dump(), data)
+        self._assert_dump(entity, data)
 
     def test_rpc_call_by_invalid_json(self):
         entity = Serializer.parse('{"jsonrpc": "2.0", "method": "foobar, "params": "bar", "baz]')
@@ -109,7 +140,7 @@ class TestParserProtocolV2(unittest.TestCase):
             "message": "Parse error",
         })
         self.assertEqual(entity.id, None)
-        self.assertEqual(entity.dump(), self.ParseError)
+        self._assert_dump(entity, self.ParseError)
 
     def test_rpc_call_by_invalid_request_object(self):
         entity = Serializer.parse('{"jsonrpc": "2.0", "method": 1, "params": "bar"}')
@@ -122,13 +153,13 @@ class TestParserProtocolV2(unittest.TestCase):
             "message": "Invalid Request",
         })
         self.assertEqual(entity.id, None)
-        self.assertEqual(entity.dump(), self.InvalidRequest)
+        self._assert_dump(entity, self.InvalidRequest)
 
     def test_rpc_call_by_empty_array(self):
         entity = Serializer.parse('[]')
         self.assertTrue(type(entity) is Error)
         entity = cast(Error, entity)
-        self.assertEqual(entity.dump(), self.InvalidRequest)
+        self._assert_dump(entity, self.InvalidRequest)
 
     def test_rpc_call_by_invalid_batch(self):
         entity = Serializer.parse('[1]')
@@ -137,7 +168,7 @@ class TestParserProtocolV2(unittest.TestCase):
         for sub_entity in entity.elements:
             self._expect_json_error_in_batch(sub_entity)
         expected_json_dict = [self.InvalidRequest]
-        self.assertEqual(entity.dump(), json.dumps(expected_json_dict))
+        self._assert_batch_dump(entity, expected_json_dict)
 
     def test_rpc_call_by_invalid_multiple_batch(self):
         entity = Serializer.parse('[1,2,3]')
@@ -147,7 +178,20 @@ class TestParserProtocolV2(unittest.TestCase):
             self._expect_json_error_in_batch(sub_entity)
 
         expected_json_dict = [self.InvalidRequest, self.InvalidRequest, self.InvalidRequest]
-        self.assertEqual(entity.dump(), json.dumps(expected_json_dict))
+        self._assert_batch_dump(entity, expected_json_dict)
+
+    def test_rpc_call_by_nested_batch(self):
+        entity = Serializer.parse('[[{"jsonrpc": "2.0", "method": "a"}], []]')
+        self.assertTrue(type(entity) is Batch)
+        entity = cast(Batch, entity)
+        for sub_entity in entity.elements:
+            self._expect_json_error_in_batch(sub_entity)
+        self._assert_batch_dump(entity, [self.InvalidRequest, self.InvalidRequest])
+
+    def test_rpc_call_by_deeply_nested_batch(self):
+        entity = Serializer(backend="json").parse('[' * 600 + ']' * 600)
+        self.assertTrue(type(entity) is Batch)
+        self._assert_batch_dump(entity, [self.InvalidRequest])
 
     def test_rpc_call_as_batch(self):
         entity = Serializer.parse('['
@@ -178,7 +222,7 @@ class TestParserProtocolV2(unittest.TestCase):
             "message": "Method not found",
         })
         self.assertEqual(entity.id, "1")
-        self.assertEqual(entity.dump(), json)
+        self._assert_dump(entity, json)
 
     def test_rpc_error_id_as_number(self):
         data = '{"jsonrpc": "2.0", "error": {"code": -32601, "message": "Method not found"}, "id": 1}'
@@ -192,7 +236,18 @@ class TestParserProtocolV2(unittest.TestCase):
             "message": "Method not found",
         })
         self.assertEqual(entity.id, 1)
-        self.assertEqual(entity.dump(), data)
+        self._assert_dump(entity, data)
+
+    def test_rpc_error_with_non_integer_code(self):
+        # The spec requires an integer code, anything else is not an error
+        # response and is answered as an invalid request with its id.
+        for code in ('"-32601"', '-32601.5', 'true', 'null'):
+            data = '{"jsonrpc": "2.0", "error": {"code": %s, "message": "Method not found"}, "id": 1}' % code
+            entity = Serializer.parse(data)
+            self.assertTrue(type(entity) is Error)
+            entity = cast(Error, entity)
+            self.assertEqual(entity.code, -32600)
+            self.assertEqual(entity.id, 1)
 
     def test_invalid_params_on_json_rpc_request(self):
         data = '{"jsonrpc": "2.0", "method": "subtract", "params": "hello", "id": 1}'
@@ -241,3 +296,141 @@ class TestParserProtocolV2(unittest.TestCase):
             "message": "Invalid Request",
         })
         self.assertEqual(entity.id, None)
+
+    def test_parse_object_from_decoded_json(self):
+        data = {"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}
+        entity = Serializer.parse_object(data)
+        self.assertTrue(type(entity) is Request)
+        entity = cast(Request, entity)
+        self.assertEqual(entity.method, "subtract")
+        self.assertEqual(entity.params.data, [42, 23])
+        self.assertEqual(entity.id, 1)
+        self._assert_dump(entity, json.dumps(data))
+
+    def test_entities_have_no_instance_dict(self):
+        entities = [
+            Serializer.parse('{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}'),
+            Serializer.parse('{"jsonrpc": "2.0", "result": 19, "id": 1}'),
+            Serializer.parse('{"jsonrpc": "2.0", "method": "update", "params": [1, 2, 3, 4, 5]}'),
+            Serializer.parse('{"jsonrpc": "2.0", "error": {"code": -32601, "message": "Method not found"}, "id": 1}'),
+            Serializer.parse('[1]'),
+        ]
+        for entity in entities:
+            self.assertFalse(hasattr(entity, "__dict__"))
+
+    def test_serializer_instance_backend(self):
+        data = '{"jsonrpc": "2.0", "result": 19, "id": 1}'
+        serializer = Serializer(backend="json")
+        entity = serializer.parse(data.encode("utf-8"))
+        self.assertTrue(type(entity) is Response)
+        self.assertEqual(serializer.dump(entity), data)
+        self.assertEqual(serializer.dump_bytes(entity), data.encode("utf-8"))
+
+    def test_lazy_batch_parses_elements_on_iteration(self):
+        data = ('[{"jsonrpc": "2.0", "method": "sum", "params": [1,2,4], "id": "1"},'
+                '{"jsonrpc": "2.0", "method": "notify_hello", "params": [7]},'
+                '1,'
+                '{"jsonrpc": "2.0", "method": "get_data", "id": "9"}]')
+        parsed = []
+
+        class RecordingSerializer(Serializer):
+            def parse_object(self, json_data, protocol_version=ProtocolVersion.v2):
+                parsed.append(json_data)
+                return super().parse_object(json_data, protocol_version)
+
+        entity = RecordingSerializer(lazy_batch=True).parse(data)
+        self.assertTrue(type(entity) is LazyBatch)
+        self.assertEqual(len(entity), 4)
+        self.assertEqual(len(parsed), 1)
+
+        elements = iter(entity)
+        self.assertTrue(type(next(elements)) is Request)
+        self.assertEqual(len(parsed), 2)
+        self.assertEqual([type(element) for element in elements], [Notification, Error, Notification])
+        # The non-object element is rejected without reaching parse_object.
+        self.assertEqual(len(parsed), 4)
+
+    def test_entity_kinds(self):
+        entity = Serializer(lazy_batch=True).parse('[{"jsonrpc": "2.0", "method": "a", "params": [], "id": 1},'
+                                                   '{"jsonrpc": "2.0", "method": "a"},'
+                                                   '{"jsonrpc": "2.0", "result": 1, "id": 1},'
+                                                   '{"jsonrpc": "2.0", "error": {"code": 1, "message": ""}, "id": 1}]')
+        self.assertEqual(entity.kind, "batch")
+        self.assertEqual([element.kind for element in entity], ["request", "notification", "response", "error"])
+
+    def test_lazy_batch_memory(self):
+        # The decoder still builds the whole array up front, only entity
+        # construction is deferred and consumed elements are released.
+        request = b'{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}'
+        data = b"[" + b", ".join([request] * 5000) + b"]"
+        tracemalloc.start()
+
+        try:
+            entity = Serializer(backend="json", lazy_batch=True).parse(data)
+            decoded, _ = tracemalloc.get_traced_memory()
+            consumed = sum(1 for _ in entity)
+            remaining, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual((consumed, len(entity)), (5000, 5000))
+        self.assertGreater(decoded, 2 * len(data))
+        self.assertLess(remaining, len(data) // 10)
+
+    def test_lazy_batch_keeps_empty_array_invalid(self):
+        entity = Serializer(lazy_batch=True).parse('[]')
+        self.assertTrue(type(entity) is Error)
+        self._assert_dump(entity, self.InvalidRequest)
+
+    def test_response_fragments_keep_large_result_separate(self):
+        result = {"values": list(range(5000))}
+        batch = Batch()
+        batch.elements = [Response(ProtocolVersion.v2, 1, 1), Response(ProtocolVersion.v2, result, "2")]
+        encoded_result = JsonBackend.get().dumps_bytes(result)
+
+        fragments = batch.dump_fragments()
+        self.assertEqual(len(fragments), 3)
+        self.assertIs(type(fragments[1]), bytes)
+        self.assertEqual(fragments[1], encoded_result)
+        self.assertEqual(b"".join(fragments), batch.dump_bytes())
+
+    def test_dump_into_memoryview(self):
+        entity = Serializer.parse('{"jsonrpc": "2.0", "result": 19, "id": 1}')
+        expected = entity.dump_bytes()
+        storage = bytearray(len(expected) + 4)
+
+        written = entity.dump_into(memoryview(storage), 4)
+        self.assertEqual(written, len(expected))
+        self.assertEqual(bytes(storage[4:]), expected)
+        self.assertRaises(ValueError, entity.dump_into, memoryview(storage), 5)
+
+    def test_error_templates_match_generic_encoding(self):
+        backend = JsonBackend.get()
+        for code in [-32700, -32600, -32601, -32602, -32603, -32000, -32050, -32099, -32100, 1]:
+            for id in [None, 1, "abc", "ü"]:
+                entity = Error(ProtocolVersion.v2, code, id)
+                self.assertEqual(entity.dump_bytes(), backend.dumps_bytes(entity.to_object()))
+
+    def test_error_templates_are_bounded(self):
+        # Server error codes get a template each, other codes none at all.
+        backend = JsonBackend.get()
+        for code in range(-32099, -31000):
+            Error(ProtocolVersion.v2, code, 1).dump_bytes(backend)
+        codes = {key[2] for key in error_module._TEMPLATES if key[0] == backend.name}
+        self.assertEqual(codes - set(ErrorCode), set(range(-32099, -31999)))
+
+    def test_server_error_messages(self):
+        self.assertEqual(Error(ProtocolVersion.v2, -32000).error["message"], "Server error")
+        self.assertEqual(Error(ProtocolVersion.v2, -32099).error["message"], "Server error")
+        self.assertEqual(Error(ProtocolVersion.v2, -32100).error["message"], "Unknown error message from error code")
+        self.assertEqual(Error(ProtocolVersion.v2, -32602).error["message"], "Invalid params")
+
+
+@unittest.skipUnless(JsonBackend.is_available("orjson"), "orjson is not installed")
+class TestParserProtocolV2Orjson(TestParserProtocolV2):
+    backend = "orjson"
+
+
+@unittest.skipUnless(JsonBackend.is_available("ujson"), "ujson is not installed")
+class TestParserProtocolV2Ujson(TestParserProtocolV2):
+    backend = "ujson"
@@ -0,0 +1,87 @@
+import os
+import tempfile
+
+from jsonrpc_protocol.backend import JsonBackend
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.limits import Limits
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.notification import Notification
+from jsonrpc_protocol.protocol.request import Request
+from jsonrpc_protocol.protocol.response import Response
+from jsonrpc_protocol.replay import LogReplay
+from jsonrpc_protocol.schema import SchemaRegistry
+from jsonrpc_protocol.serializer import Serializer
+
+import unittest
+
+
+class TestLogReplay(unittest.TestCase):
+    Lines = (b'{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}\n'
+             b'{"jsonrpc": "2.0", "method": "update", "params": [1, 2, 3]}\r\n'
+             b'\n'
+             b'{"jsonrpc": "2.0", "result": 19, "id": 1}\n'
+             b'{"jsonrpc": "2.0", "method": "foobar, "params": "bar", "baz]\n'
+             b'   \n'
+             b'[{"jsonrpc": "2.0", "method": "sum", "params": [1, 2], "id": "1"}, {"foo": "boo"}]\n'
+             b'{"jsonrpc": "2.0", "result": "\xc3\xa9", "id": 2}')
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".jsonl")
+
+        with os.fdopen(handle, "wb") as file:
+            file.write(self.Lines)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_entities(self):
+        entities = list(LogReplay(self.path))
+        self.assertEqual([type(entity) for entity in entities], [Request, Notification, Response, Error, Batch, Response])
+        self.assertEqual(entities[3].code, ErrorCode.ParseError)
+        self.assertEqual(entities[5].result, "é")
+        self.assertEqual(len(entities[4]), 2)
+
+    def test_backends(self):
+        expected = [entity.to_object() for entity in LogReplay(self.path, Serializer("json"))]
+
+        for backend in JsonBackend.available(binary=False):
+            replay = LogReplay(self.path, Serializer(backend))
+            self.assertEqual([entity.to_object() for entity in replay], expected)
+
+    def test_ranges(self):
+        replay = LogReplay(self.path)
+        expected = [entity.to_object() for entity in replay]
+
+        for split in range(replay.size + 1):
+            entities = list(replay.entities(0, split)) + list(replay.entities(split))
+            self.assertEqual([entity.to_object() for entity in entities], expected)
+
+    def test_replay(self):
+        result = LogReplay(self.path).replay()
+        self.assertEqual(result.counts, {"request": 1, "notification": 1, "response": 2, "error": 1, "batch": 1})
+        self.assertEqual(result.records, 6)
+        self.assertEqual(result.bytes, len(self.Lines))
+        self.assertGreaterEqual(result.mb_per_second, 0.0)
+
+    def test_replay_processes(self):
+        sequential = LogReplay(self.path).replay()
+        parallel = LogReplay(self.path).replay(processes=3)
+        self.assertEqual(parallel.counts, sequential.counts)
+        self.assertEqual(parallel.records, sequential.records)
+
+        # Workers check the same limits and schemas as the parent.
+        schemas = SchemaRegistry()
+        schemas.register("update", {"type": "array", "maxItems": 2})
+        serializer = Serializer(schemas=schemas, limits=Limits(max_bytes=64))
+        sequential = LogReplay(self.path, serializer).replay()
+        parallel = LogReplay(self.path, serializer).replay(processes=3)
+        self.assertEqual(sequential.counts, {"response": 2, "error": 4})
+        self.assertEqual(parallel.counts, sequential.counts)
+
+    def test_empty(self):
+        with open(self.path, "wb"):
+            pass
+
+        self.assertEqual(list(LogReplay(self.path)), [])
+        self.assertEqual(LogReplay(self.path).replay(processes=2).records, 0)
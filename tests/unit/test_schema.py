@@ -0,0 +1,134 @@
+import pickle
+import typing
+
+from jsonrpc_protocol.dispatcher import Dispatcher
+from jsonrpc_protocol.enum import ErrorCode
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.notification import Notification
+from jsonrpc_protocol.protocol.request import Request
+from jsonrpc_protocol.schema import SchemaRegistry
+from jsonrpc_protocol.serializer import Serializer
+
+import unittest
+
+
+def subtract(minuend: int, subtrahend: int = 0) -> int:
+    return minuend - subtrahend
+
+
+def tag(name: str, *values: typing.Optional[float], **labels) -> None:
+    pass
+
+
+class TestSchemaRegistry(unittest.TestCase):
+    Schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "minLength": 1, "maxLength": 8},
+            "age": {"type": "integer", "minimum": 0, "exclusiveMaximum": 150},
+            "tags": {"type": "array", "items": {"enum": ["a", "b"]}, "maxItems": 2},
+        },
+        "required": ["name"],
+        "additionalProperties": False,
+    }
+
+    def test_compiled_schema(self):
+        validate = SchemaRegistry.compile(self.Schema)
+        self.assertTrue(validate({"name": "me"}))
+        self.assertTrue(validate({"name": "me", "age": 3, "tags": ["a", "b"]}))
+        self.assertFalse(validate({"age": 3}))
+        self.assertFalse(validate({"name": ""}))
+        self.assertFalse(validate({"name": "me", "age": True}))
+        self.assertFalse(validate({"name": "me", "age": 150}))
+        self.assertFalse(validate({"name": "me", "tags": ["c"]}))
+        self.assertFalse(validate({"name": "me", "tags": ["a", "a", "a"]}))
+        self.assertFalse(validate({"name": "me", "other": 1}))
+        self.assertFalse(validate(["me"]))
+
+    def test_booleans_are_not_numbers(self):
+        cases = [
+            ({"const": 1}, [1, 1.0], [True, "1"]),
+            ({"const": True}, [True], [1, 1.0]),
+            ({"enum": [0, "a"]}, [0, "a"], [False]),
+            ({"enum": [False]}, [False], [0, 0.0]),
+            ({"const": [1, {"a": 0}]}, [[1, {"a": 0}]], [[True, {"a": 0}], [1, {"a": False}], [1]]),
+        ]
+
+        for schema, accepted, rejected in cases:
+            validate = SchemaRegistry.compile(schema)
+            for value in accepted:
+                self.assertTrue(validate(value), (schema, value))
+            for value in rejected:
+                self.assertFalse(validate(value), (schema, value))
+
+    def test_unsupported_keyword_is_rejected(self):
+        self.assertRaises(ValueError, SchemaRegistry.compile, {"patternProperties": {}})
+
+    def test_compiled_hints(self):
+        validate = SchemaRegistry.compile_hints(subtract)
+        self.assertTrue(validate([42, 23]))
+        self.assertTrue(validate([42]))
+        self.assertTrue(validate({"minuend": 42, "subtrahend": 23}))
+        self.assertFalse(validate([42, "23"]))
+        self.assertFalse(validate([1, 2, 3]))
+        self.assertFalse(validate({"subtrahend": 23}))
+        self.assertFalse(validate({"minuend": 42, "other": 23}))
+        self.assertFalse(validate(None))
+
+        validate = SchemaRegistry.compile_hints(tag)
+        self.assertTrue(validate(["x", 1.5, None, 2]))
+        self.assertTrue(validate({"name": "x", "anything": []}))
+        self.assertFalse(validate(["x", "y"]))
+
+    def test_serializer_returns_invalid_params(self):
+        schemas = SchemaRegistry()
+        schemas.register_hints("subtract", subtract)
+        schemas.register("update", {"type": "array", "items": {"type": "integer"}})
+        serializer = Serializer(schemas=schemas)
+
+        entity = serializer.parse('{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": 1}')
+        self.assertTrue(type(entity) is Request)
+
+        entity = serializer.parse('{"jsonrpc": "2.0", "method": "subtract", "params": [42, "x"], "id": 1}')
+        self.assertTrue(type(entity) is Error)
+        self.assertEqual(entity.code, ErrorCode.InvalidParams)
+        self.assertEqual(entity.id, 1)
+
+        entity = serializer.parse('{"jsonrpc": "2.0", "method": "update", "params": [1, 2]}')
+        self.assertTrue(type(entity) is Notification)
+
+        entity = serializer.parse('[{"jsonrpc": "2.0", "method": "update", "params": [1, 2.5]},'
+                                  '{"jsonrpc": "2.0", "method": "unknown", "params": ["free"], "id": 2}]')
+        self.assertEqual([type(element) for element in entity], [Error, Request])
+        self.assertEqual(entity.elements[0].code, ErrorCode.InvalidParams)
+
+    def test_pickled_registry_compiles_again(self):
+        schemas = SchemaRegistry()
+        schemas.register_hints("subtract", subtract)
+        schemas.register("update", {"type": "array", "items": {"type": "integer"}})
+        schemas = pickle.loads(pickle.dumps(schemas))
+
+        self.assertEqual(sorted(method for method in ("subtract", "update", "other") if method in schemas),
+                         ["subtract", "update"])
+        self.assertTrue(schemas.get("subtract")([42, 23]))
+        self.assertFalse(schemas.get("subtract")([42, "x"]))
+        self.assertTrue(schemas.get("update")(None))
+        self.assertFalse(schemas.get("update")([1, 2.5]))
+
+    def test_rejected_notification_is_not_answered(self):
+        schemas = SchemaRegistry()
+        schemas.register("update", {"type": "array", "items": {"type": "integer"}})
+        serializer = Serializer(schemas=schemas)
+        dispatcher = Dispatcher()
+        updates = []
+        dispatcher.register(lambda *values: updates.append(values), name="update")
+
+        entity = serializer.parse('{"jsonrpc": "2.0", "method": "update", "params": [1, 2.5]}')
+        self.assertTrue(type(entity) is Error)
+        self.assertIsNone(dispatcher.dispatch(entity))
+
+        entity = serializer.parse('[{"jsonrpc": "2.0", "method": "update", "params": [1, 2.5]},'
+                                  '{"jsonrpc": "2.0", "method": "update", "params": ["x"], "id": 1}]')
+        response = dispatcher.dispatch(entity)
+        self.assertEqual([(element.code, element.id) for element in response], [(ErrorCode.InvalidParams, 1)])
+        self.assertEqual(updates, [])
@@ -0,0 +1,93 @@
+import json
+import random
+
+from jsonrpc_protocol.protocol.request import Request
+from jsonrpc_protocol.protocol.response import Response
+from jsonrpc_protocol.protocol.notification import Notification
+from jsonrpc_protocol.protocol.error import Error
+from jsonrpc_protocol.protocol.batch import Batch
+from jsonrpc_protocol.stream import StreamParser
+
+import unittest
+
+
+class TestStreamParser(unittest.TestCase):
+
+    @staticmethod
+    def _capture(size: int) -> (list, list):
+        rnd = random.Random(7)
+        messages = []
+        expected = []
+        length = 0
+
+        while length < size:
+            kind = rnd.randrange(4)
+            if kind == 0:
+                message = {"jsonrpc": "2.0", "method": "echo", "params": ["a \"quoted\" {string}", "\\", rnd.random()],
+                           "id": len(messages)}
+                expected.append(Request)
+            elif kind == 1:
+                message = {"jsonrpc": "2.0", "result": {"values": list(range(rnd.randrange(100))), "text": "]}"},
+                           "id": len(messages)}
+                expected.append(Response)
+            elif kind == 2:
+                message = {"jsonrpc": "2.0", "method": "tick", "params": {"nested": [[{}], []]}}
+                expected.append(Notification)
+            else:
+                message = [{"jsonrpc": "2.0", "method": "tick"}, {"jsonrpc": "2.0", "result": "é", "id": 1}]
+                expected.append(Batch)
+
+            encoded = json.dumps(message, ensure_ascii=rnd.random() < 0.5).encode("utf-8")
+            messages.append(encoded)
+            length += len(encoded)
+
+        return messages, expected
+
+    def _stream(self, parser: StreamParser, data: bytes) -> list:
+        rnd = random.Random(42)
+        entities = []
+        position = 0
+
+        while position < len(data):
+            size = rnd.randint(1, 64)
+            entities.extend(parser.feed(data[position:position + size]))
+            position += size
+
+        entities.extend(parser.close())
+        return entities
+
+    def test_newline_delimited_capture_in_random_chunks(self):
+        messages, expected = self._capture(2 * 1024 * 1024)
+        data = b"\n".join(messages) + b"\n"
+        entities = self._stream(StreamParser(newline_delimited=True), data)
+        self.assertEqual([type(entity) for entity in entities], expected)
+
+    def test_concatenated_capture_in_random_chunks(self):
+        messages, expected = self._capture(2 * 1024 * 1024)
+        entities = self._stream(StreamParser(), b"".join(messages))
+        self.assertEqual([type(entity) for entity in entities], expected)
+        self.assertEqual([entity.id for entity in entities if type(entity) in (Request, Response)],
+                         [index for index, kind in enumerate(expected) if kind in (Request, Response)])
+
+    def test_concatenated_accepts_newline_delimited_input(self):
+        parser = StreamParser()
+        entities = parser.feed(b'{"jsonrpc": "2.0", "result": 1, "id": 1}\n{"jsonrpc": "2.0", "res')
+        self.assertEqual(len(entities), 1)
+        self.assertTrue(parser.buffered > 0)
+        entities = parser.feed(b'ult": 2, "id": 2}\n')
+        self.assertEqual(entities[0].result, 2)
+        self.assertEqual(parser.buffered, 0)
+
+    def test_garbage_becomes_parse_error(self):
+        parser = StreamParser()
+        entities = parser.feed(b'foo {"jsonrpc": "2.0", "method": "tick"} 5 ')
+        self.assertEqual([type(entity) for entity in entities], [Error, Notification, Error])
+        self.assertEqual(entities[0].code, -32700)
+        self.assertEqual(entities[2].code, -32600)
+
+    def test_truncated_message_is_reported_on_close(self):
+        parser = StreamParser(newline_delimited=True)
+        self.assertEqual(parser.feed(b'{"jsonrpc": "2.0", "method"'), [])
+        entities = parser.close()
+        self.assertEqual(len(entities), 1)
+        self.assertEqual(entities[0].code, -32700)